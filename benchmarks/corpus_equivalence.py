@@ -0,0 +1,95 @@
+"""Check that a normalized :class:`PaperCorpus` answers like the concatenated frame it came from.
+
+Builds a synthetic paper frame, blanks the id of a few rows (among them the
+last one, where a missing id used to be joined onto the last paper) and
+compares, on the normalized corpus and on a plain :class:`Corpus` over the
+same frame without those rows:
+
+* ``take`` of random rows, every column;
+* ``rows_where`` on label columns, paper columns and both;
+* ``distinct_rows`` on ``id`` and on ``(id, Human_Readable_Topic)``.
+
+Exits with status 1 on the first mismatch.
+
+Usage:
+    python benchmarks/corpus_equivalence.py --rows 40000
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+from llm_trends import corpus, schema  # noqa: E402
+
+
+def frames(n_rows, missing_ids, seed=0):
+    """``(frame, reference)``: a typed paper frame with some ids missing, and the frame without those rows."""
+    frame = synthetic.papers(n_rows, seed=seed).drop(columns="2d_coords")
+    frame = frame.astype({column: kind for column, kind in schema.PAPERS.items() if column in frame.columns})
+    rng = np.random.default_rng(seed)
+    blank = np.append(rng.choice(len(frame) - 1, missing_ids, replace=False), len(frame) - 1)
+    frame.loc[blank, "id"] = None
+    reference = corpus._add_dates(frame[frame["id"].notna()].reset_index(drop=True), "update_date")
+    return frame, reference
+
+
+def check(normalized, plain, seed=0):
+    """Names of the queries whose answers differ between the two corpora."""
+    rng = np.random.default_rng(seed)
+    failed = []
+    if len(normalized) != len(plain):
+        return [f"row count: {len(normalized)} != {len(plain)}"]
+
+    rows = np.sort(rng.choice(len(plain), min(len(plain), 5000), replace=False))
+    columns = list(normalized.columns)
+    left = normalized.take(rows, columns).reset_index(drop=True).astype(object)
+    right = plain.take(rows, columns).reset_index(drop=True).astype(object)
+    if not left.equals(right):
+        failed.append("take")
+
+    topics = plain.unique("Human_Readable_Topic")[:5]
+    ids = plain.values("id", rows[:50]).tolist()
+    queries = {
+        "rows_where(topic)": {"Human_Readable_Topic": topics},
+        "rows_where(id)": {"id": ids},
+        "rows_where(category, submitter)": {
+            "Categories": plain.unique("Categories")[:2], "submitter": plain.unique("submitter")[:200],
+        },
+    }
+    for name, conditions in queries.items():
+        if not np.array_equal(normalized.rows_where(**conditions), plain.rows_where(**conditions)):
+            failed.append(name)
+
+    selected = plain.rows_where(Human_Readable_Topic=topics)
+    for subset in ["id", ["id", "Human_Readable_Topic"]]:
+        for restrict in [None, selected]:
+            if not np.array_equal(normalized.distinct_rows(subset, restrict), plain.distinct_rows(subset, restrict)):
+                failed.append(f"distinct_rows({subset}, {'selection' if restrict is not None else 'all'})")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare a normalized paper corpus with its concatenated frame.")
+    parser.add_argument("--rows", type=int, default=40000)
+    parser.add_argument("--missing-ids", type=int, default=20, help="rows whose id is blanked, besides the last one")
+    args = parser.parse_args(argv)
+
+    frame, reference = frames(args.rows, args.missing_ids)
+    normalized = corpus.normalize(frame)
+    plain = corpus.Corpus(reference)
+    failed = check(normalized, plain)
+    print(f"{len(frame)} rows, {len(frame) - len(reference)} without id, {len(normalized.papers)} papers")
+    for name in failed:
+        print(f"MISMATCH  {name}")
+    if failed:
+        sys.exit(1)
+    print("take, rows_where and distinct_rows match the concatenated frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Throughput and latency of concurrent encodes: per-request vs. micro-batched.
+
+Simulates ``N`` sessions that each repeatedly encode a small batch of topic
+strings (as Topic Discovery does), all at the same time:
+
+* ``direct``: every session calls ``model.encode`` on its own batch, as before.
+* ``batched``: sessions go through one :class:`llm_trends.encoder.BatchingEncoder`.
+
+Reports requests per second and the p50/p99 latency of a request. Uses the
+real sentence-transformer model when it is installed; ``--simulated`` replaces
+it with a stand-in whose encode costs a fixed per-call overhead plus a
+per-text cost on one shared compute resource, for machines without torch.
+
+Usage:
+    python benchmarks/encoder_batching.py --sessions 1 8 32 --requests 20
+    python benchmarks/encoder_batching.py --simulated
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import WORDS  # noqa: E402
+from llm_trends.encoder import BatchingEncoder  # noqa: E402
+from llm_trends.topic_assignment import load_model  # noqa: E402
+
+
+class SimulatedModel:
+    """Stand-in encoder: ``call_ms`` per call plus ``text_ms`` per text, one call at a time."""
+
+    def __init__(self, call_ms=8.0, text_ms=0.4, dim=384):
+        self.call_ms, self.text_ms, self.dim = call_ms, text_ms, dim
+        self._device = threading.Lock()
+
+    def encode(self, texts, **kwargs):
+        with self._device:
+            time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000)
+        return np.zeros((len(texts), self.dim), dtype=np.float32)
+
+
+def run(encoder, n_sessions, n_requests, topics_per_request, seed=0):
+    """Return ``(requests_per_second, latencies_ms)`` of ``n_sessions`` threads encoding concurrently."""
+    rng = np.random.default_rng(seed)
+    payloads = [
+        [" ".join(rng.choice(WORDS, size=3)) for _ in range(topics_per_request)] for _ in range(n_sessions * n_requests)
+    ]
+    latencies = [[] for _ in range(n_sessions)]
+    start_line = threading.Barrier(n_sessions + 1)
+
+    def session(i):
+        start_line.wait()
+        for payload in payloads[i * n_requests:(i + 1) * n_requests]:
+            started = time.perf_counter()
+            encoder.encode(payload, convert_to_numpy=True)
+            latencies[i].append((time.perf_counter() - started) * 1000)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(n_sessions)]
+    for thread in threads:
+        thread.start()
+    start_line.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return n_sessions * n_requests / elapsed, np.concatenate(latencies)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=20, help="encode requests per session")
+    parser.add_argument("--topics", type=int, default=10, help="texts per request")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--simulated", action="store_true", help="use a stand-in model instead of sentence-transformers")
+    args = parser.parse_args(argv)
+
+    model = SimulatedModel() if args.simulated else load_model()
+    batched = BatchingEncoder(model, max_wait=args.max_wait_ms / 1000)
+    # Warm up both paths so model loading and first-call costs are not measured
+    model.encode(["warm up"])
+    batched.encode(["warm up"])
+
+    print(f"{'sessions':>8}  {'mode':>8}  {'req/s':>8}  {'p50 ms':>8}  {'p99 ms':>8}")
+    for n in args.sessions:
+        for name, encoder in [("direct", model), ("batched", batched)]:
+            throughput, latencies = run(encoder, n, args.requests, args.topics)
+            p50, p99 = np.percentile(latencies, [50, 99])
+            print(f"{n:>8}  {name:>8}  {throughput:>8.1f}  {p50:>8.1f}  {p99:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Latency of the sidebar filters: full-column scans vs. the posting-list index.
+
+For each corpus size, times the selections Topic Tracking, Topic Overview and
+Topic Discovery make (one or two categories, a few subdomains within them, the
+five topics matched by Topic Discovery) with an ``isin`` scan over every row
+and with :meth:`llm_trends.corpus.Corpus.rows_where`, which resolves them by
+union and intersection of posting lists.
+
+Usage:
+    python benchmarks/filter_latency.py --rows 40000 400000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+from llm_trends.corpus import load_domains  # noqa: E402
+
+
+def scan(frame, **conditions):
+    mask = np.ones(len(frame), dtype=bool)
+    for column, wanted in conditions.items():
+        mask &= frame[column].isin(wanted).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def selections(corpus):
+    categories = corpus.unique("Categories")
+    subdomains = corpus.hierarchy().children("Subdomain", Categories=categories[:1])
+    topics = corpus.unique("Human_Readable_Topic")
+    return {
+        "1 category": dict(Categories=categories[:1]),
+        "2 categories": dict(Categories=categories[:2]),
+        "category + 3 subdomains": dict(Categories=categories[:1], Subdomain=subdomains[:3]),
+        "5 topics": dict(Human_Readable_Topic=topics[-5:]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[40000, 400000])
+    args = parser.parse_args(argv)
+
+    for n_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "domains.csv")
+            synthetic.papers(n_rows).drop(columns="2d_coords").to_csv(path, index=False)
+            corpus = load_domains(path)
+        labels = corpus.take(columns=["Categories", "Subdomain", "Human_Readable_Topic"])
+        # Build the indexes up front: they are shared by every session afterwards
+        corpus.hierarchy()
+
+        print(f"\n{n_rows} rows")
+        print(f"  {'selection':26} {'matches':>8} {'scan (ms)':>10} {'index (ms)':>11}")
+        for name, conditions in selections(corpus).items():
+            rows = corpus.rows_where(**conditions)
+            assert np.array_equal(rows, scan(labels, **conditions))
+            scanned = min(timeit.repeat(lambda: scan(labels, **conditions), number=10, repeat=5)) / 10 * 1000
+            indexed = min(timeit.repeat(lambda: corpus.rows_where(**conditions), number=10, repeat=5)) / 10 * 1000
+            print(f"  {name:26} {len(rows):>8} {scanned:>10.2f} {indexed:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Import-time budget check for the app shell and each section module.
+
+Runs ``python -X importtime`` in a fresh interpreter for every entry point and
+fails (exit code 1) when an entry point exceeds its time budget or imports a
+module that only other sections are supposed to pay for.
+
+Usage:
+    python benchmarks/import_budget.py
+    python benchmarks/import_budget.py --scale 2  # looser budgets on slow machines
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that take seconds to import; sections that don't need them must not load them
+HEAVY_MODULES = ["torch", "sentence_transformers", "sklearn", "datamapplot", "matplotlib", "together", "PyPDF2", "apscheduler"]
+
+# Modules streamlit_app.py imports at the top, before any section is shown
+APP_SHELL = "streamlit, streamlit.components.v1, sections, sections.data, llm_trends.tracing"
+
+# Entry point -> (budget in milliseconds, modules it must not import)
+BUDGETS = {
+    APP_SHELL: (1500, HEAVY_MODULES),
+    "sections.research_overview": (2500, HEAVY_MODULES),
+    "sections.entity_tracking": (2500, HEAVY_MODULES),
+    "sections.topic_overview": (3000, HEAVY_MODULES),
+    "sections.emerging_topics": (2500, HEAVY_MODULES),
+    "sections.topic_tracking": (3000, HEAVY_MODULES),
+    "sections.author_tracking": (2500, HEAVY_MODULES),
+    "sections.subscribe": (3000, ["torch", "sentence_transformers", "sklearn", "datamapplot", "matplotlib", "together", "PyPDF2"]),
+}
+
+
+def measure(statement):
+    """Return ``(total_ms, imported_modules)`` for ``import <statement>`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {statement}"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {statement} failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        modules.add(name.strip())
+    return total_us / 1000, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    args = parser.parse_args(argv)
+
+    failures = []
+    width = max(len(statement) for statement in BUDGETS)
+    for statement, (budget_ms, forbidden) in BUDGETS.items():
+        total_ms, modules = measure(statement)
+        budget_ms *= args.scale
+        leaked = sorted(name for name in forbidden if name in modules)
+        status = "ok" if total_ms <= budget_ms and not leaked else "FAIL"
+        print(f"{status:4}  {statement:{width}} {total_ms:8.0f} ms  (budget {budget_ms:.0f} ms)")
+        if total_ms > budget_ms:
+            failures.append(f"{statement} took {total_ms:.0f} ms, over its {budget_ms:.0f} ms budget")
+        if leaked:
+            failures.append(f"{statement} imports {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"  - {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""Concurrent-session load test of the whole app, driven headlessly by Streamlit's ``AppTest``.
+
+Runs ``--sessions`` simulated users at once on threads of one process, as one
+Streamlit replica serves them. Each session opens ``streamlit_app.py``, goes
+to its section (sessions are spread over ``--sections`` in turn) and follows
+a scripted journey there: ticking categories, picking topics, switching plot
+types, moving sliders, submitting forms. Every rerun is timed.
+
+External services are stubbed: the Together client answers after
+``--llm-latency`` seconds with a fixed topic list, and ``smtplib.SMTP`` is
+replaced by an in-memory server that only counts the messages it is given.
+Where sentence-transformers is not installed, a stand-in encoder is used
+(see ``benchmarks/suite.py``).
+
+The data is a synthetic ``data/`` directory of ``--rows`` rows (or an existing
+one with ``--data-dir``). One session first visits every section so corpora,
+indexes and caches are loaded; the time this takes is reported as the cold
+start. Reported per section: p50/p95/p99 rerun latency, and for the whole run
+the peak RSS and the peak number of threads.
+
+Usage:
+    python benchmarks/load_test.py --rows 40000 --sessions 50
+    python benchmarks/load_test.py --sessions 8 --sections "Topic Tracking" "Paper Tracking" --iterations 3
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import random
+import resource
+import smtplib
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from benchmarks.suite import load_encoder  # noqa: E402
+
+APP = os.path.join(REPO, "streamlit_app.py")
+LLM_ANSWER = "Topics: retrieval augmented generation, instruction tuning, model evaluation, prompt engineering"
+
+
+# Stubbed external services
+
+class StubLLM:
+    """Stands in for ``together.Client``: streams a fixed answer after ``latency`` seconds."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        for word in LLM_ANSWER.split(" "):
+            yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=word + " "))])
+
+
+class StubSMTP:
+    """Stands in for ``smtplib.SMTP``: accepts every message and keeps only a count."""
+
+    sent = 0
+    lock = threading.Lock()
+
+    def __init__(self, host="", port=0, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def starttls(self, *args, **kwargs):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg, *args, **kwargs):
+        with StubSMTP.lock:
+            StubSMTP.sent += 1
+
+    def quit(self):
+        pass
+
+
+def install_stubs(llm_latency):
+    """Patch the LLM client, SMTP and (without torch) the encoder; return ``(llm, encoder name)``."""
+    import sections.data
+    import sections.topic_discovery
+
+    llm = StubLLM(llm_latency)
+    sections.topic_discovery.get_client = lambda: llm
+    smtplib.SMTP = StubSMTP
+    encoder, encoder_name = load_encoder()
+    sections.data.load_model = lambda: encoder
+    return llm, encoder_name
+
+
+# Scripted journeys: generators yielding the widget (with its new value) whose rerun is timed next
+
+def topic_tracking(at, rng):
+    categories = [box.key for box in at.checkbox]
+    yield at.checkbox(key=rng.choice(categories)).check()
+    subdomains = [box.key for box in at.checkbox if box.key not in categories]
+    yield at.checkbox(key=rng.choice(subdomains)).check()
+    topics = at.multiselect[0]
+    yield topics.set_value(rng.sample(list(topics.options), min(3, len(topics.options))))
+    for plot_type in ["Cumulative Trend", "Heatmap Trend", "Monthly Trend"]:
+        yield at.selectbox[0].set_value(plot_type)
+
+
+def topic_overview(at, rng):
+    domain = at.main.radio[0]
+    yield domain.set_value(rng.choice(domain.options))
+    yield at.selectbox[0].set_value(rng.choice(at.selectbox[0].options[1:]))
+    yield at.selectbox[1].set_value(rng.choice(at.selectbox[1].options[1:]))
+
+
+def emerging_topics(at, rng):
+    yield at.main.radio[0].set_value("Entities")
+    yield at.main.radio[1].set_value("Weekly")
+    yield at.selectbox[0].set_value(rng.choice(at.selectbox[0].options))
+    yield at.slider[0].set_value(rng.randint(1, 12))
+
+
+def research_overview(at, rng):
+    start, end = at.slider[0].value
+    yield at.slider[0].set_value((start + (end - start) * rng.random() / 2, end))
+    resolutions = at.selectbox[0]
+    yield resolutions.set_value(resolutions.options[-1])
+
+
+def entity_tracking(at, rng):
+    entities = at.multiselect[0]
+    yield entities.set_value(rng.sample(list(entities.options), 3))
+    start, end = at.slider[0].value
+    yield at.slider[0].set_value((start + (end - start) / 4, end))
+
+
+def topic_discovery(at, rng):
+    yield at.main.radio[0].set_value("Fill out Form")
+    at.text_input[0].set_value(f"A study of retrieval for language models {rng.random()}")
+    at.text_area[0].set_value("We study how retrieval changes the reasoning of language models on benchmarks.")
+    yield at.button[0].click()
+    topics = at.selectbox[0]
+    yield topics.set_value(rng.choice(topics.options[1:]))
+
+
+def paper_tracking(at, rng):
+    titles = at.selectbox[0]
+    for _ in range(3):
+        yield titles.set_value(rng.choice(titles.options[:200]))
+
+
+def author_tracking(at, rng):
+    yield at.text_input[0].set_value(f"Author {rng.randint(1, 9)}")
+    submitters = at.selectbox[0]
+    yield submitters.set_value(rng.choice(submitters.options))
+    topics = at.selectbox[1]
+    yield topics.set_value(rng.choice(topics.options[:20]))
+    months = at.selectbox[2]
+    yield months.set_value(rng.choice(months.options[1:]))
+
+
+def subscribe(at, rng):
+    at.text_input[0].set_value("Load Test")
+    at.text_input[1].set_value(f"load-test-{rng.getrandbits(32):x}@example.com")
+    yield at.button[0].click()
+
+
+JOURNEYS = {
+    "Topic Tracking": topic_tracking,
+    "Topic Overview": topic_overview,
+    "Emerging Topics": emerging_topics,
+    "LLM-related Research Overview": research_overview,
+    "Entity Tracking": entity_tracking,
+    "Topic Discovery": topic_discovery,
+    "Paper Tracking": paper_tracking,
+    "Author Tracking": author_tracking,
+    "Subscribe": subscribe,
+}
+
+
+# Sessions
+
+@contextlib.contextmanager
+def concurrent_app_tests():
+    """Let ``AppTest`` runs overlap on several threads.
+
+    Every ``AppTest.run`` installs process-wide state (a mocked Streamlit
+    runtime and the ``global.appTest`` config option) and removes it when it
+    finishes, which would pull it from under the runs still in progress on
+    other threads. This keeps both in place for the whole ``with`` block.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.testing.v1.util import patch_config_options
+
+    latest = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest["runtime"] = cls._instance
+        if "runtime" not in latest:
+            raise RuntimeError("Runtime hasn't been created!")
+        return cls._instance or latest["runtime"]
+
+    def exists(cls):
+        return cls._instance is not None or "runtime" in latest
+
+    with patch_config_options({"global.appTest": True}), \
+            mock.patch.object(Runtime, "instance", classmethod(instance)), \
+            mock.patch.object(Runtime, "exists", classmethod(exists)):
+        yield
+
+
+def _timed_run(widget_or_app, timeout):
+    started = time.perf_counter()
+    at = widget_or_app.run(timeout=timeout)
+    seconds = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at, seconds
+
+
+def session(section, iterations, seed, timeout, start=None):
+    """Run one user's journey ``iterations`` times; return ``[(section, seconds)]`` of every rerun."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    if start is not None:
+        start.wait()
+    at, seconds = _timed_run(AppTest.from_file(APP, default_timeout=timeout), timeout)
+    timings = [("(app start)", seconds)]
+    for _ in range(iterations):
+        at, seconds = _timed_run(at.sidebar.radio[0].set_value(section), timeout)
+        timings.append((section, seconds))
+        for widget in JOURNEYS[section](at, rng):
+            at, seconds = _timed_run(widget, timeout)
+            timings.append((section, seconds))
+    return timings
+
+
+class Sampler:
+    """Peak thread count of the process, sampled every ``interval`` seconds on a background thread."""
+
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak_threads = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="load-test-sampler", daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_threads = max(self.peak_threads, thread_count())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def thread_count():
+    # Native threads too (BLAS, torch, Arrow pools) where /proc is available
+    if os.path.isdir("/proc/self/task"):
+        return len(os.listdir("/proc/self/task"))
+    return threading.active_count()
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def percentiles(seconds):
+    return {f"p{q}": float(np.percentile(seconds, q)) * 1000 for q in (50, 95, 99)}
+
+
+def load_test(sections, n_sessions, iterations, timeout, seed=0):
+    # One session through every section first: loads the corpora, the encoder and the section modules
+    started = time.perf_counter()
+    warm_up = {}
+    for section in sections:
+        for name, seconds in session(section, 1, seed, timeout):
+            warm_up.setdefault(name, []).append(seconds)
+    cold_start = time.perf_counter() - started
+    rss_warm = peak_rss_mb()
+
+    assigned = [sections[i % len(sections)] for i in range(n_sessions)]
+    start = threading.Barrier(n_sessions)
+    with concurrent_app_tests(), Sampler() as sampler, \
+            ThreadPoolExecutor(n_sessions, thread_name_prefix="session") as pool:
+        started = time.perf_counter()
+        futures = [
+            pool.submit(session, section, iterations, seed + 1 + i, timeout, start) for i, section in enumerate(assigned)
+        ]
+        timings = {}
+        failures = []
+        for future in futures:
+            try:
+                for name, seconds in future.result():
+                    timings.setdefault(name, []).append(seconds)
+            except Exception as e:
+                failures.append(e)
+        wall = time.perf_counter() - started
+    return {
+        "cold_start": cold_start,
+        "wall": wall,
+        "timings": timings,
+        "failures": failures,
+        "rss_warm": rss_warm,
+        "rss_peak": peak_rss_mb(),
+        "peak_threads": sampler.peak_threads,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=40000, help="size of the synthetic dataset")
+    parser.add_argument("--data-dir", help="run against this directory (containing data/) instead")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--sections", nargs="+", choices=list(JOURNEYS), default=list(JOURNEYS))
+    parser.add_argument("--iterations", type=int, default=1, help="journeys per session")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="seconds the stubbed LLM takes to answer")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds before a rerun counts as failed")
+    args = parser.parse_args(argv)
+
+    # Streamlit warns about the missing server context on every rerun of a headless session
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.data_dir:
+            os.chdir(args.data_dir)
+        else:
+            # Generated in a subprocess, so its memory does not count in this process's peak RSS
+            subprocess.run(
+                [sys.executable, os.path.join(REPO, "benchmarks", "synthetic.py"), "--rows", str(args.rows), "--output", tmp],
+                check=True, stdout=subprocess.DEVNULL,
+            )
+            os.chdir(tmp)
+        llm, encoder_name = install_stubs(args.llm_latency)
+        report = load_test(args.sections, args.sessions, args.iterations, args.timeout)
+
+    print(f"{args.sessions} sessions x {args.iterations} journey(s), {encoder_name} encoder, "
+          f"stubbed LLM ({llm.calls} calls) and SMTP ({StubSMTP.sent} messages)")
+    print(f"cold start (one session through every section): {report['cold_start']:.1f}s")
+    print(f"{'section':30} {'reruns':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name in ["(app start)"] + args.sections:
+        seconds = report["timings"].get(name)
+        if seconds:
+            p = percentiles(seconds)
+            print(f"{name:30} {len(seconds):>6} {p['p50']:>9.0f} {p['p95']:>9.0f} {p['p99']:>9.0f}")
+    reruns = sum(len(seconds) for seconds in report["timings"].values())
+    print(f"{reruns} reruns in {report['wall']:.1f}s ({reruns / report['wall']:.1f}/s)")
+    print(f"peak RSS: {report['rss_warm']:.0f} MB after warm-up, {report['rss_peak']:.0f} MB under load; "
+          f"peak threads: {report['peak_threads']}")
+    for failure in report["failures"]:
+        print(f"failed session: {type(failure).__name__}: {failure}")
+    if report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Memory, recall and latency of quantized embedding search.
+
+For each corpus size, generates clustered unit-length embeddings and compares
+exact float32 search with :class:`llm_trends.quantization.QuantizedIndex` in
+``int8`` and ``binary`` mode at several oversampling factors. Reports the
+in-memory size of the codes, recall@k against the exact neighbours and the
+mean latency of a query.
+
+Usage:
+    python benchmarks/quantized_recall.py --rows 100000 --k 10 --oversample 1 4 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+from llm_trends.quantization import MODES, QuantizedIndex, exact_search, recall_at_k  # noqa: E402
+
+
+def per_query_ms(fn, n_queries):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000 / n_queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 4, 10])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>9}  {'mode':>7}  {'oversample':>10}  {'MB':>8}  {'recall@' + str(args.k):>9}  {'ms/query':>8}")
+    for n_rows in args.rows:
+        vectors = synthetic.paper_embeddings(n_rows)
+        # Queries are perturbed corpus points, like a new paper close to existing ones
+        rng = np.random.default_rng(1)
+        queries = vectors[rng.choice(n_rows, size=args.queries, replace=False)]
+        queries = queries + rng.normal(scale=0.02, size=queries.shape).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        exact_ms = per_query_ms(lambda: exact_search(vectors, queries, args.k), len(queries))
+        print(f"{n_rows:>9}  {'float32':>7}  {'-':>10}  {vectors.nbytes / 2**20:>8.1f}  {1.0:>9.3f}  {exact_ms:>8.2f}")
+        for mode in MODES:
+            index = QuantizedIndex.build(vectors, mode)
+            for oversample in args.oversample:
+                recall = recall_at_k(index, queries, args.k, oversample)
+                ms = per_query_ms(lambda: index.search(queries, args.k, oversample), len(queries))
+                print(f"{n_rows:>9}  {mode:>7}  {oversample:>10}  {index.code_bytes / 2**20:>8.1f}  {recall:>9.3f}  {ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Memory and filter latency of the tables with and without the compact schema.
+
+Each table is loaded in a fresh interpreter, once with plain ``pd.read_csv``
+(object strings) and once through ``llm_trends.schema`` (categoricals and
+Arrow strings), and the script reports the RSS growth of the load, the deep
+memory usage of the frame and the time of the typical filters and groupbys.
+Paper tables also report the memory of the normalized papers + assignments
+tables of :class:`llm_trends.corpus.PaperCorpus`.
+
+Usage:
+    python benchmarks/schema_footprint.py --rows 40000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks import synthetic  # noqa: E402
+
+_MEASURE = r"""
+import json, sys, timeit
+import pandas as pd
+from llm_trends import schema
+from llm_trends.corpus import Corpus, normalize
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+path, table, mode = sys.argv[1:4]
+columns = {"papers": schema.PAPERS, "entities": schema.ENTITIES}[table]
+# Warm up the reader so lazily loaded libraries don't count towards the table
+pd.read_csv(path, nrows=1000) if mode == "plain" else schema.read_csv(path, columns, nrows=1000)
+before = rss()
+df = pd.read_csv(path) if mode == "plain" else schema.read_csv(path, columns)
+after = rss()
+corpus = Corpus(df)
+
+if table == "papers":
+    categories = df["Categories"].drop_duplicates().tolist()[:2]
+    subdomains = df["Subdomain"].drop_duplicates().tolist()[:3]
+    filters = {
+        "filter Categories+Subdomain": lambda: corpus.rows_where(Categories=categories, Subdomain=subdomains),
+        "groupby topic size": lambda: df.groupby("Human_Readable_Topic", observed=True).size(),
+    }
+else:
+    entities = df["Entity"].value_counts().head(5).index.tolist()
+    filters = {
+        "filter Entity": lambda: corpus.rows_where(Entity=entities),
+        "groupby Entity size": lambda: df.groupby("Entity", observed=True).size(),
+    }
+normalized_mb = None
+if table == "papers":
+    normalized = normalize(df.copy())
+    normalized_mb = sum(frame.memory_usage(deep=True).sum() for frame in (normalized.papers, normalized._frame)) / 2**20
+timings = {name: min(timeit.repeat(fn, number=5, repeat=5)) / 5 * 1000 for name, fn in filters.items()}
+print(json.dumps({
+    "rss_mb": (after - before) / 2**20,
+    "frame_mb": df.memory_usage(deep=True).sum() / 2**20,
+    "normalized_mb": normalized_mb,
+    "filters_ms": timings,
+}))
+"""
+
+
+def measure(path, table, mode):
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE, path, table, mode], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=40000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synthetic.write_dataset(tmp, args.rows)
+        tables = {
+            "Concatenated_LLM_Subdomains_embeddings.csv": ("data/Datamap/Concatenated_LLM_Subdomains_embeddings.csv", "papers"),
+            "LLM_related_domainss.csv": ("data/LLM_related_domainss.csv", "papers"),
+            "top_500_entity_data.csv": ("data/top_500_entity_data.csv", "entities"),
+        }
+        for name, (relative_path, table) in tables.items():
+            plain = measure(os.path.join(tmp, relative_path), table, "plain")
+            compact = measure(os.path.join(tmp, relative_path), table, "schema")
+            print(f"\n{name}")
+            print(f"  {'':28} {'plain':>10} {'schema':>10}")
+            print(f"  {'RSS growth on load (MB)':28} {plain['rss_mb']:>10.1f} {compact['rss_mb']:>10.1f}")
+            print(f"  {'frame memory (MB)':28} {plain['frame_mb']:>10.1f} {compact['frame_mb']:>10.1f}")
+            if compact["normalized_mb"] is not None:
+                print(f"  {'normalized memory (MB)':28} {plain['normalized_mb']:>10.1f} {compact['normalized_mb']:>10.1f}")
+            for filter_name in plain["filters_ms"]:
+                label = f"{filter_name} (ms)"
+                print(f"  {label:28} {plain['filters_ms'][filter_name]:>10.2f} {compact['filters_ms'][filter_name]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory held by concurrent sessions: per-rerun DataFrame copies vs. the shared corpus.
+
+Simulates ``N`` sessions rerunning Paper Tracking and Topic Tracking at the
+same moment and reports the memory they hold on top of the cached data, using
+``tracemalloc``:
+
+* ``copy``: what ``st.cache_data`` did, i.e. every rerun unpickles its own copy
+  of the corpus and then parses dates, drops rows and deduplicates it.
+* ``shared``: one :class:`llm_trends.corpus.Corpus` for the process; sessions
+  keep row-index arrays and materialize only the rows they display.
+
+Usage:
+    python benchmarks/session_memory.py --rows 40000 --sessions 1 5 10 20
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+from llm_trends.corpus import load_papers  # noqa: E402
+
+
+def copy_session(cached_pickle, topic):
+    # st.cache_data returns a fresh unpickled copy on every call
+    df = pickle.loads(cached_pickle)
+    df["update_date"] = pd.to_datetime(df["update_date"], errors="coerce")
+    df = df.dropna(subset=["update_date"])
+    df = df.drop_duplicates(subset=["title", "Human_Readable_Topic"])
+    return df, df[df["Human_Readable_Topic"] == topic]
+
+
+def shared_session(corpus, topic):
+    rows = corpus.memoize("rows", lambda: corpus.distinct_rows(["title", "Human_Readable_Topic"]))
+    topic_rows = corpus.rows_where(rows, Human_Readable_Topic=topic)
+    return rows, corpus.take(topic_rows, ["title", "id", "abstract", "submitter", "update_date", "week"])
+
+
+def held_bytes(run_session, n_sessions):
+    """Bytes allocated and still held while ``n_sessions`` reruns are in flight."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    in_flight = [run_session(i) for i in range(n_sessions)]
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del in_flight
+    return held
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=40000)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "papers.csv")
+        synthetic.papers(args.rows).to_csv(path, index=False)
+        cached_pickle = pickle.dumps(pd.read_csv(path))
+        corpus = load_papers(path)
+
+    topics = corpus.unique("Human_Readable_Topic")
+    print(f"{args.rows} rows, memory held by in-flight reruns (MB)")
+    print(f"{'sessions':>8}  {'copy':>10}  {'per session':>11}  {'shared':>10}  {'per session':>11}")
+    for n in args.sessions:
+        copied = held_bytes(lambda i: copy_session(cached_pickle, topics[i % len(topics)]), n) / 2**20
+        shared = held_bytes(lambda i: shared_session(corpus, topics[i % len(topics)]), n) / 2**20
+        print(f"{n:>8}  {copied:>10.1f}  {copied / n:>11.2f}  {shared:>10.1f}  {shared / n:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
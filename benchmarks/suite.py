@@ -0,0 +1,216 @@
+"""Timings of every section's core computation on synthetic corpora of several sizes.
+
+For each size, builds the papers, domains and entity corpora in memory with
+the real schemas (via ``synthetic``) and times, headlessly, what the sections
+compute on a typical interaction:
+
+* ``topic_monthly_counts``: Topic Tracking's per-topic monthly counts for one category.
+* ``topic_heatmap``: the topics x months pivot of the heatmap view.
+* ``entity_weekly_counts``: Entity Tracking's weekly counts of five entities.
+* ``articles_per_period``: Research Overview's paper counts over the whole history, at the automatic resolution.
+* ``topic_matching``: Topic Discovery's match of five topics against the topic embeddings.
+* ``document_matching``: Topic Discovery's offline match of a 100-page document (50,000 words).
+* ``paper_closeness``: Paper Tracking's closeness of a paper to the others of its topic.
+* ``export_<format>``: serializing Topic Tracking's paper export of one subdomain.
+
+Results (minimum and median of ``--repeat`` runs) are written as JSON together
+with the commit and library versions. ``--compare`` checks them against an
+earlier result file and exits with status 1 when a case got slower than the
+tolerance allows, so regressions between commits can be caught automatically.
+
+``paper_closeness`` and ``document_matching`` use the sentence-transformer model when it is installed
+and a deterministic stand-in encoder otherwise; the encoder is recorded in
+the results. Lower ``--abstract-words`` to fit 4M rows in memory.
+
+Usage:
+    python benchmarks/suite.py --rows 40000 400000 4000000 --output results.json
+    python benchmarks/suite.py --rows 40000 --compare results.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+from llm_trends import analytics, corpus, documents, exports, schema  # noqa: E402
+
+DEFAULT_SIZES = [40000, 400000, 4000000]
+DOCUMENT_WORDS = 50000
+
+
+class StandInEncoder:
+    """Deterministic pseudo-embeddings (seeded by each text's CRC), for machines without torch."""
+
+    def encode(self, texts, batch_size=None, convert_to_numpy=True, **kwargs):
+        vectors = np.empty((len(texts), synthetic.EMBEDDING_DIM), dtype=np.float32)
+        for i, text in enumerate(texts):
+            vectors[i] = np.random.default_rng(zlib.crc32(text.encode())).standard_normal(synthetic.EMBEDDING_DIM)
+        return vectors
+
+
+def load_encoder():
+    try:
+        from llm_trends.topic_assignment import load_model
+        return load_model(), "sentence-transformers"
+    except ImportError:
+        return StandInEncoder(), "stand-in"
+
+
+def _typed(frame, types):
+    return frame.astype({column: kind for column, kind in types.items() if column in frame.columns})
+
+
+def corpora(n_rows, abstract_words, seed=0):
+    """``(domains, entities, topics, topic_embeddings)`` built in memory, as the loaders would."""
+    papers = _typed(synthetic.papers(n_rows, seed=seed, abstract_words=abstract_words), schema.PAPERS)
+    topics = papers["Human_Readable_Topic"].unique()
+    domains = corpus.normalize(papers.drop(columns="2d_coords"))
+    del papers
+    entities = corpus._build(
+        _typed(synthetic.entities(n_rows, seed=seed), schema.ENTITIES), "Date", None, drop_invalid_dates=True
+    )
+    rng = np.random.default_rng(seed)
+    topic_embeddings = rng.standard_normal((len(topics), synthetic.EMBEDDING_DIM)).astype(np.float32)
+    topic_embeddings /= np.linalg.norm(topic_embeddings, axis=1, keepdims=True)
+    return domains, entities, np.asarray(topics, dtype=object), topic_embeddings
+
+
+def cases(domains, entities, topics, topic_embeddings, encoder):
+    """Name -> zero-argument callable of every benchmarked computation, with its inputs prepared."""
+    category = domains.unique("Categories")[0]
+    category_rows = domains.rows_where(Categories=category)
+    monthly = analytics.topic_monthly_counts(domains, [category])
+    selected_topics = monthly.groupby("Human_Readable_Topic", observed=True)["Monthly_Count"].sum().nlargest(10).index
+    monthly_selected = monthly[monthly["Human_Readable_Topic"].isin(selected_topics)]
+
+    top_entities = entities.index("Entity").labels[np.argsort(-entities.index("Entity").counts())[:5]].tolist()
+
+    query_embeddings = np.random.default_rng(1).standard_normal((5, synthetic.EMBEDDING_DIM)).astype(np.float32)
+
+    # A paper of a mid-sized topic, compared with the other papers of that topic
+    topic = selected_topics[len(selected_topics) // 2]
+    topic_rows = domains.distinct_rows("id", domains.rows_where(Human_Readable_Topic=topic))
+    abstracts = domains.values("abstract", topic_rows)
+    # About 100 pages of text, made of abstracts
+    words = " ".join(domains.values("abstract", domains.distinct_rows("id")[:2000])).split()
+    document = " ".join(np.resize(np.asarray(words, dtype=object), DOCUMENT_WORDS))
+
+    subdomain = domains.hierarchy().children("Subdomain", Categories=[category])[0]
+    export = exports.paper_export(domains, domains.rows_where(category_rows, Subdomain=subdomain))
+
+    timed = {
+        "topic_monthly_counts": lambda: analytics.topic_monthly_counts(domains, [category]),
+        "topic_heatmap": lambda: analytics.topic_heatmap(monthly_selected),
+        "entity_weekly_counts": lambda: analytics.entity_weekly_counts(entities, top_entities),
+        "articles_per_period": lambda: analytics.articles_per_period(domains),
+        "topic_matching": lambda: analytics.similar_topics(query_embeddings, topics, topic_embeddings, 5),
+        "paper_closeness": lambda: analytics.abstract_closeness(encoder, abstracts[0], abstracts[1:]),
+        "document_matching": lambda: documents.match_document(encoder, document, topics, topic_embeddings),
+    }
+    for fmt, (extension, _) in exports.FORMATS.items():
+        timed["export_" + extension.replace(".", "_")] = lambda fmt=fmt: exports.to_bytes(export, fmt)
+    return timed
+
+
+def run(sizes, repeat, abstract_words):
+    encoder, encoder_name = load_encoder()
+    results = []
+    for n_rows in sizes:
+        started = time.perf_counter()
+        domains, entities, topics, topic_embeddings = corpora(n_rows, abstract_words)
+        print(f"{n_rows} rows: corpora built in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        for name, fn in cases(domains, entities, topics, topic_embeddings, encoder).items():
+            fn()  # warm-up: lazy indexes and first-call costs are not what is measured
+            seconds = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                fn()
+                seconds.append(time.perf_counter() - started)
+            results.append({
+                "rows": n_rows,
+                "case": name,
+                "min_ms": round(min(seconds) * 1000, 3),
+                "median_ms": round(statistics.median(seconds) * 1000, 3),
+            })
+            print(f"{n_rows:>9}  {name:24} {results[-1]['median_ms']:>10.2f} ms", file=sys.stderr)
+        del domains, entities
+    return {
+        "commit": _commit(),
+        "timestamp": pd.Timestamp.now(tz="UTC").isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "encoder": encoder_name,
+        "abstract_words": abstract_words,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline, tolerance):
+    """Print the median ratios to ``baseline``; return the cases slower than ``1 + tolerance``."""
+    before = {(r["rows"], r["case"]): r["median_ms"] for r in baseline["results"]}
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit')}:", file=sys.stderr)
+    print(f"{'rows':>9}  {'case':24} {'before ms':>10} {'after ms':>10} {'ratio':>6}", file=sys.stderr)
+    for result in current["results"]:
+        key = (result["rows"], result["case"])
+        if key not in before:
+            continue
+        ratio = result["median_ms"] / max(before[key], 1e-6)
+        flag = "  REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{key[0]:>9}  {key[1]:24} {before[key]:>10.2f} {result['median_ms']:>10.2f} {ratio:>6.2f}{flag}",
+              file=sys.stderr)
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--abstract-words", type=int, default=120)
+    parser.add_argument("--output", help="write the results to this JSON file (default: stdout)")
+    parser.add_argument("--compare", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a case is flagged")
+    args = parser.parse_args(argv)
+
+    current = run(args.rows, args.repeat, args.abstract_words)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    else:
+        print(json.dumps(current, indent=2))
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(current, json.load(f), args.tolerance)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
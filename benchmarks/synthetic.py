@@ -0,0 +1,167 @@
+"""Synthetic corpora with the same schemas as the app's data files.
+
+The real data files are not all committed, so benchmarks and load tests run
+against generated ones. ``write_dataset`` lays out a directory that mirrors
+``data/`` and can be used as the working directory of the app.
+
+Usage:
+    python benchmarks/synthetic.py --rows 40000 --output /tmp/llm-trends-data
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = [
+    "Core Models and Architectures",
+    "Learning Paradigms",
+    "Optimization Techniques",
+    "Applications and Use Cases",
+    "Societal Impacts and Ethics",
+    "Infrastructure and Tools",
+    "Evaluation and Benchmarks",
+]
+START_DATE = pd.Timestamp("2022-11-30")
+DAYS = 730
+EMBEDDING_DIM = 384
+WORDS = np.array(
+    "language model attention transformer reasoning alignment retrieval agent benchmark evaluation "
+    "fine-tuning quantization pruning distillation prompt instruction safety bias fairness multimodal "
+    "vision code generation translation summarization dialogue memory context scaling efficiency".split()
+)
+
+
+def _popularity(rng, n, exponent=0.9):
+    """Skewed (Zipf-like) sampling probabilities over ``n`` items in random order."""
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return rng.permutation(weights / weights.sum())
+
+
+def _phrases(rng, n, length):
+    words = rng.choice(WORDS, size=(n, length))
+    return [" ".join(row) for row in words]
+
+
+def taxonomy(n_topics=400, subdomains_per_category=8, seed=0):
+    """Distinct (Categories, Subdomain, Human_Readable_Topic) triples."""
+    rng = np.random.default_rng(seed)
+    subdomains = [
+        (category, f"{category.split()[0]} Subdomain {i}")
+        for category in CATEGORIES for i in range(subdomains_per_category)
+    ]
+    picks = rng.integers(len(subdomains), size=n_topics)
+    return pd.DataFrame({
+        "Categories": [subdomains[i][0] for i in picks],
+        "Subdomain": [subdomains[i][1] for i in picks],
+        "Human_Readable_Topic": [f"Topic {i}: {phrase}" for i, phrase in enumerate(_phrases(rng, n_topics, 3))],
+    })
+
+
+def papers(n_rows, n_topics=400, duplication=1.3, seed=0, abstract_words=120):
+    """Rows shaped like ``Concatenated_LLM_Subdomains_embeddings.csv``.
+
+    As in the real corpus, a paper appears once per topic/subdomain it belongs
+    to, so ``n_rows`` covers roughly ``n_rows / duplication`` distinct papers.
+    ``abstract_words`` can be lowered to fit very large corpora in memory.
+    """
+    rng = np.random.default_rng(seed)
+    labels = taxonomy(n_topics, seed=seed)
+    n_papers = max(1, int(n_rows / duplication))
+
+    paper_of_row = np.concatenate([np.arange(n_papers), rng.integers(n_papers, size=n_rows - n_papers)]) \
+        if n_rows > n_papers else np.arange(n_rows)
+    paper_of_row.sort()
+    # Topic popularity is skewed
+    topic_of_row = rng.choice(n_topics, size=n_rows, p=_popularity(rng, n_topics))
+    day_of_paper = (rng.beta(2.0, 1.2, size=n_papers) * DAYS).astype(int)
+
+    ids = np.char.add("https://arxiv.org/abs/2", np.char.zfill((np.arange(n_papers) + 10000).astype(str), 8))
+    titles = np.array(_phrases(rng, n_papers, 8), dtype=object)
+    n_submitters = max(1, n_papers // 4)
+    submitter_names = np.array([f"Author {i}" for i in range(n_submitters)], dtype=object)
+    submitters = submitter_names[rng.choice(n_submitters, size=n_papers, p=_popularity(rng, n_submitters))]
+    abstract_pool = np.array(_phrases(rng, 512, abstract_words), dtype=object)
+    # Every abstract is distinct, as in the real corpus
+    abstracts = np.array([
+        f"{text} (paper {i})" for i, text in enumerate(abstract_pool[rng.integers(len(abstract_pool), size=n_papers)])
+    ], dtype=object)
+    coords = rng.normal(size=(n_rows, 2)).round(4)
+
+    return pd.DataFrame({
+        "id": ids[paper_of_row],
+        "update_date": (START_DATE + pd.to_timedelta(day_of_paper[paper_of_row], unit="D")).strftime("%Y-%m-%d"),
+        "title": titles[paper_of_row],
+        "abstract": abstracts[paper_of_row],
+        "Human_Readable_Topic": labels["Human_Readable_Topic"].to_numpy()[topic_of_row],
+        "Categories": labels["Categories"].to_numpy()[topic_of_row],
+        "submitter": submitters[paper_of_row],
+        "Subdomain": labels["Subdomain"].to_numpy()[topic_of_row],
+        "2d_coords": [f"[{x}, {y}]" for x, y in coords],
+    })
+
+
+def entities(n_rows, n_entities=500, seed=0):
+    """Rows shaped like ``top_500_entity_data.csv``."""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"entity {i} {w}" for i, w in enumerate(rng.choice(WORDS, size=n_entities))], dtype=object)
+    days = (rng.beta(2.0, 1.2, size=n_rows) * DAYS).astype(int)
+    return pd.DataFrame({
+        "Entity": names[rng.choice(n_entities, size=n_rows, p=_popularity(rng, n_entities))],
+        "Date": (START_DATE + pd.to_timedelta(days, unit="D")).strftime("%Y-%m-%d"),
+    })
+
+
+def topic_embeddings(topics, seed=0):
+    """Rows shaped like ``Topic_with_Embeddings.csv``: one JSON embedding per topic."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(len(topics), EMBEDDING_DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return pd.DataFrame({
+        "Human_Readable_Topic": list(topics),
+        "Embedding": [json.dumps(vector.round(6).tolist()) for vector in vectors],
+    })
+
+
+def paper_embeddings(n_rows, n_topics=400, spread=0.9, seed=0):
+    """Unit-length paper embeddings clustered around one direction per topic, like sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centroids = rng.normal(size=(n_topics, EMBEDDING_DIM)).astype(np.float32)
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+    topics = rng.choice(n_topics, size=n_rows, p=_popularity(rng, n_topics))
+    noise = rng.normal(scale=spread / np.sqrt(EMBEDDING_DIM), size=(n_rows, EMBEDDING_DIM)).astype(np.float32)
+    vectors = centroids[topics] + noise
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def write_dataset(output, n_rows, n_topics=400, seed=0):
+    """Write every data file the app reads under ``output`` (mirroring ``data/``)."""
+    os.makedirs(os.path.join(output, "data", "Datamap"), exist_ok=True)
+    corpus = papers(n_rows, n_topics, seed=seed)
+    corpus.to_csv(os.path.join(output, "data", "Datamap", "Concatenated_LLM_Subdomains_embeddings.csv"), index=False)
+    corpus.drop(columns="2d_coords").to_csv(os.path.join(output, "data", "LLM_related_domainss.csv"), index=False)
+    corpus.drop_duplicates(subset="id")[["id", "update_date"]].to_csv(
+        os.path.join(output, "data", "LLM_domain.csv"), index=False
+    )
+    entities(n_rows * 5, seed=seed).to_csv(os.path.join(output, "data", "top_500_entity_data.csv"), index=False)
+    topic_embeddings(corpus["Human_Readable_Topic"].unique(), seed=seed).to_csv(
+        os.path.join(output, "data", "Topic_with_Embeddings.csv"), index=False
+    )
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic copy of the app's data directory.")
+    parser.add_argument("--rows", type=int, default=40000)
+    parser.add_argument("--topics", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args(argv)
+    write_dataset(args.output, args.rows, args.topics, args.seed)
+    print(f"Wrote a {args.rows}-row synthetic dataset to {args.output}/data")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Time for a fresh process to load every corpus, with and without the artifact cache.
+
+Writes a synthetic ``data/`` directory, then starts a new Python process per
+measurement that loads the papers, domains, entities and LLM domain corpora
+and the topic embeddings, as a new app replica does:
+
+* ``no cache``: ``LLM_TRENDS_ARTIFACTS=off``, everything parsed from CSV.
+* ``first replica``: empty cache, so the process builds and stores every artifact.
+* ``next replica``: the cache is filled, so the process maps the stored artifacts.
+
+Usage:
+    python benchmarks/warm_start.py --rows 40000 400000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import synthetic  # noqa: E402
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_ALL = """
+import sys, time
+sys.path.insert(0, {repo!r})
+started = time.perf_counter()
+from llm_trends import analytics, corpus
+corpus.load_papers(); corpus.load_domains(); corpus.load_entities(); corpus.load_llm_domain()
+analytics.load_topic_embeddings()
+print(time.perf_counter() - started)
+"""
+
+
+def load_seconds(data_dir, cache_dir):
+    env = dict(os.environ, LLM_TRENDS_ARTIFACTS=cache_dir)
+    output = subprocess.run(
+        [sys.executable, "-c", LOAD_ALL.format(repo=REPO)], cwd=data_dir, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.split()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[40000, 400000])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>9}  {'no cache (s)':>12}  {'first replica (s)':>17}  {'next replica (s)':>16}")
+    for n_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            synthetic.write_dataset(tmp, n_rows)
+            cache_dir = os.path.join(tmp, "artifacts")
+            uncached = load_seconds(tmp, "off")
+            first = load_seconds(tmp, cache_dir)
+            warm = load_seconds(tmp, cache_dir)
+        print(f"{n_rows:>9}  {uncached:>12.2f}  {first:>17.2f}  {warm:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Data processing helpers shared by the Streamlit app and offline jobs."""
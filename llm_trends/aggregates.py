@@ -0,0 +1,90 @@
+"""Precomputed paper counts over the label hierarchy.
+
+Topic Overview draws a sunburst and a detail table of the number of papers per
+(Categories, Subdomain, Human_Readable_Topic) path, and used to regroup the
+rows for both on every widget change. A :class:`CountTree` holds those counts,
+per month, for every distinct path: any node of the tree is the sum of the
+leaves below it, so the sunburst, the drill-down tables and monthly trend
+sparklines are all read from a few hundred leaves instead of the rows.
+
+Trees are immutable; :meth:`CountTree.add` folds the rows of newly added papers
+into a new tree without recounting the corpus.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts
+
+COUNT = "Count"
+PERIOD = "Month_Start"
+
+
+class CountTree:
+    """Row counts per hierarchy path (index) and month (columns)."""
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.levels = list(counts.index.names)
+
+    @classmethod
+    def build(cls, frame, levels, period=PERIOD):
+        """Count the rows of ``frame`` for every distinct path of ``levels`` and every ``period``."""
+        # Rows without a date still count towards their path, under a NaT column
+        counts = frame.groupby(list(levels) + [period], observed=True, dropna=False).size().unstack(period, fill_value=0)
+        counts = counts[counts.index.to_frame().notna().all(axis=1).to_numpy()]
+        # Plain labels on a small index: trees built from different corpora can be aligned
+        counts.index = pd.MultiIndex.from_arrays(
+            [counts.index.get_level_values(level).astype(object) for level in levels], names=list(levels)
+        )
+        counts.columns = pd.DatetimeIndex(counts.columns, name=period)
+        return cls(counts.astype(np.int64))
+
+    def add(self, frame, period=PERIOD):
+        """A new tree with the rows of ``frame`` counted in as well."""
+        added = CountTree.build(frame, self.levels, period).counts
+        counts = self.counts.add(added, fill_value=0).fillna(0).astype(np.int64)
+        return CountTree(counts.sort_index(axis=1))
+
+    def save(self, directory):
+        artifacts.save_frame(self.counts.index.to_frame(index=False), os.path.join(directory, "paths"))
+        artifacts.save_array(self.counts.to_numpy(), os.path.join(directory, "counts"))
+        artifacts.save_array(self.counts.columns.to_numpy(), os.path.join(directory, "periods"))
+
+    @classmethod
+    def load(cls, directory):
+        paths = artifacts.load_frame(os.path.join(directory, "paths"))
+        periods = np.asarray(artifacts.load_array(os.path.join(directory, "periods")))
+        return cls(pd.DataFrame(
+            np.array(artifacts.load_array(os.path.join(directory, "counts"))),
+            index=pd.MultiIndex.from_frame(paths),
+            columns=pd.DatetimeIndex(periods, name=PERIOD),
+        ))
+
+    def _select(self, ancestors):
+        mask = np.ones(len(self.counts), dtype=bool)
+        for level, labels in ancestors.items():
+            if isinstance(labels, str):
+                labels = [labels]
+            mask &= self.counts.index.get_level_values(level).isin(labels)
+        return self.counts[mask]
+
+    def leaves(self, **ancestors):
+        """Paths below the given labels, e.g. ``leaves(Categories="...")``, with their total count."""
+        selected = self._select(ancestors)
+        table = selected.index.to_frame(index=False)
+        table[COUNT] = selected.sum(axis=1).to_numpy()
+        return table
+
+    def _dated(self, selected):
+        return selected.loc[:, selected.columns.notna()]
+
+    def monthly(self, **ancestors):
+        """Monthly counts of the node given by ``ancestors`` (the sum of its leaves)."""
+        return self._dated(self._select(ancestors)).sum(axis=0)
+
+    def trends(self, **ancestors):
+        """Monthly counts of every leaf below the given labels, in the order of :meth:`leaves`."""
+        return self._dated(self._select(ancestors)).to_numpy().tolist()
@@ -0,0 +1,114 @@
+"""Trend computations shared by the app sections and the HTTP API.
+
+Each function takes a :class:`llm_trends.corpus.Corpus` (or precomputed
+embeddings) and returns a plain DataFrame or array, with no Streamlit calls,
+so the same numbers can be served to the UI, to ``llm_trends.api`` and to
+notebooks.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts, tracing
+from llm_trends.timeseries import MAX_POINTS
+from llm_trends.topic_assignment import TOPIC_EMBEDDINGS_PATH, _normalize_rows, encode_texts
+
+
+# Label columns of the time pyramid the topic counts are read from
+TOPIC_PATH = ("Categories", "Subdomain", "Human_Readable_Topic")
+
+
+def topic_rows(corpus, categories=None, subdomains=None, topics=None):
+    """Row ids of the given categories, subdomains and topics; ``None`` leaves a level unrestricted."""
+    conditions = {"Categories": categories, "Subdomain": subdomains, "Human_Readable_Topic": topics}
+    return corpus.rows_where(**{column: labels for column, labels in conditions.items() if labels is not None})
+
+
+def topic_monthly_counts(corpus, categories=None, subdomains=None, topics=None):
+    """Monthly and cumulative paper counts per topic of the rows selected as in :func:`topic_rows`.
+
+    Summed from the corpus's time pyramid of (category, subdomain, topic)
+    paths, so the rows are not regrouped. Columns: ``Month_Start``,
+    ``Human_Readable_Topic``, ``Monthly_Count``, ``Cumulative_Count``.
+    """
+    pyramid = corpus.time_pyramid("update_date", TOPIC_PATH)
+    paths = pyramid.labels
+    selected = paths.get_level_values("Human_Readable_Topic").notna()
+    for level, labels in zip(TOPIC_PATH, (categories, subdomains, topics)):
+        if labels is not None:
+            selected &= paths.get_level_values(level).isin([labels] if isinstance(labels, str) else list(labels))
+    monthly = pyramid.series(paths[selected], resolution="month")
+    # Months x topics, summed over the selected paths of each topic
+    monthly = monthly.T.groupby(level="Human_Readable_Topic").sum().T
+    counts = monthly.rename_axis(index="Month_Start", columns="Human_Readable_Topic").stack().reset_index(name="Monthly_Count")
+    counts = counts[counts["Monthly_Count"] > 0].reset_index(drop=True)
+    counts["Cumulative_Count"] = counts.groupby("Human_Readable_Topic")["Monthly_Count"].cumsum()
+    return counts
+
+
+def topic_heatmap(monthly_counts):
+    """Topics x months matrix of ``Monthly_Count`` from :func:`topic_monthly_counts`, every month included."""
+    monthly_counts = monthly_counts.assign(Month_Start=pd.to_datetime(monthly_counts["Month_Start"], errors="coerce"))
+    all_months = pd.date_range(monthly_counts["Month_Start"].min(), monthly_counts["Month_Start"].max(), freq="MS")
+    heatmap = monthly_counts.pivot_table(
+        index="Human_Readable_Topic", columns="Month_Start", values="Monthly_Count", aggfunc="sum", observed=True
+    )
+    return heatmap.reindex(columns=all_months, fill_value=0).fillna(0)
+
+
+def entity_weekly_counts(corpus, entities, start=None, end=None):
+    """Mentions of each entity per week between ``start`` and ``end`` (inclusive): weeks x entities, latest first."""
+    counts = corpus.time_pyramid("Date", "Entity").series(entities, start, end, "week")
+    return counts.rename_axis(index="Week", columns="Entity").sort_index(ascending=False)
+
+
+def articles_per_period(corpus, start=None, end=None, resolution=None, max_points=MAX_POINTS):
+    """Number of papers per period between ``start`` and ``end``: ``(resolution, counts)``.
+
+    ``resolution`` (day, week, month or quarter) defaults to the finest one
+    with at most ``max_points`` periods in the range. ``counts`` has the
+    columns ``period`` (start date) and ``num_articles``.
+    """
+    pyramid = corpus.time_pyramid("update_date")
+    resolution = resolution or pyramid.resolution_for(start, end, max_points)
+    counts = pyramid.total(start, end, resolution)
+    return resolution, counts.rename_axis("period").reset_index(name="num_articles")
+
+
+def load_topic_embeddings(path=TOPIC_EMBEDDINGS_PATH):
+    """Return ``(topics, embeddings)``: the topic of every row of ``path`` and its unit-length embedding.
+
+    Decoding the JSON embeddings is the slow part, so the matrix is kept in the
+    artifact cache and memory-mapped back on later loads.
+    """
+    def build():
+        dataset = pd.read_csv(path, usecols=["Human_Readable_Topic", "Embedding"])
+        embeddings = _normalize_rows(np.vstack(dataset["Embedding"].map(json.loads).to_numpy()))
+        return dataset["Human_Readable_Topic"].to_numpy(dtype=object), embeddings
+
+    def save(value, directory):
+        artifacts.save_frame(pd.DataFrame({"Human_Readable_Topic": value[0]}), os.path.join(directory, "topics"))
+        artifacts.save_array(value[1], os.path.join(directory, "embeddings"))
+
+    def load(directory):
+        topics = artifacts.load_frame(os.path.join(directory, "topics"))["Human_Readable_Topic"]
+        return topics.to_numpy(dtype=object), artifacts.load_array(os.path.join(directory, "embeddings"))
+
+    with tracing.span("data.load", source="topic_embeddings", path=path):
+        return artifacts.cached("topic_embeddings", [path], build, save, load)
+
+
+def similar_topics(query_embeddings, topics, topic_embeddings, top_n=5):
+    """Topics closest to any of the queries: the ``top_n`` best rows per query, distinct, in query order."""
+    similarities = _normalize_rows(query_embeddings) @ topic_embeddings.T
+    best = np.argsort(similarities, axis=1)[:, -top_n:][:, ::-1]
+    return pd.unique(topics[best.ravel()]).tolist()[:top_n]
+
+
+def abstract_closeness(model, abstract, abstracts):
+    """Cosine similarity of ``abstract`` to each of ``abstracts``, encoded in one batch."""
+    embeddings = encode_texts(model, [abstract] + list(abstracts))
+    return embeddings[1:] @ embeddings[0]
@@ -0,0 +1,304 @@
+"""Read-only HTTP JSON API over the trend computations.
+
+Dashboards and notebooks can query the same numbers the app shows without a
+Streamlit rerun. Responses are cached in memory by request and data version,
+and carry an ``ETag`` derived from both: a client sending it back in
+``If-None-Match`` gets an empty ``304 Not Modified`` until the data changes.
+New data versions are loaded in the background and swapped in between
+requests (``llm_trends.reload``); a request in flight finishes on the version
+it started with.
+
+Endpoints (all ``GET``, repeated parameters select several labels):
+
+    /version
+    /topics/monthly?category=...&subdomain=...&topic=...
+    /topics/emerging?column=Human_Readable_Topic&period=Month_Start&window=3&top=50
+    /topics/lead-lag?column=Human_Readable_Topic&top=50&min_total=20
+    /topics/match?q=<topic text>&q=...&top_n=5
+    /entities/weekly?entity=...&start=YYYY-MM-DD&end=YYYY-MM-DD
+    /papers/counts?start=YYYY-MM-DD&end=YYYY-MM-DD&resolution=auto&max_points=400
+    /papers/similar?id=<paper URL>&top_n=10
+    /authors/search?q=<name prefix>&limit=20
+    /authors/topics?name=<submitter>&top=10
+    /topics/submitters?topic=...&month=YYYY-MM&top=10
+    /metrics        (Prometheus text format, with LLM_TRENDS_TRACE=1; see llm_trends.tracing)
+
+The matching endpoints load the sentence-transformer model on first use and
+share it through a :class:`llm_trends.encoder.BatchingEncoder`, so concurrent
+requests are encoded together.
+
+Usage:
+    python -m llm_trends.api --port 8502
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import traceback
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from llm_trends import analytics, timeseries, tracing, trends
+from llm_trends.encoder import BatchingEncoder
+from llm_trends.reload import DEFAULT_INTERVAL, DataVersions
+from llm_trends.topic_assignment import encode_texts, load_model
+
+CACHE_ENTRIES = 256
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _records(frame):
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def _int(query, name, default, minimum=0):
+    try:
+        value = int(query.get(name, [default])[0])
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer")
+    if value < minimum:
+        raise BadRequest(f"'{name}' must be at least {minimum}")
+    return value
+
+
+def _date(query, name):
+    if name not in query:
+        return None
+    try:
+        return pd.Timestamp(query[name][0])
+    except ValueError:
+        raise BadRequest(f"'{name}' must be a date")
+
+
+def _choice(query, name, choices, default):
+    value = query.get(name, [default])[0]
+    if value not in choices:
+        raise BadRequest(f"'{name}' must be one of {', '.join(choices)}")
+    return value
+
+
+class TrendsAPI:
+    """Routes queries to :mod:`llm_trends.analytics` and caches the JSON bodies by data version."""
+
+    def __init__(self, cache_entries=CACHE_ENTRIES, data=None):
+        self.data = data or DataVersions().watch()
+        self._loaded_version = None
+        self._model = None
+        self._topic_embeddings = None
+        self._lock = threading.Lock()
+        # Held while loading the model and the topic embeddings, so the response cache stays available meanwhile
+        self._load_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_entries = cache_entries
+        self.routes = {
+            "/version": self.version,
+            "/topics/monthly": self.topic_monthly,
+            "/topics/emerging": self.topic_emerging,
+            "/topics/lead-lag": self.topic_lead_lag,
+            "/topics/match": self.topic_match,
+            "/entities/weekly": self.entity_weekly,
+            "/papers/counts": self.paper_counts,
+            "/papers/similar": self.papers_similar,
+            "/authors/search": self.author_search,
+            "/authors/topics": self.author_topics,
+            "/topics/submitters": self.topic_submitters,
+        }
+
+    def corpus(self, name):
+        # Loaded on first use and shared by every request thread, from the version pinned by the request
+        return self.data.get(name)
+
+    @property
+    def model(self):
+        with self._load_lock:
+            if self._model is None:
+                self._model = BatchingEncoder(load_model())
+            return self._model
+
+    def handle(self, path, query):
+        """Return ``(status, body, etag)`` for a request; ``body`` is JSON bytes."""
+        if path not in self.routes:
+            return 404, json.dumps({"error": f"Unknown endpoint: {path}"}).encode(), None
+        try:
+            with self.data.pinned() as snapshot, tracing.span("api.request", path=path):
+                return self._handle(path, query, snapshot.version)
+        except Exception as e:
+            # The client still gets an HTTP response; the traceback goes to the server log
+            traceback.print_exc()
+            return 500, json.dumps({"error": f"Internal error: {type(e).__name__}"}).encode(), None
+
+    def _handle(self, path, query, version):
+        with self._lock:
+            if version != self._loaded_version and version == self.data.current.version:
+                # A new data version was swapped in: the cached responses are stale
+                self._cache.clear()
+                self._loaded_version = version
+        key = (version, path, tuple(sorted((name, tuple(values)) for name, values in query.items())))
+        etag = '"%s"' % hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        with self._lock:
+            tracing.cache_lookup("api_response", key in self._cache)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return 200, self._cache[key], etag
+        try:
+            data = self.routes[path](query)
+        except BadRequest as e:
+            return 400, json.dumps({"error": str(e)}).encode(), None
+        body = json.dumps({"version": version, "data": data}).encode()
+        with self._lock:
+            self._cache[key] = body
+            if len(self._cache) > self._cache_entries:
+                self._cache.popitem(last=False)
+        return 200, body, etag
+
+    def version(self, query):
+        return {"data_version": self._loaded_version}
+
+    def topic_monthly(self, query):
+        domains = self.corpus("domains")
+        counts = analytics.topic_monthly_counts(domains, query.get("category"), query.get("subdomain"), query.get("topic"))
+        return _records(counts)
+
+    def topic_emerging(self, query):
+        column = _choice(query, "column", ["Human_Readable_Topic", "Subdomain", "Entity"], "Human_Readable_Topic")
+        period = _choice(query, "period", ["Month_Start", "week"], "Month_Start")
+        source = self.corpus("entities" if column == "Entity" else "domains")
+        scores = trends.score_column(source, column, period, _int(query, "window", trends.DEFAULT_WINDOW, minimum=1))
+        ranked = scores.sort_values(["bursting", "burst_weight", "growth"], ascending=False)
+        return _records(ranked.head(_int(query, "top", 50)))
+
+    def topic_lead_lag(self, query):
+        column = _choice(query, "column", ["Human_Readable_Topic", "Subdomain", "Entity"], "Human_Readable_Topic")
+        period = _choice(query, "period", ["Month_Start", "week"], "Month_Start")
+        source = self.corpus("entities" if column == "Entity" else "domains")
+        pairs = trends.lead_lag_pairs(
+            source, column, period, top=_int(query, "top", 50), min_total=_int(query, "min_total", 20)
+        )
+        return _records(pairs)
+
+    def topic_match(self, query):
+        if not query.get("q"):
+            raise BadRequest("at least one 'q' is required")
+        with self._load_lock:
+            if self._topic_embeddings is None:
+                self._topic_embeddings = analytics.load_topic_embeddings()
+        topics, topic_embeddings = self._topic_embeddings
+        embeddings = encode_texts(self.model, query["q"])
+        return analytics.similar_topics(embeddings, topics, topic_embeddings, _int(query, "top_n", 5))
+
+    def entity_weekly(self, query):
+        if not query.get("entity"):
+            raise BadRequest("at least one 'entity' is required")
+        counts = analytics.entity_weekly_counts(
+            self.corpus("entities"), query["entity"], _date(query, "start"), _date(query, "end")
+        )
+        return _records(counts.reset_index())
+
+    def paper_counts(self, query):
+        resolution = _choice(query, "resolution", ["auto"] + list(timeseries.RESOLUTIONS), "auto")
+        resolution, counts = analytics.articles_per_period(
+            self.corpus("llm_domain"),
+            _date(query, "start"),
+            _date(query, "end"),
+            None if resolution == "auto" else resolution,
+            _int(query, "max_points", timeseries.MAX_POINTS),
+        )
+        return {"resolution": resolution, "counts": _records(counts)}
+
+    def papers_similar(self, query):
+        if not query.get("id"):
+            raise BadRequest("'id' is required")
+        papers = self.corpus("papers")
+        selected = papers.rows_where(id=query["id"][0])
+        if len(selected) == 0:
+            raise BadRequest(f"Unknown paper id: {query['id'][0]}")
+        paper = papers.take(selected[:1], ["abstract", "Human_Readable_Topic"]).iloc[0]
+        # Same neighbourhood as Paper Tracking: the other papers of the paper's topic
+        rows = papers.distinct_rows("id", papers.rows_where(Human_Readable_Topic=paper["Human_Readable_Topic"]))
+        rows = rows[papers.values("id", rows) != query["id"][0]]
+        candidates = papers.take(rows, ["id", "title", "update_date", "abstract"])
+        candidates["closeness"] = analytics.abstract_closeness(self.model, paper["abstract"], candidates["abstract"])
+        nearest = candidates.nlargest(_int(query, "top_n", 10), "closeness").drop(columns="abstract")
+        return _records(nearest)
+
+    def author_search(self, query):
+        if not query.get("q"):
+            raise BadRequest("'q' is required")
+        return _records(self.corpus("domains").authors().search(query["q"][0], _int(query, "limit", 20)))
+
+    def author_topics(self, query):
+        if not query.get("name"):
+            raise BadRequest("'name' is required")
+        authors = self.corpus("domains").authors()
+        if authors.code(query["name"][0]) < 0:
+            raise BadRequest(f"Unknown submitter: {query['name'][0]}")
+        trajectory = authors.trajectory(query["name"][0], topics=_int(query, "top", 10))
+        return _records(trajectory[trajectory.sum(axis=1) > 0].reset_index())
+
+    def topic_submitters(self, query):
+        if not query.get("topic"):
+            raise BadRequest("'topic' is required")
+        board = self.corpus("domains").authors().leaderboard(query["topic"][0], _date(query, "month"), _int(query, "top", 10))
+        return _records(board)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/metrics":
+            body = tracing.metrics_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        status, body, etag = self.api.handle(url.path.rstrip("/") or "/", parse_qs(url.query))
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            # Clients may keep responses but must revalidate them, which is cheap with the ETag
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=8502, api=None):
+    handler = type("Handler", (_Handler,), {"api": api or TrendsAPI()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the trend computations as a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--reload-interval", type=float, default=DEFAULT_INTERVAL,
+                        help="seconds between checks for a new data version")
+    args = parser.parse_args(argv)
+    server = make_server(args.host, args.port, TrendsAPI(data=DataVersions(interval=args.reload_interval).watch()))
+    tracing.start()
+    print(f"Serving the trends API on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Content-addressed cache of derived artifacts on disk, shared across processes.
+
+``st.cache_resource`` only lives as long as one Streamlit process, so every
+replica and every restart parses the CSVs, normalizes the corpora and decodes
+the embeddings again. An :class:`ArtifactCache` stores those results under a
+key made of the artifact name, the code version (a hash of the
+``llm_trends`` sources), the content hash of every input file and any
+parameters. Point ``LLM_TRENDS_ARTIFACTS`` of several replicas at the same
+directory (a shared volume) and only the first one pays for a build.
+
+Entries are directories of memory-mappable files: DataFrames as uncompressed
+Arrow IPC (pickle when pyarrow is missing), arrays as ``.npy``. An entry is
+written to a temporary directory and renamed into place, so readers never see
+a partial entry; a per-key file lock keeps concurrent processes from building
+the same artifact twice. When the cache grows past its size limit, the least
+recently used entries are removed; processes that still map an evicted file
+keep reading it until they close it.
+
+Environment:
+    LLM_TRENDS_ARTIFACTS          cache directory, or ``off`` (default ``data/.artifacts``)
+    LLM_TRENDS_ARTIFACTS_MAX_GB   size limit (default 4)
+
+Usage:
+    python -m llm_trends.artifacts            # list entries
+    python -m llm_trends.artifacts --clear
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import tracing
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent builds of one key race, and the first rename wins
+    fcntl = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+except ImportError:
+    pyarrow = None
+
+ARTIFACTS_DIR = os.environ.get("LLM_TRENDS_ARTIFACTS", "data/.artifacts")
+MAX_BYTES = int(float(os.environ.get("LLM_TRENDS_ARTIFACTS_MAX_GB", "4")) * 2**30)
+# Temporary directories left behind by a crashed writer are removed after this long
+STALE_SECONDS = 3600
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_hash_lock = threading.Lock()
+_file_hashes = {}
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """Hash of the ``llm_trends`` sources: artifacts built by other code are never reused."""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(_PACKAGE_DIR)):
+        if name.endswith(".py"):
+            with open(os.path.join(_PACKAGE_DIR, name), "rb") as f:
+                digest.update(name.encode() + b"\0" + f.read())
+    return digest.hexdigest()[:16]
+
+
+def file_hash(path):
+    """SHA-256 of a file's content (``"missing"`` if absent), computed once per size and mtime."""
+    if not os.path.exists(path):
+        return "missing"
+    stat = os.stat(path)
+    stamp = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _hash_lock:
+        if stamp in _file_hashes:
+            return _file_hashes[stamp]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    with _hash_lock:
+        _file_hashes[stamp] = digest.hexdigest()
+    return _file_hashes[stamp]
+
+
+def artifact_key(name, inputs=(), params=None):
+    """Key of an artifact: its name, the code version, the input contents and the parameters."""
+    description = {
+        "name": name,
+        "code": code_version(),
+        "inputs": [file_hash(path) for path in inputs],
+        "params": params,
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def save_frame(frame, path):
+    """Write a DataFrame (RangeIndex) so that :func:`load_frame` can memory-map it."""
+    if pyarrow is None:
+        with open(path + ".pkl", "wb") as f:
+            pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return
+    text_columns = [c for c in frame.columns if isinstance(frame[c].dtype, pd.StringDtype) and frame[c].dtype.storage == "pyarrow"]
+    pyarrow.feather.write_feather(frame, path + ".arrow", compression="uncompressed")
+    with open(path + ".json", "w") as f:
+        json.dump({"text_columns": text_columns}, f)
+
+
+def load_frame(path):
+    if pyarrow is None or not os.path.exists(path + ".arrow"):
+        with open(path + ".pkl", "rb") as f:
+            return pickle.load(f)
+    with open(path + ".json") as f:
+        text_columns = json.load(f)["text_columns"]
+    table = pyarrow.feather.read_table(path + ".arrow", memory_map=True)
+    frame = table.drop_columns(text_columns).to_pandas()
+    # Arrow-backed text columns are wrapped without a copy, straight from the mapped file
+    for column in text_columns:
+        frame[column] = pd.arrays.ArrowStringArray(table.column(column))
+    return frame[table.column_names]
+
+
+def save_array(array, path):
+    np.save(path + ".npy", np.ascontiguousarray(array))
+
+
+def load_array(path):
+    return np.load(path + ".npy", mmap_mode="r")
+
+
+class ArtifactCache:
+    """Directory of immutable, content-addressed artifact entries with LRU size-based eviction."""
+
+    def __init__(self, root=ARTIFACTS_DIR, max_bytes=MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def entry_path(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def get_or_build(self, name, inputs, build, save, load, params=None):
+        """Return the artifact ``name`` for ``inputs``/``params``, building and storing it if needed.
+
+        ``build()`` computes the value, ``save(value, directory)`` writes it into
+        an empty directory and ``load(directory)`` reads it back.
+        """
+        key = artifact_key(name, inputs, params)
+        entry = self.entry_path(key)
+        found, value = self._load(entry, load, name)
+        tracing.cache_lookup("artifact", found, artifact=name)
+        if found:
+            return value
+        # An unwritable cache must not take the app down; it only loses the speed-up
+        try:
+            lock = self._key_lock(key)
+        except OSError as e:
+            warnings.warn(f"Artifact cache unavailable, building {name} without it: {e}")
+            return build()
+        with lock:
+            # Another process may have built it while we waited for the lock
+            found, value = self._load(entry, load, name)
+            if found:
+                return value
+            with tracing.span("artifact.build", artifact=name):
+                value = build()
+            try:
+                self._publish(entry, lambda directory: save(value, directory))
+            except OSError as e:
+                warnings.warn(f"Could not store artifact {name}: {e}")
+                return value
+        self.evict()
+        return value
+
+    def _load(self, entry, load, name):
+        if not os.path.isdir(entry):
+            return False, None
+        try:
+            with tracing.span("artifact.load", artifact=name):
+                value = load(entry)
+        except FileNotFoundError:
+            # Evicted by another process between the check and the read
+            return False, None
+        # The entry's mtime records its last use, for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return True, value
+
+    def _key_lock(self, key):
+        os.makedirs(os.path.join(self.root, "locks"), exist_ok=True)
+        return _FileLock(os.path.join(self.root, "locks", key + ".lock"))
+
+    def _publish(self, entry, write):
+        scratch = os.path.join(self.root, "tmp")
+        os.makedirs(scratch, exist_ok=True)
+        directory = tempfile.mkdtemp(prefix=os.path.basename(entry) + ".", dir=scratch)
+        try:
+            write(directory)
+            # mkdtemp creates the directory private to this user; entries are shared with other replicas
+            os.chmod(directory, 0o755)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            os.rename(directory, entry)
+        except OSError:
+            shutil.rmtree(directory, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+
+    def entries(self):
+        """``(path, bytes, last_used)`` of every entry."""
+        entries = []
+        for shard in os.listdir(self.root) if os.path.isdir(self.root) else []:
+            if len(shard) != 2:
+                continue
+            for key in os.listdir(os.path.join(self.root, shard)):
+                path = os.path.join(self.root, shard, key)
+                try:
+                    size = sum(e.stat().st_size for e in os.scandir(path) if e.is_file())
+                    entries.append((path, size, os.stat(path).st_mtime))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            self._remove(path)
+            total -= size
+        self._remove_stale()
+
+    def clear(self):
+        self.evict(max_bytes=0)
+
+    def _remove(self, path):
+        # Rename first so readers never see a half-deleted entry
+        graveyard = os.path.join(self.root, "tmp", f"evicted.{os.path.basename(path)}.{os.getpid()}")
+        try:
+            os.rename(path, graveyard)
+        except OSError:
+            return
+        shutil.rmtree(graveyard, ignore_errors=True)
+        try:
+            os.remove(os.path.join(self.root, "locks", os.path.basename(path) + ".lock"))
+        except OSError:
+            pass
+
+    def _remove_stale(self):
+        scratch = os.path.join(self.root, "tmp")
+        cutoff = time.time() - STALE_SECONDS
+        for name in os.listdir(scratch) if os.path.isdir(scratch) else []:
+            path = os.path.join(scratch, name)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except FileNotFoundError:
+                continue
+
+
+class _FileLock:
+    """Exclusive ``flock`` on a lock file, held for the duration of a ``with`` block."""
+
+    def __init__(self, path):
+        self._file = open(path, "a")
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+
+
+def default_cache():
+    """The cache configured by the environment, or ``None`` when it is turned off."""
+    if ARTIFACTS_DIR.lower() in ("", "off", "0", "false"):
+        return None
+    return ArtifactCache()
+
+
+def cached(name, inputs, build, save, load, params=None):
+    """``build()`` through the default cache, or directly when the cache is off."""
+    cache = default_cache()
+    if cache is None:
+        return build()
+    return cache.get_or_build(name, inputs, build, save, load, params)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the artifact cache.")
+    parser.add_argument("--clear", action="store_true", help="remove every entry")
+    args = parser.parse_args(argv)
+
+    cache = ArtifactCache()
+    if args.clear:
+        cache.clear()
+    entries = sorted(cache.entries(), key=lambda entry: entry[2], reverse=True)
+    for path, size, last_used in entries:
+        print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(last_used))}  {size / 2**20:>9.1f} MB  {path}")
+    print(f"{len(entries)} entries, {sum(size for _, size, _ in entries) / 2**20:.1f} MB in {cache.root}")
+
+
+if __name__ == "__main__":
+    main()
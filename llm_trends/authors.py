@@ -0,0 +1,205 @@
+"""Submitter index and author-level trend analytics.
+
+The ``submitter`` of a paper used to be display text only. An
+:class:`AuthorIndex` is built once per paper corpus and holds:
+
+* the normalized submitter names, sorted, so an author is found by exact
+  name or prefix with a binary search;
+* the papers of every author, as a contiguous slice of paper ids sorted by date;
+* sparse paper counts per (author, topic, month), stored twice: ordered by
+  author, so an author's topic trajectory is one slice, and ordered by
+  (topic, month, count), so the most active submitters of a topic in a month
+  are the head of one slice.
+
+Every view reads a few slices of these arrays instead of grouping the corpus,
+so it answers in about the same time whatever the corpus size.
+"""
+
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts
+
+AUTHOR = "submitter"
+TOPIC = "Human_Readable_Topic"
+PERIOD = "Month_Start"
+
+
+def normalize_name(name):
+    """Lookup key of a submitter name: no accents, case or punctuation, single spaces."""
+    if not isinstance(name, str):
+        return ""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^\w\s-]", " ", name.casefold()).split())
+
+
+def _bounds(sorted_codes, n):
+    return np.searchsorted(sorted_codes, np.arange(n + 1))
+
+
+class AuthorIndex:
+    """Papers and per-(topic, month) paper counts of every submitter of a :class:`PaperCorpus`."""
+
+    ARRAYS = ["paper_order", "paper_bounds", "author", "topic", "month", "count", "author_bounds", "board_order", "board_bounds"]
+
+    @classmethod
+    def build(cls, corpus):
+        index = cls.__new__(cls)
+        papers = corpus.papers
+        # Names are normalized once per distinct spelling; papers without a submitter get code -1
+        spelling, spellings = pd.factorize(papers[AUTHOR].astype(object))
+        spelling_keys, index.keys = pd.factorize(
+            np.array([normalize_name(name) or None for name in spellings], dtype=object), sort=True
+        )
+        index.keys = pd.Index(index.keys, dtype=object)
+        codes = np.where(spelling >= 0, spelling_keys[spelling], -1)
+        # Display name: the most frequent spelling of every key
+        frequent = np.argsort(-np.bincount(spelling[spelling >= 0], minlength=len(spellings)), kind="stable")
+        frequent = frequent[spelling_keys[frequent] >= 0]
+        first = np.unique(spelling_keys[frequent], return_index=True)[1]
+        index.names = pd.Index(np.asarray(spellings, dtype=object)[frequent[first]], dtype=object)
+
+        # Papers of each author, newest first
+        newest = papers["update_date"].sort_values(ascending=False, na_position="last", kind="stable").index.to_numpy()
+        order = newest[np.argsort(codes[newest], kind="stable")]
+        index.paper_order = order[codes[order] >= 0]
+        index.paper_bounds = _bounds(codes[index.paper_order], len(index.keys))
+
+        # Distinct (paper, topic) assignments, counted per (author, topic, month)
+        topic_index = corpus.index(TOPIC)
+        index.topics = pd.Index(topic_index.labels, dtype=object)
+        month_of_paper, index.months = pd.factorize(papers[PERIOD], sort=True)
+        index.months = pd.DatetimeIndex(index.months, name=PERIOD)
+        assigned = pd.DataFrame({"paper": corpus.paper_ids, "topic": topic_index.codes()}).drop_duplicates()
+        paper = assigned["paper"].to_numpy()
+        counted = pd.DataFrame({"author": codes[paper], "topic": assigned["topic"].to_numpy(), "month": month_of_paper[paper]})
+        counted = counted[(counted["author"] >= 0) & (counted["topic"] >= 0) & (counted["month"] >= 0)]
+        counted = counted.groupby(["author", "topic", "month"]).size().reset_index(name="count")
+        index.author = counted["author"].to_numpy(np.int32)
+        index.topic = counted["topic"].to_numpy(np.int32)
+        index.month = counted["month"].to_numpy(np.int32)
+        index.count = counted["count"].to_numpy(np.int32)
+        index.author_bounds = _bounds(index.author, len(index.keys))
+        index._index_boards()
+        return index
+
+    def _index_boards(self):
+        # (topic, month) cells, each ordered by decreasing count then author
+        self.board_order = np.lexsort((self.author, -self.count, self.month, self.topic))
+        cells = self.topic[self.board_order].astype(np.int64) * len(self.months) + self.month[self.board_order]
+        self.board_bounds = _bounds(cells, len(self.topics) * len(self.months))
+
+    def save(self, directory):
+        artifacts.save_frame(pd.DataFrame({"key": self.keys, "name": self.names}), os.path.join(directory, "authors"))
+        artifacts.save_frame(pd.DataFrame({"topic": self.topics}), os.path.join(directory, "topics"))
+        artifacts.save_array(self.months.to_numpy(), os.path.join(directory, "months"))
+        for name in self.ARRAYS:
+            artifacts.save_array(getattr(self, name), os.path.join(directory, name))
+
+    @classmethod
+    def load(cls, directory):
+        index = cls.__new__(cls)
+        authors = artifacts.load_frame(os.path.join(directory, "authors"))
+        index.keys = pd.Index(authors["key"].astype(object))
+        index.names = pd.Index(authors["name"].astype(object))
+        index.topics = pd.Index(artifacts.load_frame(os.path.join(directory, "topics"))["topic"].astype(object))
+        index.months = pd.DatetimeIndex(np.asarray(artifacts.load_array(os.path.join(directory, "months"))), name=PERIOD)
+        for name in cls.ARRAYS:
+            setattr(index, name, artifacts.load_array(os.path.join(directory, name)))
+        return index
+
+    def __len__(self):
+        return len(self.keys)
+
+    def code(self, author):
+        """Code of ``author`` (any spelling), or -1."""
+        key = normalize_name(author)
+        position = self.keys.searchsorted(key)
+        return int(position) if position < len(self.keys) and self.keys[position] == key else -1
+
+    def paper_counts(self, codes=None):
+        counts = np.diff(self.paper_bounds)
+        return counts if codes is None else counts[codes]
+
+    def search(self, query="", limit=20):
+        """Authors whose normalized name starts with ``query`` (or contains it, if none does), most prolific first.
+
+        An empty query lists the most prolific authors of the corpus.
+        """
+        key = normalize_name(query)
+        if not key:
+            return self._table(np.argsort(-self.paper_counts(), kind="stable")[:limit])
+        start, stop = self.keys.searchsorted(key), self.keys.searchsorted(key + "\U0010ffff")
+        codes = np.arange(start, stop)
+        if len(codes) == 0:
+            codes = np.flatnonzero(self.keys.str.contains(key, regex=False))
+        codes = codes[np.argsort(-self.paper_counts(codes), kind="stable")[:limit]]
+        return self._table(codes)
+
+    def _table(self, codes):
+        return pd.DataFrame({"Submitter": self.names[codes], "Papers": self.paper_counts(codes)})
+
+    def papers(self, author):
+        """Paper ids (rows of the corpus's papers table) of ``author``, newest first."""
+        code = self.code(author)
+        if code < 0:
+            return np.empty(0, dtype=np.intp)
+        return self.paper_order[self.paper_bounds[code]:self.paper_bounds[code + 1]]
+
+    def trajectory(self, author, topics=None):
+        """Papers of ``author`` per month (rows, every month of the corpus) and topic (columns, most used first)."""
+        code = self.code(author)
+        cells = slice(self.author_bounds[code], self.author_bounds[code + 1]) if code >= 0 else slice(0, 0)
+        topic, month, count = self.topic[cells], self.month[cells], self.count[cells]
+        totals = np.bincount(topic, weights=count, minlength=len(self.topics))
+        used = np.flatnonzero(totals)
+        used = used[np.argsort(-totals[used], kind="stable")][:topics]
+        counts = np.zeros((len(self.months), len(used)), dtype=np.int64)
+        column = np.full(len(self.topics), -1)
+        column[used] = np.arange(len(used))
+        kept = column[topic] >= 0
+        np.add.at(counts, (month[kept], column[topic[kept]]), count[kept])
+        return pd.DataFrame(counts, index=self.months, columns=pd.Index(self.topics[used], name=TOPIC))
+
+    def leaderboard(self, topic, month=None, top=10):
+        """Most active submitters of ``topic``, in ``month`` (a date in it) or over all months."""
+        topic_code = self.topics.get_indexer([topic])[0]
+        if topic_code < 0:
+            return self._board(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int64))
+        if month is not None:
+            month_code = self.months.get_indexer([pd.Timestamp(month).to_period("M").start_time])[0]
+            if month_code < 0:
+                return self._board(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int64))
+            cell = topic_code * len(self.months) + month_code
+            cells = self.board_order[self.board_bounds[cell]:self.board_bounds[cell + 1]][:top]
+            return self._board(self.author[cells], self.count[cells])
+        # All months: the cells of the topic are contiguous, summed per author
+        cells = self.board_order[self.board_bounds[topic_code * len(self.months)]:self.board_bounds[(topic_code + 1) * len(self.months)]]
+        authors, inverse = np.unique(self.author[cells], return_inverse=True)
+        totals = np.bincount(inverse, weights=self.count[cells]).astype(np.int64)
+        best = np.lexsort((authors, -totals))[:top]
+        return self._board(authors[best], totals[best])
+
+    def monthly_leaders(self, topic, top=3):
+        """The ``top`` submitters of ``topic`` in every month: Month_Start, Rank, Submitter, Papers."""
+        topic_code = self.topics.get_indexer([topic])[0]
+        frames = []
+        if topic_code >= 0:
+            for month_code, month in enumerate(self.months):
+                cell = topic_code * len(self.months) + month_code
+                cells = self.board_order[self.board_bounds[cell]:self.board_bounds[cell + 1]][:top]
+                if len(cells):
+                    board = self._board(self.author[cells], self.count[cells])
+                    board.insert(0, PERIOD, month)
+                    frames.append(board)
+        if not frames:
+            return pd.DataFrame(columns=[PERIOD, "Rank", "Submitter", "Papers"])
+        return pd.concat(frames, ignore_index=True)
+
+    def _board(self, codes, counts):
+        return pd.DataFrame({"Rank": np.arange(1, len(codes) + 1), "Submitter": self.names[codes], "Papers": counts})
@@ -0,0 +1,260 @@
+"""Incremental build of every derived artifact the app reads.
+
+Each artifact is a node of a small DAG: the typed corpora, the topic embedding
+matrix, posting indexes, count trees, the submitter index, emerging scores,
+pre-rendered datamaps and the datamap projector. A node's key hashes its name, the ``llm_trends``
+source code, the content of its input files and the keys of the nodes it
+depends on, so a change anywhere upstream changes the key of everything
+downstream. The keys of the last successful build are kept in a manifest;
+only nodes whose key changed (or whose output files are missing) are rebuilt,
+and nodes whose dependencies are ready run in parallel worker processes.
+
+Most nodes store their result in the artifact cache (``llm_trends.artifacts``),
+where the app's loaders find it; the projector writes its own file. The source
+CSVs under ``data/`` are inputs and are not built here. Entries evicted from
+the cache since the last build are rebuilt by the app on first use, or by
+running with ``--force``.
+
+Usage:
+    python -m llm_trends.build                 # everything that is stale
+    python -m llm_trends.build emerging_scores --jobs 4
+    python -m llm_trends.build --dry-run
+    python -m llm_trends.build --list
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from llm_trends import analytics, artifacts, corpus, projection, trends
+from llm_trends.datamap import datamap_html
+from llm_trends.topic_assignment import NEW_PAPERS_PATH, TOPIC_EMBEDDINGS_PATH
+
+MANIFEST_PATH = "data/.build_manifest.json"
+
+# (corpus loader, column) of every series the Emerging Topics section scores, for each period
+EMERGING_SERIES = [
+    (corpus.load_domains, "Human_Readable_Topic"),
+    (corpus.load_domains, "Subdomain"),
+    (corpus.load_entities, "Entity"),
+]
+EMERGING_PERIODS = ["Month_Start", "week"]
+
+
+class Node:
+    def __init__(self, name, run, inputs=(), deps=(), outputs=(), description=""):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.deps = list(deps)
+        self.outputs = list(outputs)
+        self.description = description
+
+
+def _build_indexes(load, columns):
+    def run():
+        loaded = load()
+        for column in columns:
+            loaded.index(column)
+    return run
+
+
+def _build_count_tree():
+    corpus.load_domains().count_tree()
+
+
+def _build_time_pyramids():
+    corpus.load_llm_domain().time_pyramid("update_date")
+    corpus.load_entities().time_pyramid("Date", "Entity")
+    corpus.load_papers().time_pyramid("update_date", analytics.TOPIC_PATH)
+    corpus.load_domains().time_pyramid("update_date", analytics.TOPIC_PATH)
+
+
+def _build_author_index():
+    corpus.load_domains().authors()
+
+
+def _build_emerging_scores():
+    for load, column in EMERGING_SERIES:
+        for period in EMERGING_PERIODS:
+            trends.score_column(load(), column, period)
+
+
+def _build_datamaps():
+    # One map per (category, subdomain): what Topic Tracking shows after the first two clicks
+    papers = corpus.load_papers()
+    if "2d_coords" not in papers.columns:
+        return
+    hierarchy = papers.hierarchy()
+    for category in papers.unique("Categories"):
+        for subdomain in hierarchy.children("Subdomain", Categories=[category]):
+            datamap_html(papers, [category], [subdomain])
+
+
+def _build_projector():
+    projection.fit()
+
+
+NODES = {node.name: node for node in [
+    Node("papers", corpus.load_papers, inputs=[corpus.PAPERS_PATH, NEW_PAPERS_PATH],
+         description="normalized datamap paper corpus"),
+    Node("domains", corpus.load_domains, inputs=[corpus.DOMAINS_PATH, NEW_PAPERS_PATH],
+         description="normalized paper corpus with topic labels"),
+    Node("entities", corpus.load_entities, inputs=[corpus.ENTITIES_PATH], description="entity mentions"),
+    Node("llm_domain", corpus.load_llm_domain, inputs=[corpus.LLM_DOMAIN_PATH], description="LLM-related paper ids"),
+    Node("topic_embeddings", analytics.load_topic_embeddings, inputs=[TOPIC_EMBEDDINGS_PATH],
+         description="unit-length topic embedding matrix"),
+    Node("paper_indexes", _build_indexes(corpus.load_papers, corpus.HIERARCHY), deps=["papers"],
+         description="posting lists of the paper labels"),
+    Node("domain_indexes", _build_indexes(corpus.load_domains, corpus.HIERARCHY), deps=["domains"],
+         description="posting lists of the topic labels"),
+    Node("entity_index", _build_indexes(corpus.load_entities, ["Entity"]), deps=["entities"],
+         description="posting lists of the entities"),
+    Node("count_tree", _build_count_tree, deps=["domains"], description="monthly counts per topic path"),
+    Node("time_pyramids", _build_time_pyramids, deps=["llm_domain", "entities", "papers", "domains"],
+         description="daily to quarterly counts of papers, topic paths and entity mentions"),
+    Node("author_index", _build_author_index, deps=["domain_indexes"],
+         description="papers and topic counts per submitter"),
+    Node("emerging_scores", _build_emerging_scores, deps=["domain_indexes", "entity_index"],
+         description="growth and burst scores of topics, subdomains and entities"),
+    Node("datamaps", _build_datamaps, deps=["paper_indexes"], description="pre-rendered subdomain datamaps"),
+    Node("projector", _build_projector, inputs=[projection.CORPUS_PATH], outputs=[projection.PROJECTOR_PATH],
+         description="kNN projector placing new papers on the datamap (encodes the corpus)"),
+]}
+
+
+def with_dependencies(targets, nodes=NODES):
+    """``targets`` and everything they depend on, in dependency order."""
+    ordered = []
+
+    def visit(name, path=()):
+        if name in path:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + (name,))}")
+        if name in ordered:
+            return
+        if name not in nodes:
+            raise ValueError(f"Unknown node: {name}")
+        for dep in nodes[name].deps:
+            visit(dep, path + (name,))
+        ordered.append(name)
+
+    for target in targets:
+        visit(target)
+    return ordered
+
+
+def node_keys(order, nodes=NODES):
+    """Key of every node of ``order`` (dependencies first)."""
+    keys = {}
+    for name in order:
+        node = nodes[name]
+        description = {
+            "name": name,
+            "code": artifacts.code_version(),
+            "inputs": [artifacts.file_hash(path) for path in node.inputs],
+            "deps": [keys[dep] for dep in node.deps],
+        }
+        keys[name] = hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()[:32]
+    return keys
+
+
+def read_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(manifest, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    scratch = f"{path}.{os.getpid()}.tmp"
+    with open(scratch, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(scratch, path)
+
+
+def _run_node(name):
+    started = time.perf_counter()
+    NODES[name].run()
+    return time.perf_counter() - started
+
+
+def stale_nodes(order, keys, manifest, force=False, nodes=NODES):
+    return [
+        name for name in order
+        if force or manifest.get(name) != keys[name] or not all(os.path.exists(path) for path in nodes[name].outputs)
+    ]
+
+
+def build(targets=None, jobs=None, force=False, dry_run=False, manifest_path=MANIFEST_PATH):
+    """Rebuild the stale nodes among ``targets`` (all by default) and their dependencies.
+
+    Returns ``{node: (status, seconds, error)}`` with status ``fresh``,
+    ``stale`` (dry run), ``built``, ``failed`` or ``skipped`` (a dependency failed).
+    """
+    order = with_dependencies(targets or list(NODES))
+    keys = node_keys(order)
+    manifest = read_manifest(manifest_path)
+    stale = stale_nodes(order, keys, manifest, force)
+    report = {name: ("fresh", 0.0, None) for name in order if name not in stale}
+    if dry_run:
+        report.update({name: ("stale", 0.0, None) for name in stale})
+        return {name: report[name] for name in order}
+
+    pending = list(stale)
+    running = {}
+    with ProcessPoolExecutor(jobs) as pool:
+        while pending or running:
+            for name in list(pending):
+                statuses = [report.get(dep, ("pending",))[0] for dep in NODES[name].deps]
+                if any(status in ("failed", "skipped") for status in statuses):
+                    report[name] = ("skipped", 0.0, None)
+                    pending.remove(name)
+                elif all(status in ("fresh", "built") for status in statuses):
+                    running[pool.submit(_run_node, name)] = name
+                    pending.remove(name)
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    report[name] = ("built", future.result(), None)
+                except Exception as e:
+                    report[name] = ("failed", 0.0, e)
+                    continue
+                # Recorded as soon as a node is built, so an interrupted build resumes where it stopped
+                manifest[name] = keys[name]
+                _write_manifest(manifest, manifest_path)
+    return {name: report[name] for name in order}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the stale derived artifacts.")
+    parser.add_argument("targets", nargs="*", help="nodes to build, with their dependencies (default: all)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rebuild even the nodes that look fresh")
+    parser.add_argument("--dry-run", action="store_true", help="only list the stale nodes")
+    parser.add_argument("--list", action="store_true", help="list the nodes and their dependencies")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for node in NODES.values():
+            print(f"{node.name:18} {node.description}" + (f" (after {', '.join(node.deps)})" if node.deps else ""))
+        return
+
+    started = time.perf_counter()
+    report = build(args.targets, args.jobs, args.force, args.dry_run)
+    for name, (status, seconds, error) in report.items():
+        print(f"{name:18} {status:8} {seconds:>7.1f}s" + (f"  {type(error).__name__}: {error}" if error else ""))
+    print(f"{sum(status == 'built' for status, _, _ in report.values())} built in {time.perf_counter() - started:.1f}s")
+    if any(status == "failed" for status, _, _ in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""Read-only corpus objects shared by every session of the app.
+
+``st.cache_data`` hands each rerun its own copy of a cached DataFrame, and the
+sections then parse dates, drop rows and add columns on that copy, so every
+interaction copies the whole corpus again. A :class:`Corpus` is cleaned and
+typed once at load, cached with ``st.cache_resource`` so all sessions share the
+same object, and queried through row-index arrays: only the rows and columns a
+section actually displays are ever materialized.
+
+The paper corpora list a paper once per (category, subdomain, topic) it belongs
+to. :class:`PaperCorpus` stores them normalized instead: a papers table keyed by
+id holds the per-paper columns (title, abstract, ...) once, and a compact
+assignments table maps an integer paper id to its labels. Row ids of a
+``PaperCorpus`` are assignment rows, and paper columns are joined in on the
+integer ids only for the rows that get materialized.
+
+The loaders go through the on-disk artifact cache (``llm_trends.artifacts``):
+a corpus already built from the same file contents by any process is mapped
+back from its Arrow tables instead of being parsed from CSV again.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts, schema, tracing
+from llm_trends.aggregates import CountTree
+from llm_trends.authors import AuthorIndex
+from llm_trends.index import HierarchyIndex, PostingIndex, intersect
+from llm_trends.timeseries import TimePyramid
+from llm_trends.topic_assignment import NEW_PAPERS_PATH, with_new_papers
+
+PAPERS_PATH = "data/Datamap/Concatenated_LLM_Subdomains_embeddings.csv"
+DOMAINS_PATH = "data/LLM_related_domainss.csv"
+ENTITIES_PATH = "data/top_500_entity_data.csv"
+LLM_DOMAIN_PATH = "data/LLM_domain.csv"
+
+# Label hierarchy of the paper corpora, from the broadest level down
+HIERARCHY = ["Categories", "Subdomain", "Human_Readable_Topic"]
+
+# Columns that describe the paper itself rather than one of its topic assignments
+PAPER_COLUMNS = ["id", "update_date", "title", "abstract", "submitter", "week", "Month_Start"]
+
+
+def data_version(*paths):
+    """Cheap fingerprint of the input files, used to key caches on the data they were built from."""
+    digest = hashlib.sha1()
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        else:
+            digest.update(f"{path}:missing".encode())
+    return digest.hexdigest()[:16]
+
+
+def _column_list(column):
+    # The label column(s) of a time pyramid
+    if column is None:
+        return []
+    return list(column) if isinstance(column, tuple) else [column]
+
+
+def period_start(dates, freq):
+    """Start timestamp of the ``freq`` period (``"W"``, ``"M"``, ...) each date falls in."""
+    return dates.dt.to_period(freq).dt.start_time
+
+
+class Corpus:
+    """A cleaned, immutable table queried through sorted row-index arrays."""
+
+    def __init__(self, frame, version=None, source_columns=None):
+        self._frame = frame.reset_index(drop=True)
+        self.version = version
+        # Columns as read from disk, without the ones derived at load time
+        self.source_columns = list(frame.columns if source_columns is None else source_columns)
+        # Artifact key of the file contents the corpus was built from (set by the loaders)
+        self.content_key = None
+        self._memo = {}
+
+    def __len__(self):
+        return len(self._frame)
+
+    @property
+    def columns(self):
+        return self._frame.columns
+
+    def all_rows(self):
+        return np.arange(len(self._frame))
+
+    def values(self, column, rows=None):
+        """Read-only numpy array of a column, optionally restricted to ``rows``."""
+        values = self._frame[column].to_numpy()
+        values = values.view() if rows is None else values[rows]
+        values.flags.writeable = False
+        return values
+
+    def index(self, column):
+        """Posting lists of ``column``, built on first use and shared by every session."""
+        return self.persisted(
+            "posting_index",
+            lambda: PostingIndex(self.take(columns=[column])[column]),
+            PostingIndex.save,
+            PostingIndex.load,
+            column=column,
+        )
+
+    def hierarchy(self, levels=HIERARCHY):
+        """Parent -> child index over the label ``levels``."""
+        return self.memoize(("hierarchy", tuple(levels)), lambda: HierarchyIndex(self, levels))
+
+    def count_tree(self, levels=HIERARCHY):
+        """Monthly row counts over the label ``levels``, built once per corpus."""
+        return self.persisted(
+            "count_tree",
+            lambda: CountTree.build(self.take(columns=list(levels) + ["Month_Start"]), levels),
+            CountTree.save,
+            CountTree.load,
+            levels=tuple(levels),
+        )
+
+    def time_pyramid(self, date_column, column=None):
+        """Row counts per day, week, month and quarter of ``date_column`` (per label of ``column``), built once per corpus.
+
+        ``column`` may be a tuple of columns, to count per path of their labels.
+        """
+        return self.persisted(
+            "time_pyramid",
+            lambda: TimePyramid.build(self.values(date_column), self._pyramid_labels(column)),
+            TimePyramid.save,
+            TimePyramid.load,
+            date_column=date_column,
+            column=column,
+        )
+
+    def carry_over(self, previous):
+        """Extend the time pyramids and count trees built on ``previous``, an earlier version of this corpus, with the rows appended since.
+
+        Where rows were changed rather than only appended, they are rebuilt on first use as usual.
+        """
+        for key, built in list(previous._memo.items()):
+            params = dict(key[1:])
+            if key[0] == "time_pyramid":
+                columns = [params["date_column"]] + _column_list(params["column"])
+                counted, save, load = built.rows, TimePyramid.save, TimePyramid.load
+                extend = lambda appended, built=built, params=params: built.add(
+                    self.values(params["date_column"], appended), self._pyramid_labels(params["column"], appended)
+                )
+            elif key[0] == "count_tree":
+                # A count tree counts every row of its corpus
+                columns = list(params["levels"]) + ["Month_Start"]
+                counted, save, load = len(previous), CountTree.save, CountTree.load
+                extend = lambda appended, built=built, columns=columns: built.add(self.take(appended, columns))
+            else:
+                continue
+            kept = np.arange(counted)
+            if counted > len(self) or not all(
+                pd.Series(self.values(c, kept)).equals(pd.Series(previous.values(c, kept))) for c in columns
+            ):
+                continue
+            appended = np.arange(counted, len(self))
+            self.persisted(key[0], lambda extend=extend, appended=appended: extend(appended), save, load, **params)
+
+    def _pyramid_labels(self, column, rows=None):
+        if column is None:
+            return None
+        if isinstance(column, tuple):
+            return self.take(rows, list(column)).reset_index(drop=True)
+        return self.values(column, rows)
+
+    def rows_where(self, rows=None, **conditions):
+        """Sorted row ids whose columns are in the given collections, e.g. ``rows_where(Categories=[...])``.
+
+        A scalar condition matches by equality. ``rows`` restricts the search to
+        an existing (sorted) selection. Categorical columns are resolved through
+        their posting lists, other columns by a scan of the selected rows.
+        """
+        scanned = {}
+        for column, wanted in conditions.items():
+            if schema.is_categorical(self._frame[column]):
+                matched = self.index(column).rows(_as_list(wanted))
+                rows = matched if rows is None else intersect(np.asarray(rows), matched)
+            else:
+                scanned[column] = wanted
+        if not scanned:
+            return self.all_rows() if rows is None else np.asarray(rows)
+        frame = self._frame if rows is None else self._frame.iloc[rows]
+        selected = np.flatnonzero(_match(frame, scanned))
+        return selected if rows is None else np.asarray(rows)[selected]
+
+    def unique(self, column, rows=None):
+        """Distinct values of ``column`` in order of first appearance."""
+        series = self._frame[column] if rows is None else self._frame[column].iloc[rows]
+        return series.unique().tolist()
+
+    def memoize(self, key, compute):
+        """Return ``compute()``, computed once per corpus and shared by every session."""
+        tracing.cache_lookup("corpus_memo", key in self._memo)
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def persisted(self, name, compute, save, load, **params):
+        """Like :meth:`memoize`, and also kept in the on-disk artifact cache, keyed by the corpus contents.
+
+        ``save(value, directory)`` and ``load(directory)`` serialize the value.
+        """
+        def compute_or_load():
+            if self.content_key is None:
+                return compute()
+            return artifacts.cached(name, [], compute, save, load, params={"corpus": self.content_key, **params})
+
+        return self.memoize((name,) + tuple(sorted(params.items())), compute_or_load)
+
+    def distinct_rows(self, subset, rows=None):
+        """Row ids keeping the first row of every distinct ``subset`` combination."""
+        subset = [subset] if isinstance(subset, str) else list(subset)
+        rows = self.all_rows() if rows is None else np.asarray(rows)
+        return rows[~self._frame[subset].iloc[rows].duplicated().to_numpy()]
+
+    def take(self, rows=None, columns=None):
+        """Materialize the given rows (all by default) and columns as a new DataFrame."""
+        frame = self._frame if columns is None else self._frame[list(columns)]
+        if rows is None:
+            # Shallow copy: callers may add columns without touching the shared frame
+            return frame.copy(deep=False)
+        return frame.take(np.asarray(rows))
+
+
+class PaperCorpus(Corpus):
+    """Normalized paper corpus: one row per paper plus an integer paper -> labels mapping."""
+
+    def __init__(self, papers, assignments, version=None, source_columns=None):
+        super().__init__(assignments, version, source_columns)
+        self.papers = papers.reset_index(drop=True)
+        # Integer paper id (row of ``papers``) of every assignment row
+        self.paper_ids = assignments["paper"].to_numpy()
+        self._columns = pd.Index(self.source_columns + [c for c in ["week", "Month_Start"] if c not in self.source_columns])
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def _is_paper_column(self, column):
+        return column in self.papers.columns
+
+    def _paper_rows(self, rows):
+        return self.paper_ids if rows is None else self.paper_ids[np.asarray(rows)]
+
+    def values(self, column, rows=None):
+        if not self._is_paper_column(column):
+            return super().values(column, rows)
+        values = self.papers[column].to_numpy()[self._paper_rows(rows)]
+        values.flags.writeable = False
+        return values
+
+    def rows_where(self, rows=None, **conditions):
+        paper_conditions = {column: conditions.pop(column) for column in list(conditions) if self._is_paper_column(column)}
+        rows = super().rows_where(rows, **conditions)
+        if paper_conditions:
+            # Paper columns are tested once per paper, then mapped onto the assignment rows
+            paper_mask = _match(self.papers, paper_conditions)
+            rows = rows[paper_mask[self.paper_ids[rows]]]
+        return rows
+
+    def unique(self, column, rows=None):
+        if not self._is_paper_column(column):
+            return super().unique(column, rows)
+        return pd.unique(self.values(column, rows)).tolist()
+
+    def authors(self):
+        """Submitter index: each author's papers and paper counts per topic and month, built once per corpus."""
+        return self.persisted("author_index", lambda: AuthorIndex.build(self), AuthorIndex.save, AuthorIndex.load)
+
+    def codes(self, column):
+        """Integer code of ``column`` for every assignment row: equal values share a code."""
+        if column == "id":
+            return self.paper_ids
+        if self._is_paper_column(column):
+            paper_codes = self.memoize(("codes", column), lambda: pd.factorize(self.papers[column])[0])
+            return paper_codes[self.paper_ids]
+        series = self._frame[column]
+        if schema.is_categorical(series):
+            return series.cat.codes.to_numpy()
+        return self.memoize(("codes", column), lambda: pd.factorize(series)[0])
+
+    def distinct_rows(self, subset, rows=None):
+        """Row ids keeping the first row of every distinct ``subset`` combination, compared on integer codes."""
+        subset = [subset] if isinstance(subset, str) else list(subset)
+        rows = self.all_rows() if rows is None else np.asarray(rows)
+        keys = pd.DataFrame({column: self.codes(column)[rows] for column in subset})
+        return rows[~keys.duplicated().to_numpy()]
+
+    def take(self, rows=None, columns=None):
+        """Join the paper columns onto the given assignment rows, in the source column order by default."""
+        rows = self.all_rows() if rows is None else np.asarray(rows)
+        paper_rows = self.paper_ids[rows]
+        data = {}
+        for column in self._columns if columns is None else columns:
+            if self._is_paper_column(column):
+                data[column] = self.papers[column].take(paper_rows).array
+            else:
+                data[column] = self._frame[column].take(rows).array
+        return pd.DataFrame(data, index=rows)
+
+
+def _as_list(wanted):
+    if not isinstance(wanted, (list, tuple, set, np.ndarray, pd.Index, pd.Series)):
+        return [wanted]
+    return list(wanted)
+
+
+def _match(frame, conditions):
+    """Boolean mask of the rows of ``frame`` whose columns are in the wanted values."""
+    mask = np.ones(len(frame), dtype=bool)
+    for column, wanted in conditions.items():
+        series = frame[column]
+        if schema.is_categorical(series):
+            codes = series.cat.categories.get_indexer(_as_list(wanted))
+            mask &= np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+        else:
+            mask &= series.isin(_as_list(wanted)).to_numpy()
+    return mask
+
+
+def _add_dates(frame, date_column):
+    frame[date_column] = pd.to_datetime(frame[date_column], errors="coerce")
+    frame["week"] = period_start(frame[date_column], "W")
+    frame["Month_Start"] = period_start(frame[date_column], "M")
+    return frame
+
+
+def _build(frame, date_column, version, drop_invalid_dates):
+    source_columns = list(frame.columns)
+    frame = _add_dates(frame, date_column)
+    if drop_invalid_dates:
+        frame = frame.dropna(subset=[date_column])
+    return Corpus(frame, version, source_columns)
+
+
+def normalize(frame, version=None):
+    """Split a concatenated paper frame into a :class:`PaperCorpus`; rows without an id are dropped."""
+    source_columns = list(frame.columns)
+    # A row without an id belongs to no paper: factorize would give it code -1, i.e. the last paper
+    frame = frame[frame["id"].notna().to_numpy()].reset_index(drop=True)
+    paper_ids, unique_ids = pd.factorize(frame["id"])
+    assert (paper_ids >= 0).all()
+    paper_columns = [column for column in PAPER_COLUMNS if column in frame.columns]
+
+    # First row of every paper, ordered by its integer id
+    first_rows = np.full(len(unique_ids), -1, dtype=np.int64)
+    first_rows[paper_ids[::-1]] = np.arange(len(frame))[::-1]
+    papers = _add_dates(frame[paper_columns].take(first_rows).reset_index(drop=True), "update_date")
+
+    assignments = frame.drop(columns=paper_columns)
+    assignments.insert(0, "paper", paper_ids.astype(np.int32))
+    return PaperCorpus(papers, assignments, version, source_columns)
+
+
+def _save_corpus(corpus, directory):
+    if isinstance(corpus, PaperCorpus):
+        artifacts.save_frame(corpus.papers, os.path.join(directory, "papers"))
+    artifacts.save_frame(corpus._frame, os.path.join(directory, "rows"))
+    with open(os.path.join(directory, "corpus.json"), "w") as f:
+        json.dump({"normalized": isinstance(corpus, PaperCorpus), "source_columns": corpus.source_columns}, f)
+
+
+def _load_corpus(directory, version):
+    with open(os.path.join(directory, "corpus.json")) as f:
+        meta = json.load(f)
+    rows = artifacts.load_frame(os.path.join(directory, "rows"))
+    if meta["normalized"]:
+        papers = artifacts.load_frame(os.path.join(directory, "papers"))
+        return PaperCorpus(papers, rows, version, meta["source_columns"])
+    return Corpus(rows, version, meta["source_columns"])
+
+
+def _cached_corpus(name, inputs, build):
+    # The version stays the local stat-based fingerprint, which is what the in-process caches key on
+    version = data_version(*inputs)
+    with tracing.span("data.load", source=name, path=inputs[0]):
+        corpus = artifacts.cached(
+            name, inputs, lambda: build(version), _save_corpus, lambda directory: _load_corpus(directory, version)
+        )
+    corpus.content_key = artifacts.artifact_key(name, inputs)
+    return corpus
+
+
+def load_papers(path=PAPERS_PATH):
+    """The concatenated subdomain corpus used by the datamap and paper views."""
+    return _cached_corpus(
+        "paper_corpus",
+        [path, NEW_PAPERS_PATH],
+        lambda version: normalize(with_new_papers(schema.read_csv(path, schema.PAPERS)), version),
+    )
+
+
+def load_domains(path=DOMAINS_PATH):
+    """Papers with their (Categories, Subdomain, Human_Readable_Topic) labels."""
+    return _cached_corpus(
+        "paper_corpus",
+        [path, NEW_PAPERS_PATH],
+        lambda version: normalize(with_new_papers(schema.read_csv(path, schema.PAPERS)), version),
+    )
+
+
+def load_entities(path=ENTITIES_PATH):
+    """One row per (Entity, Date) mention, with invalid dates dropped."""
+    return _cached_corpus(
+        "entity_corpus",
+        [path],
+        lambda version: _build(schema.read_csv(path, schema.ENTITIES), "Date", version, drop_invalid_dates=True),
+    )
+
+
+def load_llm_domain(path=LLM_DOMAIN_PATH):
+    """Ids and update dates of every LLM-related paper on ArXiv."""
+    return _cached_corpus(
+        "llm_domain_corpus",
+        [path],
+        lambda version: _build(schema.read_csv(path, schema.LLM_DOMAIN), "update_date", version, drop_invalid_dates=True),
+    )
@@ -0,0 +1,73 @@
+"""Interactive datamaps of a selection of subdomains, rendered once and kept on disk.
+
+Rendering a map with datamapplot takes seconds and produces a few hundred KB of
+HTML that only depends on the selected rows. :func:`datamap_html` keeps the
+result in the artifact cache under the corpus contents and the selection, so
+every session, replica and restart reuses it, and ``python -m llm_trends.build``
+can render the common selections ahead of time.
+"""
+
+import os
+
+from llm_trends import artifacts, tracing
+from llm_trends.projection import parse_coords
+
+MAP_COLUMNS = ["title", "2d_coords", "Human_Readable_Topic"]
+
+
+def render_html(frame, subdomains):
+    """HTML of the interactive datamap of ``frame`` (title, 2d_coords and topic columns)."""
+    # datamapplot pulls in matplotlib and numba, so only import it once a map is drawn
+    import matplotlib
+    matplotlib.rcParams["figure.dpi"] = 72
+    import datamapplot as dmp
+
+    # Newly assigned papers only get a map position once they have been projected
+    df_mapped = frame.dropna(subset=["2d_coords"])
+    # The '2d_coords' column holds "[x, y]" strings
+    with tracing.span("datamap.coords", rows=len(df_mapped)):
+        coords_array = parse_coords(df_mapped["2d_coords"])
+    labels_array = df_mapped["Human_Readable_Topic"].to_numpy()
+    hover_data = df_mapped["title"].tolist()
+    with tracing.span("datamap.plot", rows=len(df_mapped)):
+        plot = dmp.create_interactive_plot(
+            coords_array,
+            labels_array,
+            hover_text=hover_data,
+            font_family="Playfair Display SC",
+            title=f"Datamap for Subdomain(s): {', '.join(subdomains)}",
+            sub_title="An interactive visualization of selected data",
+            logo="https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/ArXiv_logo_2022.svg/320px-ArXiv_logo_2022.svg.png",
+            enable_search=True,
+            darkmode=True,
+        )
+    with tracing.span("datamap.html"):
+        if hasattr(plot, "to_html"):
+            return plot.to_html()
+        # Save the plot to an HTML file and read it back
+        plot.save("subdomain_plot.html")
+        with open("subdomain_plot.html", "r") as f:
+            return f.read()
+
+
+def _save_html(html_content, directory):
+    with open(os.path.join(directory, "datamap.html"), "w") as f:
+        f.write(html_content)
+
+
+def _load_html(directory):
+    with open(os.path.join(directory, "datamap.html")) as f:
+        return f.read()
+
+
+def datamap_html(corpus, categories, subdomains):
+    """Datamap of the papers of ``subdomains`` within ``categories``, from the artifact cache when possible."""
+    def render():
+        rows = corpus.rows_where(corpus.rows_where(Categories=categories), Subdomain=subdomains)
+        return render_html(corpus.take(rows, MAP_COLUMNS), subdomains)
+
+    if corpus.content_key is None:
+        return render()
+    # Not memoized on the corpus: maps are large and there is one per selection
+    params = {"corpus": corpus.content_key, "categories": list(categories), "subdomains": list(subdomains)}
+    return artifacts.cached("datamap_html", [], render, _save_html, _load_html, params)
@@ -0,0 +1,138 @@
+"""Topics and papers related to a whole document, matched offline.
+
+Topic Discovery's default path reduces an uploaded PDF to a guessed title and
+abstract and asks the LLM for topics. This module uses the full text instead
+and needs no LLM call: the text is split into overlapping chunks of words, all
+chunks are encoded in large batches, and each topic is scored against every
+chunk through one matrix product with the topic embedding matrix.
+
+Chunk similarities are aggregated per topic in one of two ways:
+
+* ``max``: the best chunk. This favours topics that one section treats in depth.
+* ``mean``: the average over the chunks. This favours topics present
+  throughout the document.
+
+Related papers are those of the best topics, ranked by their topic's score.
+
+Usage:
+    python -m llm_trends.documents paper.pdf --aggregation max --top 10
+"""
+
+import argparse
+import re
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import tracing
+from llm_trends.topic_assignment import DEFAULT_BATCH_SIZE, encode_texts
+
+AGGREGATIONS = ["max", "mean"]
+# About 200 word pieces: all-MiniLM-L6-v2 truncates its input at 256
+CHUNK_WORDS = 150
+CHUNK_OVERLAP = 30
+
+_REFERENCES = re.compile(r"\n\s*(references|bibliography)\s*\n", re.IGNORECASE)
+
+
+def extract_text(file):
+    """Text of every page of a PDF (a path or a file object)."""
+    # PyPDF2 is only needed when a PDF is actually read
+    from PyPDF2 import PdfReader
+
+    return "\n".join(page.extract_text() or "" for page in PdfReader(file).pages)
+
+
+def clean_text(text):
+    """``text`` without its reference list, words split across lines rejoined."""
+    found = list(_REFERENCES.finditer(text))
+    # The last heading: earlier matches may be in the table of contents
+    if found and found[-1].start() > len(text) // 2:
+        text = text[:found[-1].start()]
+    return re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+
+
+def chunk_text(text, words=CHUNK_WORDS, overlap=CHUNK_OVERLAP):
+    """Overlapping windows of ``words`` words covering ``text``; at least one chunk for non-empty text."""
+    tokens = text.split()
+    step = max(words - overlap, 1)
+    starts = range(0, max(len(tokens) - overlap, 1), step)
+    return [" ".join(tokens[start:start + words]) for start in starts if tokens[start:start + words]]
+
+
+def encode_chunks(model, chunks, batch_size=DEFAULT_BATCH_SIZE):
+    """Unit-length embeddings of ``chunks``, ``batch_size`` chunks per forward pass."""
+    return encode_texts(model, chunks, batch_size=batch_size)
+
+
+def score_topics(chunk_embeddings, topics, topic_embeddings, aggregation="max"):
+    """Score of every topic against the chunks, best first.
+
+    Columns: ``Human_Readable_Topic``, ``Score`` (aggregated cosine similarity),
+    ``Best_Chunk`` (index of the closest chunk) and ``Chunks`` (number of chunks
+    for which it is the closest topic).
+    """
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation: {aggregation}")
+    similarities = chunk_embeddings @ topic_embeddings.T
+    scores = similarities.max(axis=0) if aggregation == "max" else similarities.mean(axis=0)
+    nearest = np.bincount(similarities.argmax(axis=1), minlength=len(topics))
+    table = pd.DataFrame({
+        "Human_Readable_Topic": topics,
+        "Score": scores,
+        "Best_Chunk": similarities.argmax(axis=0),
+        "Chunks": nearest,
+    })
+    # A topic may have several embedding rows: keep its best one
+    table = table.sort_values(["Score", "Chunks"], ascending=False, kind="stable")
+    return table.drop_duplicates("Human_Readable_Topic").reset_index(drop=True)
+
+
+def match_document(model, text, topics, topic_embeddings, aggregation="max", top_n=5):
+    """``(topic scores, chunks)`` of a document's text; the scores keep the ``top_n`` best topics."""
+    chunks = chunk_text(clean_text(text))
+    if not chunks:
+        return pd.DataFrame(columns=["Human_Readable_Topic", "Score", "Best_Chunk", "Chunks"]), chunks
+    with tracing.span("document.match", chunks=len(chunks), aggregation=aggregation):
+        scores = score_topics(encode_chunks(model, chunks), topics, topic_embeddings, aggregation)
+    return scores.head(top_n), chunks
+
+
+def related_rows(corpus, topic_scores):
+    """Distinct papers of the scored topics, as ``(rows, scores)`` ordered by their best topic's score."""
+    rows = corpus.rows_where(Human_Readable_Topic=topic_scores["Human_Readable_Topic"].tolist())
+    score_of = dict(zip(topic_scores["Human_Readable_Topic"], topic_scores["Score"]))
+    scores = np.array([score_of[topic] for topic in corpus.values("Human_Readable_Topic", rows)], dtype=np.float32)
+    # Best-scored assignment of each paper first, so deduplicating on id keeps it; newer papers first on ties
+    order = np.lexsort((-corpus.values("update_date", rows).astype("datetime64[ns]").astype(np.int64), -scores))
+    rows, scores = rows[order], scores[order]
+    kept = np.isin(rows, corpus.distinct_rows("id", rows))
+    return rows[kept], scores[kept]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match a PDF against the topic taxonomy without an LLM.")
+    parser.add_argument("pdf")
+    parser.add_argument("--aggregation", choices=AGGREGATIONS, default="max")
+    parser.add_argument("--top", type=int, default=10, help="number of topics")
+    parser.add_argument("--papers", type=int, default=10, help="number of related papers to list")
+    args = parser.parse_args(argv)
+
+    from llm_trends import analytics, corpus
+    from llm_trends.topic_assignment import load_model
+
+    topics, topic_embeddings = analytics.load_topic_embeddings()
+    scores, chunks = match_document(
+        load_model(), extract_text(args.pdf), topics, topic_embeddings, args.aggregation, args.top
+    )
+    print(f"{len(chunks)} chunks, {args.aggregation}-sim")
+    print(scores.to_string(index=False))
+    domains = corpus.load_domains()
+    rows, paper_scores = related_rows(domains, scores)
+    papers = domains.take(rows[:args.papers], ["title", "id", "Human_Readable_Topic"])
+    papers.insert(0, "Score", paper_scores[:args.papers].round(3))
+    print(papers.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
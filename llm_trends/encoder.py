@@ -0,0 +1,86 @@
+"""Cross-session micro-batching for sentence-transformer encodes.
+
+Every Topic Discovery run encodes a handful of topics, and concurrent sessions
+each call ``model.encode`` on their own tiny batch: the per-call overhead
+dominates and the calls contend for the same CPU threads. A
+:class:`BatchingEncoder` owns the model and a worker thread. Callers enqueue
+their texts and block; the worker waits at most ``max_wait`` seconds for more
+requests to arrive, encodes everything it collected (up to ``max_batch``
+texts, or one larger request) in one call, at most ``max_batch`` texts per
+forward pass, and hands each caller its own rows back.
+
+The encoder has the ``encode`` signature the rest of the code uses, so it can
+stand in for the model wherever one is expected.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from llm_trends import tracing
+
+DEFAULT_MAX_BATCH = 128
+DEFAULT_MAX_WAIT = 0.005
+
+
+class BatchingEncoder:
+    """Merge concurrent ``encode`` calls into micro-batches run on one worker thread."""
+
+    def __init__(self, model, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._requests = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="batching-encoder", daemon=True)
+        self._worker.start()
+
+    def encode(self, texts, batch_size=None, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        """Embeddings of ``texts`` (one row per text), encoded together with other callers' texts."""
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        future = Future()
+        with tracing.span("embedding.encode", texts=len(texts)):
+            self._requests.put((texts, future))
+            embeddings = future.result()
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms == 0, 1.0, norms)
+        return embeddings[0] if single else embeddings
+
+    def _collect(self):
+        """Block for one request, then gather more until the batch is full or ``max_wait`` has passed."""
+        batch = [self._requests.get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            try:
+                with tracing.span("embedding.batch", texts=len(texts), requests=len(batch)):
+                    embeddings = self.model.encode(texts, batch_size=min(len(texts), self.max_batch), convert_to_numpy=True)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            start = 0
+            for request_texts, future in batch:
+                future.set_result(embeddings[start:start + len(request_texts)])
+                start += len(request_texts)
@@ -0,0 +1,162 @@
+"""Serialization of the paper tables offered for download, and bulk exports.
+
+Every format writes the same table, without the index. CSV is written in
+chunks of rows and gzip with a fixed timestamp, so a file written chunk by
+chunk is byte-for-byte the download the app offers for the same selection.
+
+The command line writes one file per topic (or subdomain) with the columns
+and names of the Topic Tracking export, across a pool of worker processes.
+Each worker streams its files in chunks of ``--chunk-rows`` rows, so memory
+stays bounded by the chunk size rather than the largest topic.
+
+Usage:
+    python -m llm_trends.exports --by topic --format "CSV (gzip)" --output exports/ --workers 4
+"""
+
+import argparse
+import gzip
+import io
+import multiprocessing
+import os
+import re
+
+from llm_trends import tracing
+from llm_trends.corpus import PAPERS_PATH, load_papers
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+# Format name -> (file extension, MIME type)
+FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+}
+if pyarrow is not None:
+    FORMATS["Parquet"] = ("parquet", "application/vnd.apache.parquet")
+
+# Columns of the paper exports and their user-friendly names
+PAPER_EXPORT_COLUMNS = {
+    "id": "URL",
+    "update_date": "Update Date",
+    "title": "Title",
+    "abstract": "Abstract",
+    "Human_Readable_Topic": "Topic",
+    "Categories": "Domain",
+    "submitter": "Submitter",
+    "Subdomain": "Subdomain",
+}
+
+# Label column each bulk export is split by
+SPLIT_COLUMNS = {"topic": "Human_Readable_Topic", "subdomain": "Subdomain"}
+CHUNK_ROWS = 2000
+
+
+def file_name(stem, fmt):
+    """``stem`` with the extension of ``fmt``, replacing a trailing ``.csv``."""
+    if stem.endswith(".csv"):
+        stem = stem[:-len(".csv")]
+    return f"{stem}.{FORMATS[fmt][0]}"
+
+
+def paper_export(corpus, rows):
+    """The given rows with the export columns, renamed."""
+    return corpus.take(rows, list(PAPER_EXPORT_COLUMNS)).rename(columns=PAPER_EXPORT_COLUMNS)
+
+
+def _gzip_writer(fileobj):
+    # No file name and a fixed mtime in the header: identical input gives identical bytes
+    return gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, mtime=0)
+
+
+def write_csv(chunks, fileobj):
+    """Write an iterable of frames to ``fileobj`` as one CSV, the header taken from the first."""
+    for i, chunk in enumerate(chunks):
+        fileobj.write(chunk.to_csv(index=False, header=i == 0).encode("utf-8"))
+
+
+def to_bytes(frame, fmt="CSV"):
+    """``frame`` serialized in one of :data:`FORMATS`."""
+    buffer = io.BytesIO()
+    with tracing.span("export", format=fmt, rows=len(frame)):
+        if fmt == "CSV":
+            write_csv([frame], buffer)
+        elif fmt == "CSV (gzip)":
+            with _gzip_writer(buffer) as compressed:
+                write_csv([frame], compressed)
+        elif fmt == "Parquet":
+            frame.to_parquet(buffer, index=False)
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
+    return buffer.getvalue()
+
+
+def write_export(corpus, rows, path, fmt, chunk_rows=CHUNK_ROWS):
+    """Write the paper export of ``rows`` to ``path``, materializing ``chunk_rows`` rows at a time."""
+    chunks = (paper_export(corpus, rows[start:start + chunk_rows]) for start in range(0, max(len(rows), 1), chunk_rows))
+    with open(path, "wb") as f:
+        if fmt == "CSV":
+            write_csv(chunks, f)
+        elif fmt == "CSV (gzip)":
+            with _gzip_writer(f) as compressed:
+                write_csv(chunks, compressed)
+        else:
+            # Parquet is written in one piece so the file matches the in-app download
+            f.write(to_bytes(paper_export(corpus, rows), fmt))
+
+
+def safe_name(label):
+    return re.sub(r"[^\w.-]+", "_", str(label)).strip("_")[:120] or "unnamed"
+
+
+# Corpus of each worker process: inherited from the parent when forked, loaded once otherwise
+_corpus = None
+
+
+def _init_worker(papers_path):
+    global _corpus
+    if _corpus is None:
+        _corpus = load_papers(papers_path)
+
+
+def _export_label(task):
+    column, label, path, fmt, chunk_rows = task
+    rows = _corpus.rows_where(**{column: label})
+    write_export(_corpus, rows, path, fmt, chunk_rows)
+    return label, len(rows), path
+
+
+def export_all(by, output, fmt="CSV", workers=None, chunk_rows=CHUNK_ROWS, papers_path=PAPERS_PATH):
+    """Write one export per label of the ``by`` column under ``output``; yields ``(label, rows, path)``."""
+    global _corpus
+    column = SPLIT_COLUMNS[by]
+    _corpus = load_papers(papers_path)
+    os.makedirs(output, exist_ok=True)
+    tasks = [
+        (column, label, os.path.join(output, file_name(safe_name(label), fmt)), fmt, chunk_rows)
+        for label in _corpus.unique(column) if isinstance(label, str)
+    ]
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(papers_path,)) as pool:
+        yield from pool.imap_unordered(_export_label, tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write one paper export per topic or subdomain.")
+    parser.add_argument("--by", choices=list(SPLIT_COLUMNS), default="topic")
+    parser.add_argument("--format", choices=list(FORMATS), default="CSV")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--papers", default=PAPERS_PATH)
+    args = parser.parse_args(argv)
+
+    total_files = total_rows = 0
+    for label, n_rows, path in export_all(args.by, args.output, args.format, args.workers, args.chunk_rows, args.papers):
+        total_files += 1
+        total_rows += n_rows
+    print(f"Wrote {total_files} {args.by} export(s), {total_rows} rows, to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Inverted indexes from label values to the rows that carry them.
+
+Filtering a categorical column with ``isin`` scans every row of the corpus on
+every widget change. A :class:`PostingIndex` is built once per column: the row
+ids are sorted by label code, so the rows of any label are a contiguous slice
+(its posting list, in increasing row order). Selections are then resolved by
+union and intersection of posting lists, and cost grows with the size of the
+result rather than with the size of the corpus.
+
+:class:`HierarchyIndex` adds the Categories -> Subdomain -> Topic structure on
+top, so the options of a child selector are listed from the distinct label
+paths without touching rows.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts, schema
+
+
+def _codes(series):
+    if schema.is_categorical(series):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, labels = pd.factorize(series)
+    return codes, pd.Index(labels)
+
+
+def intersect(rows, other):
+    """Intersection of two sorted row-id arrays, probing the smaller one into the larger."""
+    if len(rows) > len(other):
+        rows, other = other, rows
+    if len(rows) == 0:
+        return rows
+    positions = np.minimum(np.searchsorted(other, rows), len(other) - 1)
+    return rows[other[positions] == rows]
+
+
+class PostingIndex:
+    """Sorted row ids of every label of a column."""
+
+    def __init__(self, series):
+        codes, self.labels = _codes(series)
+        self._lookup = {label: code for code, label in enumerate(self.labels)}
+        # Stable sort keeps the rows of each label in increasing order
+        self._order = np.argsort(codes, kind="stable")
+        self._bounds = np.searchsorted(codes[self._order], np.arange(len(self.labels) + 1))
+
+    def save(self, directory):
+        artifacts.save_frame(pd.DataFrame({"label": self.labels}), os.path.join(directory, "labels"))
+        artifacts.save_array(self._order, os.path.join(directory, "order"))
+        artifacts.save_array(self._bounds, os.path.join(directory, "bounds"))
+
+    @classmethod
+    def load(cls, directory):
+        index = cls.__new__(cls)
+        index.labels = pd.Index(artifacts.load_frame(os.path.join(directory, "labels"))["label"])
+        index._lookup = {label: code for code, label in enumerate(index.labels)}
+        index._order = artifacts.load_array(os.path.join(directory, "order"))
+        index._bounds = np.asarray(artifacts.load_array(os.path.join(directory, "bounds")))
+        return index
+
+    def __contains__(self, label):
+        return label in self._lookup
+
+    def code(self, label):
+        return self._lookup.get(label, -1)
+
+    def codes(self):
+        """Label code of every row (-1 for missing values), rebuilt from the posting lists."""
+        codes = np.full(len(self._order), -1, dtype=np.int32)
+        codes[self._order[self._bounds[0]:]] = np.repeat(np.arange(len(self.labels), dtype=np.int32), self.counts())
+        return codes
+
+    def counts(self):
+        """Number of rows of every label, in the order of ``labels``."""
+        return np.diff(self._bounds)
+
+    def rows_of_code(self, code):
+        return self._order[self._bounds[code]:self._bounds[code + 1]]
+
+    def rows(self, labels):
+        """Sorted union of the posting lists of ``labels`` (unknown labels match nothing)."""
+        codes = [self._lookup[label] for label in labels if label in self._lookup]
+        if len(codes) == 1:
+            return self.rows_of_code(codes[0])
+        # Posting lists are disjoint, so their sorted concatenation is the union
+        return np.sort(np.concatenate([self.rows_of_code(code) for code in codes] or [np.empty(0, dtype=np.intp)]))
+
+
+class HierarchyIndex:
+    """Posting lists for each level of a label hierarchy, plus the distinct label paths."""
+
+    def __init__(self, corpus, levels):
+        self.levels = list(levels)
+        self.postings = {level: corpus.index(level) for level in self.levels}
+        # Distinct (level 0, level 1, ...) code paths in order of first appearance, so children keep the corpus order
+        paths = pd.DataFrame({level: self.postings[level].codes() for level in self.levels}).drop_duplicates()
+        self._paths = {level: paths[level].to_numpy() for level in self.levels}
+
+    def children(self, level, **ancestors):
+        """Labels of ``level`` under the given ancestor labels, in corpus order.
+
+        E.g. ``children("Subdomain", Categories=[...])``; levels not given are unrestricted.
+        """
+        mask = np.ones(len(self._paths[level]), dtype=bool)
+        for ancestor, labels in ancestors.items():
+            if isinstance(labels, str):
+                labels = [labels]
+            wanted = [code for code in map(self.postings[ancestor].code, labels) if code >= 0]
+            mask &= np.isin(self._paths[ancestor], wanted)
+        codes = pd.unique(self._paths[level][mask])
+        return self.postings[level].labels[codes[codes >= 0]].tolist()
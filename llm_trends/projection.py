@@ -0,0 +1,249 @@
+"""Place new papers on the existing 2D datamap without recomputing the layout.
+
+The ``2d_coords`` column comes from a one-off projection of each subdomain.
+New papers are placed by kNN-weighted interpolation: each one lands at the
+similarity-weighted mean of the coordinates of its ``k`` nearest existing
+papers in the same subdomain. Because the layout itself never changes, maps
+that were already rendered stay valid.
+
+Interpolation only works while new papers look like the ones the layout was
+built from. ``drift_report`` compares each new paper's nearest-neighbour
+similarity to the same statistic within the original corpus and recommends a
+full re-layout once too many new papers fall outside it.
+
+``fit --quantization int8`` (or ``binary``) stores the base embeddings as
+compact codes searched in memory, with the float vectors kept in a side
+directory written by ``QuantizedIndex.save``, memory-mapped and only read to
+rescore candidates (see ``llm_trends.quantization``).
+
+Usage:
+    python -m llm_trends.projection fit
+    python -m llm_trends.projection fit --quantization int8
+    python -m llm_trends.projection project
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends.quantization import MODES, QuantizedIndex
+from llm_trends.topic_assignment import NEW_PAPERS_PATH, _normalize_rows, encode_texts, load_model, paper_texts, write_csv
+
+CORPUS_PATH = "data/Datamap/Concatenated_LLM_Subdomains_embeddings.csv"
+PROJECTOR_PATH = "data/Datamap/projector.npz"
+DRIFT_REPORT_PATH = "data/Datamap/projection_drift.json"
+
+DEFAULT_K = 15
+WEIGHT_TEMPERATURE = 0.05
+# Fraction of new papers allowed below the corpus' 5th-percentile neighbour similarity
+OUT_OF_DISTRIBUTION_LIMIT = 0.2
+# Share of the map made of interpolated points before the layout is considered stale
+NEW_POINT_SHARE_LIMIT = 0.1
+_REFERENCE_SAMPLE = 2000
+
+
+def parse_coords(values):
+    """Turn the ``"[x, y]"`` strings stored in the CSV into an ``(n, 2)`` array."""
+    return np.array([json.loads(value) for value in values], dtype=np.float32).reshape(-1, 2)
+
+
+def format_coords(coords):
+    return [f"[{x!r}, {y!r}]" for x, y in np.asarray(coords, dtype=np.float64).tolist()]
+
+
+class KNNProjector:
+    """kNN interpolation from embedding space into the precomputed 2D layout."""
+
+    def __init__(self, embeddings, coords, subdomains, k=DEFAULT_K, reference_similarity=None, index=None):
+        # With a quantized index, the embeddings are its (possibly memory-mapped) float vectors
+        self.index = index
+        self.embeddings = index.vectors if index is not None else _normalize_rows(embeddings)
+        self.coords = np.asarray(coords, dtype=np.float32)
+        self.subdomains = np.asarray(subdomains, dtype=object)
+        self.k = k
+        self._groups = {
+            subdomain: np.flatnonzero(self.subdomains == subdomain) for subdomain in pd.unique(self.subdomains)
+        }
+        if reference_similarity is None:
+            reference_similarity = self._reference_similarity()
+        self.reference_similarity = float(reference_similarity)
+
+    def _neighbours(self, embeddings, subdomain, exclude_self=False):
+        """Return ``(row_ids, similarities)`` of the nearest base rows, best first."""
+        rows = self._groups.get(subdomain)
+        if rows is None or len(rows) == 0:
+            rows = np.arange(len(self.embeddings))
+        if self.index is not None and not exclude_self:
+            return self.index.search(embeddings, self.k, rows=rows)
+        similarities = embeddings @ np.asarray(self.embeddings[rows], dtype=np.float32).T
+        if exclude_self:
+            similarities[similarities >= 1.0 - 1e-6] = -np.inf
+        k = min(self.k, len(rows))
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        top_sim = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_sim, axis=1)
+        return rows[np.take_along_axis(top, order, axis=1)], np.take_along_axis(top_sim, order, axis=1)
+
+    def _reference_similarity(self):
+        # 5th percentile of nearest-neighbour similarity inside the original corpus
+        rng = np.random.default_rng(0)
+        sample = rng.choice(len(self.embeddings), size=min(_REFERENCE_SAMPLE, len(self.embeddings)), replace=False)
+        nearest = np.empty(len(sample), dtype=np.float32)
+        for subdomain in pd.unique(self.subdomains[sample]):
+            mask = self.subdomains[sample] == subdomain
+            queries = np.asarray(self.embeddings[sample[mask]], dtype=np.float32)
+            _, similarities = self._neighbours(queries, subdomain, exclude_self=True)
+            nearest[mask] = similarities[:, 0]
+        nearest = nearest[np.isfinite(nearest)]
+        return np.percentile(nearest, 5) if len(nearest) else 0.0
+
+    def transform(self, embeddings, subdomains):
+        """Return ``(coords, nearest_similarity)`` for new embeddings.
+
+        Papers without a subdomain are placed among the neighbours found in the whole corpus.
+        """
+        embeddings = _normalize_rows(embeddings)
+        codes, labels = pd.factorize(np.asarray(subdomains, dtype=object))
+        coords = np.zeros((len(embeddings), 2), dtype=np.float32)
+        nearest = np.zeros(len(embeddings), dtype=np.float32)
+        groups = [(codes == code, subdomain) for code, subdomain in enumerate(labels)]
+        if (codes < 0).any():
+            groups.append((codes < 0, None))
+        for mask, subdomain in groups:
+            rows, similarities = self._neighbours(embeddings[mask], subdomain)
+            # Softmax over similarities so a near-duplicate neighbour dominates the placement
+            weights = np.exp((similarities - similarities[:, :1]) / WEIGHT_TEMPERATURE)
+            weights /= weights.sum(axis=1, keepdims=True)
+            coords[mask] = np.einsum("nk,nkd->nd", weights, self.coords[rows])
+            nearest[mask] = similarities[:, 0]
+        return coords, nearest
+
+    def drift_report(self, nearest_similarity, total_new_points=None):
+        """Summarize how far the interpolated points are from the fitted layout."""
+        nearest_similarity = np.asarray(nearest_similarity)
+        total_new_points = len(nearest_similarity) if total_new_points is None else total_new_points
+        out_of_distribution = float(np.mean(nearest_similarity < self.reference_similarity)) if len(nearest_similarity) else 0.0
+        new_point_share = total_new_points / max(len(self.embeddings), 1)
+        return {
+            "new_points": int(total_new_points),
+            "layout_points": int(len(self.embeddings)),
+            "new_point_share": round(new_point_share, 4),
+            "out_of_distribution_share": round(out_of_distribution, 4),
+            "reference_similarity": round(self.reference_similarity, 4),
+            "relayout_recommended": bool(
+                out_of_distribution > OUT_OF_DISTRIBUTION_LIMIT or new_point_share > NEW_POINT_SHARE_LIMIT
+            ),
+        }
+
+    def save(self, path=PROJECTOR_PATH):
+        if self.index is None:
+            # Float32 like the quantized index's vectors, so loaded neighbours and similarities match the fitted ones
+            vectors = {"embeddings": self.embeddings.astype(np.float32)}
+        else:
+            # Codes and float vectors go to uncompressed .npy files so that load can memory-map the vectors
+            self.index.save(_index_path(path))
+            vectors = {"quantization": self.index.mode}
+        np.savez_compressed(
+            path,
+            coords=self.coords,
+            subdomains=self.subdomains.astype(str),
+            k=self.k,
+            reference_similarity=self.reference_similarity,
+            **vectors,
+        )
+
+    @classmethod
+    def load(cls, path=PROJECTOR_PATH):
+        with np.load(path) as stored:
+            index = embeddings = None
+            if "quantization" in stored:
+                index = QuantizedIndex.load(_index_path(path), str(stored["quantization"]))
+            else:
+                embeddings = stored["embeddings"].astype(np.float32)
+            return cls(
+                embeddings,
+                stored["coords"],
+                stored["subdomains"].astype(object),
+                k=int(stored["k"]),
+                reference_similarity=float(stored["reference_similarity"]),
+                index=index,
+            )
+
+
+def _index_path(path):
+    return os.path.splitext(path)[0] + "_index"
+
+
+def load_drift_report(path=DRIFT_REPORT_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def fit(corpus_path=CORPUS_PATH, output=PROJECTOR_PATH, k=DEFAULT_K, model=None, quantization=None):
+    """Embed the existing corpus once and store it alongside its 2D coordinates."""
+    df = pd.read_csv(corpus_path, usecols=["id", "title", "abstract", "Subdomain", "2d_coords"])
+    df = df.dropna(subset=["2d_coords"]).reset_index(drop=True)
+
+    # Papers repeat once per subdomain, so only encode each distinct paper once
+    codes, unique_ids = pd.factorize(df["id"])
+    first_rows = df.drop_duplicates(subset="id").set_index("id").loc[unique_ids]
+    paper_embeddings = encode_texts(model or load_model(), paper_texts(first_rows))
+
+    embeddings = _normalize_rows(paper_embeddings[codes])
+    index = QuantizedIndex.build(embeddings, quantization) if quantization else None
+    projector = KNNProjector(embeddings, parse_coords(df["2d_coords"]), df["Subdomain"], k=k, index=index)
+    projector.save(output)
+    return projector
+
+
+def project(new_papers_path=NEW_PAPERS_PATH, projector_path=PROJECTOR_PATH,
+            report_path=DRIFT_REPORT_PATH, model=None):
+    """Fill in ``2d_coords`` for new papers that don't have a position yet."""
+    projector = KNNProjector.load(projector_path)
+    new_papers = pd.read_csv(new_papers_path)
+    if "2d_coords" not in new_papers.columns:
+        new_papers["2d_coords"] = np.nan
+    # Read as floats when no paper is placed yet; the placed ones are "[x, y]" strings
+    new_papers["2d_coords"] = new_papers["2d_coords"].astype(object)
+
+    pending = new_papers["2d_coords"].isna()
+    if pending.any():
+        embeddings = encode_texts(model or load_model(), paper_texts(new_papers[pending]))
+        coords, nearest = projector.transform(embeddings, new_papers.loc[pending, "Subdomain"])
+        new_papers.loc[pending, "2d_coords"] = format_coords(coords)
+        new_papers.loc[pending, "neighbour_similarity"] = nearest
+        write_csv(new_papers, new_papers_path)
+
+    # Placed by an earlier run that recorded no similarity (or nothing placed at all): no column
+    similarities = new_papers.get("neighbour_similarity", pd.Series(dtype=np.float32))
+    report = projector.drift_report(similarities.dropna(), total_new_points=len(new_papers))
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Out-of-sample placement of new papers on the datamap.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    fit_parser = subparsers.add_parser("fit", help="embed the corpus and store the projector")
+    fit_parser.add_argument("--corpus", default=CORPUS_PATH)
+    fit_parser.add_argument("--k", type=int, default=DEFAULT_K)
+    fit_parser.add_argument("--quantization", choices=MODES, help="store the embeddings as int8 or binary codes")
+    subparsers.add_parser("project", help="place new papers and update the drift report")
+    args = parser.parse_args(argv)
+
+    if args.command == "fit":
+        projector = fit(args.corpus, k=args.k, quantization=args.quantization)
+        print(f"Stored projector over {len(projector.embeddings)} points in {PROJECTOR_PATH}.")
+    else:
+        report = project()
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
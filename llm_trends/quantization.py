@@ -0,0 +1,182 @@
+"""Compact embedding storage with exact rescoring.
+
+Float32 embeddings of ``all-MiniLM-L6-v2`` take 1.5 KB per paper. A
+:class:`QuantizedIndex` keeps only a compact code per vector in memory:
+
+* ``int8``: each dimension scaled into [-127, 127] (4x smaller than float32).
+* ``binary``: one sign bit per dimension, packed (32x smaller), compared by
+  Hamming distance.
+
+A search scores every vector on its code, keeps ``k * oversample`` candidates
+and rescores only those against the full-precision vectors, which can stay on
+disk as a memory-mapped ``.npy`` file. ``recall_at_k`` measures how many of the
+exact float neighbours survive the first pass.
+
+Usage:
+    python -m llm_trends.quantization data/Datamap/projector.npz --mode int8 --k 10
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+MODES = ["int8", "binary"]
+DEFAULT_OVERSAMPLE = 4
+_BLOCK_ROWS = 65536
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:  # numpy < 2.0
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(values):
+        return _POPCOUNT_TABLE[values.view(np.uint8)].reshape(values.shape + (-1,)).sum(axis=-1)
+
+
+def _words(packed):
+    """View packed bits as 64-bit words when the row length allows, so popcounts run 8 bytes at a time."""
+    packed = np.ascontiguousarray(packed)
+    return packed.view(np.uint64) if packed.shape[1] % 8 == 0 else packed
+
+
+def quantize_int8(embeddings):
+    """Return ``(codes, scale)`` with ``embeddings ~= codes * scale``, one scale per dimension."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    scale = np.abs(embeddings).max(axis=0) / 127.0
+    scale[scale == 0] = 1.0
+    codes = np.clip(np.rint(embeddings / scale), -127, 127).astype(np.int8)
+    return codes, scale.astype(np.float32)
+
+
+def pack_binary(embeddings):
+    """Sign bits of every dimension, packed eight to a byte."""
+    return np.packbits(np.asarray(embeddings) > 0, axis=1)
+
+
+class QuantizedIndex:
+    """First-pass search on quantized codes, exact rescoring on the float vectors."""
+
+    def __init__(self, codes, vectors, mode="int8", scale=None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown quantization mode: {mode}")
+        self.codes = codes
+        # Full-precision vectors, only read for the candidates of each query (may be a memmap)
+        self.vectors = vectors
+        self.mode = mode
+        self.scale = scale
+
+    @classmethod
+    def build(cls, embeddings, mode="int8"):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if mode == "int8":
+            codes, scale = quantize_int8(embeddings)
+            return cls(codes, embeddings, mode, scale)
+        return cls(pack_binary(embeddings), embeddings, mode)
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def code_bytes(self):
+        return self.codes.nbytes + (self.scale.nbytes if self.scale is not None else 0)
+
+    def approximate_scores(self, queries, rows=None):
+        """First-pass scores of ``queries`` against every indexed vector (or ``rows``); higher is closer."""
+        queries = np.asarray(queries, dtype=np.float32)
+        codes = self.codes if rows is None else self.codes[rows]
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        if self.mode == "int8":
+            # Asymmetric: float queries against int8 codes, folding the per-dimension scale into the query
+            scaled = (queries * self.scale).T
+            for start in range(0, len(codes), _BLOCK_ROWS):
+                block = codes[start:start + _BLOCK_ROWS].astype(np.float32)
+                scores[:, start:start + len(block)] = (block @ scaled).T
+        else:
+            packed = _words(pack_binary(queries))
+            n_bits = self.vectors.shape[1]
+            # Keep the (queries x rows x words) XOR buffer to a few million words
+            block_rows = max(1, (1 << 22) // (len(queries) * packed.shape[1]))
+            for start in range(0, len(codes), block_rows):
+                block = _words(codes[start:start + block_rows])
+                distance = _popcount(packed[:, None, :] ^ block[None, :, :]).sum(axis=2, dtype=np.int32)
+                scores[:, start:start + len(block)] = n_bits - 2 * distance
+        return scores
+
+    def search(self, queries, k=10, oversample=DEFAULT_OVERSAMPLE, rows=None):
+        """Return ``(ids, similarities)`` of the ``k`` nearest vectors per query, best first.
+
+        ``ids`` index the full index even when ``rows`` restricts the search;
+        ``similarities`` are exact dot products with the float vectors.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        rows = np.arange(len(self.codes)) if rows is None else np.asarray(rows)
+        k = min(k, len(rows))
+        n_candidates = min(len(rows), max(k, k * oversample))
+        scores = self.approximate_scores(queries, rows)
+        candidates = np.argpartition(-scores, n_candidates - 1, axis=1)[:, :n_candidates]
+
+        ids = np.empty((len(queries), k), dtype=np.int64)
+        similarities = np.empty((len(queries), k), dtype=np.float32)
+        for i, query in enumerate(queries):
+            # Read the candidates' vectors in storage order, which is friendlier to a memmap
+            candidate_ids = np.sort(rows[candidates[i]])
+            exact = np.asarray(self.vectors[candidate_ids], dtype=np.float32) @ query
+            best = np.argsort(-exact)[:k]
+            ids[i], similarities[i] = candidate_ids[best], exact[best]
+        return ids, similarities
+
+    def save(self, directory):
+        """Write the codes and the float32 vectors as ``.npy`` files under ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, f"codes_{self.mode}.npy"), self.codes)
+        # Float32, as they are the exact scores: memory-mapped, their size costs disk rather than RAM
+        np.save(os.path.join(directory, "vectors.npy"), np.asarray(self.vectors, dtype=np.float32))
+        if self.scale is not None:
+            np.save(os.path.join(directory, "scale.npy"), self.scale)
+
+    @classmethod
+    def load(cls, directory, mode="int8", mmap_vectors=True):
+        """Load an index; the float vectors are memory-mapped so only the codes take up RAM."""
+        vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r" if mmap_vectors else None)
+        codes = np.load(os.path.join(directory, f"codes_{mode}.npy"))
+        scale = np.load(os.path.join(directory, "scale.npy")) if mode == "int8" else None
+        return cls(codes, vectors, mode, scale)
+
+
+def exact_search(vectors, queries, k=10):
+    """Brute-force float search: the baseline the quantized search is measured against."""
+    scores = np.asarray(queries, dtype=np.float32) @ np.asarray(vectors, dtype=np.float32).T
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+
+
+def recall_at_k(index, queries, k=10, oversample=DEFAULT_OVERSAMPLE):
+    """Share of the exact top-``k`` neighbours that the quantized search returns."""
+    expected = exact_search(index.vectors, queries, k)
+    found, _ = index.search(queries, k, oversample)
+    hits = [len(np.intersect1d(e, f)) for e, f in zip(expected, found)]
+    return float(np.sum(hits)) / expected.size
+
+
+def main(argv=None):
+    from llm_trends.projection import PROJECTOR_PATH, KNNProjector
+
+    parser = argparse.ArgumentParser(description="Recall and memory of quantized search over stored embeddings.")
+    parser.add_argument("projector", nargs="?", default=PROJECTOR_PATH)
+    parser.add_argument("--mode", choices=MODES, default="int8")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--oversample", type=int, default=DEFAULT_OVERSAMPLE)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    vectors = np.asarray(KNNProjector.load(args.projector).embeddings, dtype=np.float32)
+    index = QuantizedIndex.build(vectors, args.mode)
+    queries = vectors[np.random.default_rng(0).choice(len(vectors), size=min(args.queries, len(vectors)), replace=False)]
+    recall = recall_at_k(index, queries, args.k, args.oversample)
+    print(f"{args.mode}: {index.code_bytes / 2**20:.1f} MB of codes vs {vectors.nbytes / 2**20:.1f} MB float32, "
+          f"recall@{args.k} = {recall:.3f} (oversample {args.oversample})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Hot reload of the corpora when a new data version is published.
+
+A :class:`DataVersions` owns the corpora of one process as an immutable
+:class:`Snapshot`: the data version of every source and the corpora loaded
+so far. A watcher thread polls the (cheap, stat-based) versions of the input
+files; when they change, the corpora in use are loaded and warmed in the
+background into a new snapshot, which then replaces the current one with a
+single reference assignment. Sources whose files did not change are carried
+over as they are; a changed corpus that only had rows appended extends the
+time pyramids of its previous version instead of recounting them.
+
+A caller pins the current snapshot for the duration of a unit of work (a
+Streamlit rerun, an API request), so everything it reads comes from one
+version even if a swap happens meanwhile; the next unit of work sees the new
+version. An old snapshot is freed as soon as the last unit of work pinned to
+it finishes.
+"""
+
+import contextlib
+import hashlib
+import json
+import threading
+import time
+import warnings
+
+from llm_trends import corpus
+
+DEFAULT_INTERVAL = 30.0
+
+# Loader and input files of every corpus
+SOURCES = {
+    "papers": (corpus.load_papers, [corpus.PAPERS_PATH, corpus.NEW_PAPERS_PATH]),
+    "domains": (corpus.load_domains, [corpus.DOMAINS_PATH, corpus.NEW_PAPERS_PATH]),
+    "entities": (corpus.load_entities, [corpus.ENTITIES_PATH]),
+    "llm_domain": (corpus.load_llm_domain, [corpus.LLM_DOMAIN_PATH]),
+}
+
+
+class Snapshot:
+    """Corpora of one data version, loaded on first use."""
+
+    def __init__(self, sources, versions, loaded=None, warm=None):
+        self.sources = sources
+        self.versions = versions
+        # One fingerprint for the whole snapshot, e.g. to key caches of results that mix sources
+        self.version = hashlib.sha1(json.dumps(versions, sort_keys=True).encode()).hexdigest()[:16]
+        self.warm = warm or {}
+        self._loaded = dict(loaded or {})
+        self._locks = {name: threading.Lock() for name in sources}
+
+    def loaded(self):
+        return dict(self._loaded)
+
+    def get(self, name, previous=None):
+        """Corpus ``name``, loaded on first use; ``previous`` is its version in the snapshot being replaced."""
+        if name not in self._loaded:
+            with self._locks[name]:
+                if name not in self._loaded:
+                    load, _ = self.sources[name]
+                    value = load()
+                    if previous is not None:
+                        value.carry_over(previous)
+                    if name in self.warm:
+                        self.warm[name](value)
+                    self._loaded[name] = value
+        return self._loaded[name]
+
+
+class DataVersions:
+    """The current :class:`Snapshot`, swapped atomically when the input files change.
+
+    ``warm`` maps a source name to a function run on a freshly loaded corpus
+    (building its indexes, say) before any caller can see it.
+    """
+
+    def __init__(self, sources=SOURCES, interval=DEFAULT_INTERVAL, warm=None):
+        self.sources = sources
+        self.interval = interval
+        self.warm = warm or {}
+        self.current = Snapshot(sources, self._versions(), warm=self.warm)
+        self.swaps = 0
+        self._pinned = threading.local()
+        self._refresh_lock = threading.Lock()
+        self._watcher = None
+
+    def _versions(self):
+        return {name: corpus.data_version(*paths) for name, (_, paths) in self.sources.items()}
+
+    def get(self, name):
+        """Corpus ``name`` from the snapshot pinned by this thread, or the current one."""
+        return (getattr(self._pinned, "snapshot", None) or self.current).get(name)
+
+    @contextlib.contextmanager
+    def pinned(self):
+        """Read every corpus of the ``with`` block from the snapshot current at its start."""
+        previous = getattr(self._pinned, "snapshot", None)
+        self._pinned.snapshot = previous or self.current
+        try:
+            yield self._pinned.snapshot
+        finally:
+            self._pinned.snapshot = previous
+
+    def refresh(self):
+        """Load the changed sources that are in use into a new snapshot and swap it in; True if swapped."""
+        with self._refresh_lock:
+            old = self.current
+            versions = self._versions()
+            if versions == old.versions:
+                return False
+            unchanged = {name: value for name, value in old.loaded().items() if versions[name] == old.versions[name]}
+            new = Snapshot(self.sources, versions, unchanged, self.warm)
+            # Load before swapping, so no rerun waits for the new version or finds its caches cold
+            for name, previous in old.loaded().items():
+                new.get(name, previous)
+            self.current = new
+            self.swaps += 1
+            return True
+
+    def watch(self):
+        """Poll for new data versions every ``interval`` seconds on a daemon thread."""
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name="data-versions", daemon=True)
+            self._watcher.start()
+        return self
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                # A half-published or broken data version: keep serving the current one and retry later
+                warnings.warn(f"Could not load the new data version: {e}")
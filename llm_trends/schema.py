@@ -0,0 +1,74 @@
+"""Column types for the paper and entity tables.
+
+Labels such as ``Categories``, ``Subdomain`` and ``Human_Readable_Topic``
+repeat tens of thousands of times, so they are loaded as dictionary-encoded
+categoricals: one small integer code per row plus a single copy of each label.
+Filters and groupbys on them then run on the integer codes. Long free text
+(titles, abstracts) is stored as Arrow-backed strings when pyarrow is
+installed, which avoids one Python object per cell.
+"""
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow
+    TEXT = "string[pyarrow]"
+except ImportError:
+    pyarrow = None
+    TEXT = object
+
+CATEGORY = "category"
+
+PAPERS = {
+    "id": TEXT,
+    "update_date": TEXT,
+    "title": TEXT,
+    "abstract": TEXT,
+    "Human_Readable_Topic": CATEGORY,
+    "Categories": CATEGORY,
+    "submitter": CATEGORY,
+    "Subdomain": CATEGORY,
+    "2d_coords": TEXT,
+}
+
+ENTITIES = {
+    "Entity": CATEGORY,
+    "Date": TEXT,
+}
+
+LLM_DOMAIN = {
+    "id": TEXT,
+    "update_date": TEXT,
+}
+
+
+def read_csv(path, schema, **kwargs):
+    """``pd.read_csv`` with the schema's types applied to the columns present in the file."""
+    columns = pd.read_csv(path, nrows=0).columns
+    dtype = {column: kind for column, kind in schema.items() if column in columns}
+    frame = pd.read_csv(path, dtype=dtype, **kwargs)
+    if pyarrow is not None:
+        # The parser's intermediate buffers would otherwise stay in Arrow's memory pool
+        pyarrow.default_memory_pool().release_unused()
+    return frame
+
+
+def concat(frames, schema):
+    """Concatenate frames read with ``schema`` without losing the categorical encoding.
+
+    A plain ``pd.concat`` turns categoricals with different categories into
+    object columns; here their categories are unioned instead.
+    """
+    frames = [frame.copy(deep=False) for frame in frames if frame is not None]
+    columns = [column for column in frames[0].columns if schema.get(column) == CATEGORY]
+    for column in columns:
+        present = [frame for frame in frames if column in frame.columns]
+        union = union_categoricals([frame[column].astype(CATEGORY) for frame in present]).categories
+        for frame in present:
+            frame[column] = frame[column].astype(pd.CategoricalDtype(union))
+    return pd.concat(frames, ignore_index=True)
+
+
+def is_categorical(series):
+    return isinstance(series.dtype, pd.CategoricalDtype)
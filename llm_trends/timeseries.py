@@ -0,0 +1,180 @@
+"""Precomputed row counts per day, week, month and quarter.
+
+The trend charts used to bucket the rows by week on every visit and plot
+every bucket of the whole history. A :class:`TimePyramid` counts the rows of
+a corpus once, per label and day, and sums the days into weeks, months and
+quarters. Every level is a dense ``(labels, periods)`` int32 array starting
+at the ordinal of its first period, so any date range of any level is one
+slice.
+
+A chart asks :meth:`TimePyramid.resolution_for` for the finest level that
+keeps its range within ``MAX_POINTS`` periods, so the points it draws stay
+bounded however many years the history covers. Periods cut by the range are
+recounted from the days inside it.
+
+Labels can also be paths of several columns (a ``MultiIndex``), e.g. the
+(category, subdomain, topic) of every row, so a selection of paths is summed
+from the pyramid rather than regrouped from the rows.
+
+Pyramids are immutable; :meth:`TimePyramid.add` folds rows appended to the
+corpus into a new pyramid without recounting the others.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts
+
+# Pandas period frequencies, finest first; weeks start on Monday like the corpora's "week" column
+RESOLUTIONS = {"day": "D", "week": "W", "month": "M", "quarter": "Q"}
+MAX_POINTS = 400
+TOTAL = "Count"
+
+
+def _ordinal(timestamp, resolution):
+    return pd.Period(pd.Timestamp(timestamp), RESOLUTIONS[resolution]).ordinal
+
+
+def _periods(first, n, resolution):
+    freq = RESOLUTIONS[resolution]
+    return pd.period_range(pd.Period(ordinal=first, freq=freq), periods=n, freq=freq)
+
+
+class TimePyramid:
+    """Row counts per label (rows) and period (columns) at every resolution of ``RESOLUTIONS``."""
+
+    def __init__(self, labels, first, counts, rows):
+        self.labels = labels
+        # Ordinal of the first period and counts of every resolution
+        self.first = first
+        self.counts = counts
+        # Number of corpus rows counted, so appended rows can be added later
+        self.rows = rows
+
+    @classmethod
+    def build(cls, dates, labels=None):
+        """Count ``dates`` (per label of ``labels``, or in one ``TOTAL`` series); missing dates and labels are left out.
+
+        ``labels`` given as a DataFrame counts per path of its columns; there a
+        missing label is a path component like any other.
+        """
+        days = np.asarray(dates, dtype="datetime64[ns]")
+        valid = ~np.isnat(days)
+        if labels is None:
+            codes, names = np.zeros(len(days), dtype=np.int64), pd.Index([TOTAL], dtype=object)
+        elif isinstance(labels, pd.DataFrame):
+            codes, names = pd.MultiIndex.from_frame(labels.astype(object)).factorize(sort=True)
+            names = names.set_names(list(labels.columns))
+        else:
+            codes, names = pd.factorize(np.asarray(labels, dtype=object), sort=True)
+            names = pd.Index(names, dtype=object)
+            valid &= codes >= 0
+        days = days[valid].astype("datetime64[D]").astype(np.int64)
+        codes = codes[valid]
+
+        first_day = int(days.min()) if len(days) else 0
+        n_days = int(days.max()) - first_day + 1 if len(days) else 0
+        day_counts = np.bincount(codes * n_days + (days - first_day), minlength=len(names) * n_days)
+        first, counts = {"day": first_day}, {"day": day_counts.reshape(len(names), n_days).astype(np.int32)}
+        # Coarser levels: consecutive days summed into their (contiguous) periods
+        day_range = pd.to_datetime(np.arange(first_day, first_day + n_days), unit="D")
+        for resolution, freq in list(RESOLUTIONS.items())[1:]:
+            ordinals = day_range.to_period(freq).asi8
+            starts = np.flatnonzero(np.diff(ordinals, prepend=ordinals[:1] - 1))
+            first[resolution] = int(ordinals[0]) if n_days else 0
+            counts[resolution] = (
+                np.add.reduceat(counts["day"], starts, axis=1) if n_days else np.zeros((len(names), 0), dtype=np.int32)
+            )
+        return cls(names, first, counts, len(valid))
+
+    def add(self, dates, labels=None):
+        """A new pyramid with ``dates`` (rows appended to the counted ones) counted in as well."""
+        added = TimePyramid.build(dates, labels)
+        names = self.labels.append(added.labels.difference(self.labels))
+        first, counts = {}, {}
+        for resolution in RESOLUTIONS:
+            parts = [
+                (pyramid.first[resolution], pyramid.counts[resolution], names.get_indexer(pyramid.labels))
+                for pyramid in (self, added) if pyramid.counts[resolution].shape[1]
+            ]
+            first[resolution] = min((start for start, _, _ in parts), default=0)
+            stop = max((start + part.shape[1] for start, part, _ in parts), default=0)
+            counts[resolution] = np.zeros((len(names), stop - first[resolution]), dtype=np.int32)
+            for start, part, rows in parts:
+                offset = start - first[resolution]
+                counts[resolution][rows, offset:offset + part.shape[1]] += part
+        return TimePyramid(names, first, counts, self.rows + added.rows)
+
+    def save(self, directory):
+        if isinstance(self.labels, pd.MultiIndex):
+            labels = self.labels.to_frame(index=False)
+        else:
+            labels = pd.DataFrame({"label": self.labels})
+        artifacts.save_frame(labels, os.path.join(directory, "labels"))
+        artifacts.save_array(np.array([self.rows] + [self.first[resolution] for resolution in RESOLUTIONS]),
+                             os.path.join(directory, "offsets"))
+        for resolution in RESOLUTIONS:
+            artifacts.save_array(self.counts[resolution], os.path.join(directory, resolution))
+
+    @classmethod
+    def load(cls, directory):
+        labels = artifacts.load_frame(os.path.join(directory, "labels")).astype(object)
+        labels = pd.Index(labels["label"]) if list(labels.columns) == ["label"] else pd.MultiIndex.from_frame(labels)
+        offsets = np.asarray(artifacts.load_array(os.path.join(directory, "offsets"))).tolist()
+        counts = {resolution: artifacts.load_array(os.path.join(directory, resolution)) for resolution in RESOLUTIONS}
+        return cls(labels, dict(zip(RESOLUTIONS, offsets[1:])), counts, offsets[0])
+
+    def span(self):
+        """First and last counted day, or ``(None, None)`` when nothing was counted."""
+        if not self.counts["day"].shape[1]:
+            return None, None
+        days = _periods(self.first["day"], self.counts["day"].shape[1], "day")
+        return days[0].start_time, days[-1].start_time
+
+    def _window(self, start, end, resolution):
+        # Columns of the periods overlapping [start, end]
+        first, n = self.first[resolution], self.counts[resolution].shape[1]
+        lo = 0 if start is None else min(max(_ordinal(start, resolution) - first, 0), n)
+        hi = n if end is None else min(max(_ordinal(end, resolution) - first + 1, lo), n)
+        return lo, hi
+
+    def resolution_for(self, start=None, end=None, max_points=MAX_POINTS):
+        """Finest resolution with at most ``max_points`` periods between ``start`` and ``end``."""
+        for resolution in RESOLUTIONS:
+            lo, hi = self._window(start, end, resolution)
+            if hi - lo <= max_points:
+                return resolution
+        return resolution
+
+    def series(self, labels=None, start=None, end=None, resolution="day"):
+        """Counts of the days between ``start`` and ``end`` (inclusive) per period (rows) and label (columns).
+
+        Every period overlapping the range is listed, by its start date, empty
+        ones included. ``labels`` defaults to all of them; unknown ones are left out.
+        """
+        codes = np.arange(len(self.labels)) if labels is None else self.labels.get_indexer(list(labels))
+        codes = codes[codes >= 0]
+        lo, hi = self._window(start, end, resolution)
+        counts = self.counts[resolution][codes, lo:hi].astype(np.int64)
+        if resolution != "day" and hi > lo and (start is not None or end is not None):
+            # Periods cut by the range: recount them from the days inside it
+            first_day = self.first["day"]
+            day_lo, day_hi = self._window(start, end, "day")
+            for column in {0, hi - lo - 1}:
+                period = pd.Period(ordinal=self.first[resolution] + lo + column, freq=RESOLUTIONS[resolution])
+                days = slice(
+                    max(period.asfreq("D", "start").ordinal - first_day, day_lo),
+                    max(min(period.asfreq("D", "end").ordinal - first_day + 1, day_hi), day_lo),
+                )
+                counts[:, column] = self.counts["day"][codes, days].sum(axis=1)
+        periods = _periods(self.first[resolution] + lo, hi - lo, resolution).start_time.rename("Period")
+        columns = self.labels[codes]
+        if not isinstance(columns, pd.MultiIndex):
+            columns = pd.Index(columns, dtype=object)
+        return pd.DataFrame(counts.T, index=periods, columns=columns)
+
+    def total(self, start=None, end=None, resolution="day"):
+        """Counts of all labels together per period, as in :meth:`series`."""
+        return self.series(None, start, end, resolution).sum(axis=1).rename(TOTAL)
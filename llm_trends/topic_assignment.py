@@ -0,0 +1,183 @@
+"""Assign newly ingested papers to the existing topic taxonomy.
+
+New abstracts are embedded in batches and matched against one centroid per
+``Human_Readable_Topic`` built from ``data/Topic_with_Embeddings.csv``. Papers
+whose best match falls below the confidence threshold are kept in an
+"unassigned" pool instead of being forced into a topic, so the cost of adding
+papers is one encode plus one matrix product per batch, never a re-clustering.
+
+Usage:
+    python -m llm_trends.topic_assignment new_papers.csv
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import schema
+
+TOPIC_EMBEDDINGS_PATH = "data/Topic_with_Embeddings.csv"
+TAXONOMY_PATH = "data/LLM_related_domainss.csv"
+NEW_PAPERS_PATH = "data/Datamap/new_papers.csv"
+UNASSIGNED_PAPERS_PATH = "data/Datamap/unassigned_papers.csv"
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+UNASSIGNED_TOPIC = "Unassigned"
+DEFAULT_THRESHOLD = 0.3
+DEFAULT_BATCH_SIZE = 256
+
+
+def _normalize_rows(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def load_topic_centroids(path=TOPIC_EMBEDDINGS_PATH):
+    """Return ``(topics, centroids)`` with one unit-length centroid per topic."""
+    dataset = pd.read_csv(path, usecols=["Human_Readable_Topic", "Embedding"])
+    embeddings = _normalize_rows(np.vstack(dataset["Embedding"].map(json.loads).to_numpy()))
+
+    # A topic can appear on several rows, so average them into one centroid
+    codes, topics = pd.factorize(dataset["Human_Readable_Topic"])
+    centroids = np.zeros((len(topics), embeddings.shape[1]), dtype=np.float32)
+    np.add.at(centroids, codes, embeddings)
+    return np.asarray(topics, dtype=object), _normalize_rows(centroids)
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """Return the distinct (Categories, Subdomain, Human_Readable_Topic) triples."""
+    columns = ["Categories", "Subdomain", "Human_Readable_Topic"]
+    return pd.read_csv(path, usecols=columns).drop_duplicates().reset_index(drop=True)
+
+
+def load_model():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(MODEL_NAME)
+
+
+def encode_texts(model, texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Encode ``texts`` into unit-length float32 embeddings, ``batch_size`` at a time."""
+    return model.encode(
+        list(texts), batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+    ).astype(np.float32)
+
+
+def paper_texts(papers):
+    """Text that gets embedded for each paper: the title followed by the abstract."""
+    title = papers["title"].fillna("").astype(str).str.strip()
+    abstract = papers["abstract"].fillna("").astype(str).str.strip()
+    return (title + ". " + abstract).tolist()
+
+
+class TopicAssigner:
+    """Nearest-centroid classifier over the existing topic taxonomy."""
+
+    def __init__(self, topics, centroids, taxonomy=None, threshold=DEFAULT_THRESHOLD,
+                 batch_size=DEFAULT_BATCH_SIZE, model=None):
+        self.topics = np.asarray(topics, dtype=object)
+        self.centroids = _normalize_rows(centroids)
+        self.taxonomy = taxonomy
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self._model = model
+
+    @classmethod
+    def from_files(cls, embeddings_path=TOPIC_EMBEDDINGS_PATH, taxonomy_path=TAXONOMY_PATH, **kwargs):
+        topics, centroids = load_topic_centroids(embeddings_path)
+        taxonomy = load_taxonomy(taxonomy_path) if os.path.exists(taxonomy_path) else None
+        return cls(topics, centroids, taxonomy=taxonomy, **kwargs)
+
+    @property
+    def model(self):
+        # Loading the sentence transformer is expensive, so only do it on first use
+        if self._model is None:
+            self._model = load_model()
+        return self._model
+
+    def score(self, embeddings):
+        """Return ``(best_topic_index, confidence)`` for each embedding row."""
+        similarities = _normalize_rows(embeddings) @ self.centroids.T
+        best = similarities.argmax(axis=1)
+        return best, similarities[np.arange(len(best)), best]
+
+    def assign(self, papers, embeddings=None):
+        """Split ``papers`` into ``(assigned, unassigned)`` frames.
+
+        Assigned papers get one row per (Categories, Subdomain) the matched topic
+        belongs to, matching the layout of the concatenated corpus CSV.
+        """
+        papers = papers.reset_index(drop=True)
+        if papers.empty:
+            empty = papers.assign(Human_Readable_Topic=[], topic_confidence=[])
+            return empty, empty
+
+        if embeddings is None:
+            embeddings = encode_texts(self.model, paper_texts(papers), self.batch_size)
+
+        best, confidence = self.score(embeddings)
+        scored = papers.assign(
+            Human_Readable_Topic=self.topics[best],
+            topic_confidence=confidence.astype(np.float32),
+        )
+
+        # Low-confidence papers go to the unassigned pool for later review
+        accepted = confidence >= self.threshold
+        unassigned = scored[~accepted].assign(Human_Readable_Topic=UNASSIGNED_TOPIC)
+        assigned = scored[accepted]
+
+        if self.taxonomy is not None:
+            assigned = assigned.drop(columns=["Categories", "Subdomain"], errors="ignore")
+            assigned = assigned.merge(self.taxonomy, on="Human_Readable_Topic", how="left")
+        return assigned.reset_index(drop=True), unassigned.reset_index(drop=True)
+
+
+def with_new_papers(df, path=NEW_PAPERS_PATH, columns=schema.PAPERS):
+    """Append the incrementally assigned papers (if any) to a corpus frame."""
+    if not os.path.exists(path):
+        return df
+    new_papers = schema.read_csv(path, columns)
+    return schema.concat([df, new_papers[new_papers.columns.intersection(df.columns)]], columns)
+
+
+def write_csv(frame, path):
+    """Write ``frame`` next to ``path`` and rename it into place, so the data watcher never reads a partial file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    scratch = f"{path}.{os.getpid()}.tmp"
+    frame.to_csv(scratch, index=False)
+    os.replace(scratch, path)
+
+
+def _append_csv(frame, path):
+    if os.path.exists(path):
+        existing = pd.read_csv(path)
+        # Papers ingested by an earlier run are not added again
+        frame = pd.concat([existing, frame[~frame["id"].isin(existing["id"])]], ignore_index=True)
+    write_csv(frame, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assign new papers to existing LLM research topics.")
+    parser.add_argument("papers", help="CSV with at least id, title, abstract and update_date columns")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="minimum cosine similarity to the topic centroid")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--output", default=NEW_PAPERS_PATH)
+    parser.add_argument("--unassigned-output", default=UNASSIGNED_PAPERS_PATH)
+    args = parser.parse_args(argv)
+
+    assigner = TopicAssigner.from_files(threshold=args.threshold, batch_size=args.batch_size)
+    assigned, unassigned = assigner.assign(pd.read_csv(args.papers))
+    if not assigned.empty:
+        _append_csv(assigned, args.output)
+    if not unassigned.empty:
+        _append_csv(unassigned, args.unassigned_output)
+    print(f"Assigned {assigned['id'].nunique()} paper(s), {len(unassigned)} left unassigned.")
+
+
+if __name__ == "__main__":
+    main()
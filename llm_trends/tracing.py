@@ -0,0 +1,238 @@
+"""Lightweight tracing of the hot paths: named spans, cache counters and their exports.
+
+Data loads, cache lookups, embedding, LLM calls, chart building and exports are
+wrapped in named spans (``with tracing.span("data.load", source=...)``), and
+caches count their hits and misses. Tracing is off unless ``LLM_TRENDS_TRACE``
+is set; then :func:`span` returns a shared no-op context manager and
+:func:`count` returns at once, so instrumented code costs one flag check.
+
+When enabled, every finished span is
+
+* aggregated per name (count, total and max seconds, latency histogram);
+* logged as one JSON line on the ``llm_trends.trace`` logger (stderr by default);
+* added to the spans of the current unit of work, if one is being collected
+  (:func:`collect`, used for a Streamlit rerun by the debug panel).
+
+:func:`metrics_text` renders the aggregates and counters in the Prometheus text
+format. :func:`start` writes it to ``LLM_TRENDS_METRICS`` every 15 seconds, for
+a node exporter's textfile collector; the JSON API also serves it at ``/metrics``.
+
+Environment:
+    LLM_TRENDS_TRACE     ``1`` to enable tracing
+    LLM_TRENDS_METRICS   metrics file (default ``data/.metrics.prom``), or ``off``
+"""
+
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+ENABLED = os.environ.get("LLM_TRENDS_TRACE", "").lower() in ("1", "true", "yes", "on")
+METRICS_PATH = os.environ.get("LLM_TRENDS_METRICS", "data/.metrics.prom")
+METRICS_INTERVAL = 15.0
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+logger = logging.getLogger("llm_trends.trace")
+
+_lock = threading.Lock()
+_stats = {}
+_counters = {}
+_local = threading.local()
+_NOOP = contextlib.nullcontext()
+_writer = None
+
+
+class SpanStats:
+    """Aggregate of every finished span of one name."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds, error):
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def copy(self):
+        copied = SpanStats()
+        copied.count, copied.errors, copied.total, copied.max = self.count, self.errors, self.total, self.max
+        copied.buckets = list(self.buckets)
+        return copied
+
+
+class Span:
+    __slots__ = ("name", "attrs", "started", "seconds", "depth")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.depth = getattr(_local, "depth", 0)
+        _local.depth = self.depth + 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self.started
+        _local.depth = self.depth
+        _record(self, exc_type is not None)
+        return False
+
+
+def span(name, **attrs):
+    """Context manager timing the work of the ``with`` block under ``name``; ``attrs`` go to the log."""
+    if not ENABLED:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def count(name, value=1, **labels):
+    """Add ``value`` to the counter ``name`` with ``labels``."""
+    if not ENABLED:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def cache_lookup(cache, hit, **labels):
+    """Count a hit or a miss of ``cache``."""
+    if ENABLED:
+        count("cache_hits_total" if hit else "cache_misses_total", cache=cache, **labels)
+
+
+def _record(finished, error):
+    with _lock:
+        stats = _stats.get(finished.name)
+        if stats is None:
+            stats = _stats[finished.name] = SpanStats()
+        stats.add(finished.seconds, error)
+    collected = getattr(_local, "spans", None)
+    if collected is not None:
+        collected.append(finished)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            "ts": round(time.time(), 3),
+            "span": finished.name,
+            "ms": round(finished.seconds * 1000, 3),
+            "thread": threading.current_thread().name,
+            "error": error,
+            **{key: value if isinstance(value, (int, float, bool)) else str(value) for key, value in finished.attrs.items()},
+        }))
+
+
+@contextlib.contextmanager
+def collect():
+    """Collect the spans finished on this thread during the ``with`` block into the list it yields."""
+    if not ENABLED:
+        yield []
+        return
+    previous = getattr(_local, "spans", None)
+    _local.spans = collected = []
+    try:
+        yield collected
+    finally:
+        _local.spans = previous
+
+
+def stats():
+    """``(span stats by name, counters by (name, labels))``, copied so that later spans do not change them."""
+    with _lock:
+        return {name: stat.copy() for name, stat in _stats.items()}, dict(_counters)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _counters.clear()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs)
+
+
+def metrics_text():
+    """Span histograms and counters in the Prometheus text exposition format."""
+    span_stats, counters = stats()
+    lines = [
+        "# HELP llm_trends_span_seconds Time spent in traced spans.",
+        "# TYPE llm_trends_span_seconds histogram",
+    ]
+    for name, stat in sorted(span_stats.items()):
+        label = _labels([("span", name)])
+        cumulative = 0
+        for bound, n in zip(BUCKETS, stat.buckets):
+            cumulative += n
+            lines.append(f'llm_trends_span_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+        lines.append(f'llm_trends_span_seconds_bucket{{{label},le="+Inf"}} {stat.count}')
+        lines.append(f'llm_trends_span_seconds_sum{{{label}}} {stat.total:.6f}')
+        lines.append(f'llm_trends_span_seconds_count{{{label}}} {stat.count}')
+    lines += [
+        "# HELP llm_trends_span_errors_total Traced spans that raised.",
+        "# TYPE llm_trends_span_errors_total counter",
+    ]
+    lines += [
+        f'llm_trends_span_errors_total{{{_labels([("span", name)])}}} {stat.errors}'
+        for name, stat in sorted(span_stats.items())
+    ]
+    for name in sorted({name for name, _ in counters}):
+        lines.append(f"# TYPE llm_trends_{name} counter")
+        for (counter, labels), value in sorted(counters.items()):
+            if counter == name:
+                lines.append(f"llm_trends_{name}{{{_labels(labels)}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path=METRICS_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    scratch = f"{path}.{os.getpid()}.tmp"
+    with open(scratch, "w") as f:
+        f.write(metrics_text())
+    os.replace(scratch, path)
+
+
+def _write_periodically(path, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            write_metrics(path)
+        except OSError as e:
+            logger.warning(json.dumps({"ts": round(time.time(), 3), "error": f"Could not write metrics: {e}"}))
+
+
+def start(metrics_path=METRICS_PATH, interval=METRICS_INTERVAL):
+    """Send the span log to stderr and write the metrics file periodically; a no-op unless tracing is enabled."""
+    global _writer
+    if not ENABLED:
+        return
+    with _lock:
+        if _writer is not None:
+            return
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        _writer = threading.Thread(target=_write_periodically, args=(metrics_path, interval), name="trace-metrics", daemon=True)
+        if metrics_path != "off":
+            _writer.start()
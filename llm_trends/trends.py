@@ -0,0 +1,245 @@
+"""Growth and burst scores for every topic or entity time series at once.
+
+The trend views only plot the series a user picks. Here every label of a
+column is scored in one vectorized pass over a label x period count matrix:
+
+* ``growth``: mean count over the last ``window`` periods relative to the
+  ``window`` before (add-one smoothed, so tiny series don't dominate).
+* ``zscore``: the recent mean against the mean and spread of the earlier history.
+* ``burst_weight``: Kleinberg's two-state burst detection, run as one Viterbi
+  pass over all series. A series is bursting when its rate in a period is
+  better explained by ``BURST_SCALE`` times its overall share of the period's
+  rows; the weight of a burst is how much better, summed over its periods.
+
+:func:`lead_lag` finds which series tend to move before others: the
+cross-correlations of all pairs at every lag are computed as one matrix
+product per lag, and only the strongest pairs are kept.
+
+Usage:
+    python -m llm_trends.trends --column Human_Readable_Topic --window 3
+    python -m llm_trends.trends --column Human_Readable_Topic --lead-lag
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from llm_trends import artifacts
+from llm_trends.corpus import load_domains, load_entities
+
+DEFAULT_WINDOW = 3
+BURST_SCALE = 2.0
+BURST_GAMMA = 1.0
+MAX_LAG = 6
+MIN_OVERLAP = 8
+LEAD_LAG_BLOCK = 512
+
+
+def count_matrix(corpus, column, period="Month_Start", rows=None):
+    """Rows per label of ``column`` and per ``period``: ``(labels, periods, counts)``.
+
+    ``counts`` is an int64 array of shape ``(len(labels), len(periods))``, periods
+    sorted in time. Rows without a label or a period are left out.
+    """
+    index = corpus.index(column)
+    label_codes = index.codes()
+    period_codes, periods = pd.factorize(corpus.values(period), sort=True)
+    if rows is not None:
+        label_codes, period_codes = label_codes[rows], period_codes[rows]
+    valid = (label_codes >= 0) & (period_codes >= 0)
+    flat = label_codes[valid].astype(np.int64) * len(periods) + period_codes[valid]
+    counts = np.bincount(flat, minlength=len(index.labels) * len(periods)).reshape(len(index.labels), len(periods))
+    return index.labels, pd.DatetimeIndex(periods), counts
+
+
+def growth_scores(counts, window=DEFAULT_WINDOW):
+    """Smoothed growth and z-score of the last ``window`` periods of every series."""
+    recent = counts[:, -window:].mean(axis=1)
+    previous = counts[:, -2 * window:-window].mean(axis=1) if counts.shape[1] >= 2 * window else np.zeros(len(counts))
+    growth = (recent + 1) / (previous + 1) - 1
+
+    history = counts[:, :-window]
+    if history.shape[1] >= 2:
+        zscore = (recent - history.mean(axis=1)) / np.maximum(history.std(axis=1), 1.0)
+    else:
+        zscore = np.zeros(len(counts))
+    return growth, zscore
+
+
+def burst_states(counts, scale=BURST_SCALE, gamma=BURST_GAMMA):
+    """Kleinberg two-state bursts of every series: ``(states, weights)``, both ``(series, periods)``.
+
+    ``states`` is 1 where a series is in a burst; ``weights`` is the per-period
+    gain of the burst state over the base state (the burst weight summed over
+    a burst's periods).
+    """
+    n_series, n_periods = counts.shape
+    totals = np.maximum(counts.sum(axis=0), 1)
+    base = np.clip(counts.sum(axis=1) / totals.sum(), 1e-12, 1 - 1e-12)[:, None]
+    rates = np.stack([base, np.minimum(base * scale, 1 - 1e-12)])
+
+    # Binomial negative log-likelihood of each period's count under each state: (2, series, periods)
+    costs = -(counts * np.log(rates) + (totals - counts) * np.log(1 - rates))
+    up = gamma * np.log(max(n_periods, 2))
+
+    # Viterbi over all series at once; the only loop is over periods
+    best = np.stack([costs[0, :, 0], costs[1, :, 0] + up])
+    from_burst = np.zeros((2, n_series, n_periods), dtype=bool)
+    for t in range(1, n_periods):
+        stay_base, leave_burst = best[0], best[1]
+        enter_burst, stay_burst = best[0] + up, best[1]
+        from_burst[0, :, t] = leave_burst < stay_base
+        from_burst[1, :, t] = stay_burst <= enter_burst
+        best = np.stack([
+            np.minimum(stay_base, leave_burst) + costs[0, :, t],
+            np.minimum(enter_burst, stay_burst) + costs[1, :, t],
+        ])
+
+    states = np.zeros((n_series, n_periods), dtype=np.int8)
+    state = (best[1] < best[0]).astype(np.int8)
+    series = np.arange(n_series)
+    for t in range(n_periods - 1, -1, -1):
+        states[:, t] = state
+        state = from_burst[state, series, t].astype(np.int8)
+    return states, np.where(states == 1, costs[0] - costs[1], 0.0)
+
+
+def emerging_scores(labels, periods, counts, window=DEFAULT_WINDOW):
+    """One row of growth and burst scores per label."""
+    growth, zscore = growth_scores(counts, window)
+    states, weights = burst_states(counts)
+
+    # The most recent burst of every series: its last period, then walk back to its start
+    n_periods = counts.shape[1]
+    in_burst = states == 1
+    has_burst = in_burst.any(axis=1)
+    end = np.where(has_burst, n_periods - 1 - np.argmax(in_burst[:, ::-1], axis=1), 0)
+    before_end = np.arange(n_periods)[None, :] <= end[:, None]
+    gaps = before_end & ~in_burst
+    start = np.where(gaps.any(axis=1), n_periods - np.argmax(gaps[:, ::-1], axis=1), 0)
+    start = np.where(has_burst, np.minimum(start, end), 0)
+    in_latest = (np.arange(n_periods)[None, :] >= start[:, None]) & before_end & in_burst
+
+    return pd.DataFrame({
+        "label": list(labels),
+        "total": counts.sum(axis=1),
+        "recent": counts[:, -window:].sum(axis=1),
+        "growth": growth,
+        "zscore": zscore,
+        "bursting": in_burst[:, -1] if n_periods else np.zeros(len(counts), dtype=bool),
+        "burst_weight": (weights * in_latest).sum(axis=1),
+        "burst_start": pd.DatetimeIndex(periods[start]).where(has_burst),
+        "burst_end": pd.DatetimeIndex(periods[end]).where(has_burst),
+    })
+
+
+def score_column(corpus, column, period="Month_Start", window=DEFAULT_WINDOW):
+    """Emerging scores of every label of ``column``, computed once per corpus (and so per data version)."""
+    def compute():
+        labels, periods, counts = count_matrix(corpus, column, period)
+        return emerging_scores(labels, periods, counts, window)
+
+    return corpus.persisted(
+        "emerging_scores", compute, _save_scores, _load_scores, column=column, period=period, window=window
+    )
+
+
+def _save_scores(scores, directory):
+    artifacts.save_frame(scores, os.path.join(directory, "scores"))
+
+
+def _load_scores(directory):
+    return artifacts.load_frame(os.path.join(directory, "scores"))
+
+
+def _standardize(values):
+    centered = values - values.mean(axis=1, keepdims=True)
+    scale = np.sqrt((centered ** 2).mean(axis=1, keepdims=True))
+    return np.divide(centered, scale, out=np.zeros_like(centered), where=scale > 0)
+
+
+def lead_lag(labels, counts, max_lag=MAX_LAG, top=100, min_total=0):
+    """Strongest lead-lag pairs: ``leader`` changes ``lag`` periods before ``follower``.
+
+    Series are compared on their period-over-period changes of ``log1p(count)``,
+    so a shared upward trend alone does not correlate them. For every lag the
+    Pearson correlation of all (leader, follower) pairs is one matrix product
+    over the overlapping periods; leaders are processed in blocks to bound
+    memory. Only pairs whose best lagged correlation beats their same-period
+    correlation are kept, the ``top`` strongest first.
+    """
+    keep = np.flatnonzero(counts.sum(axis=1) >= min_total)
+    labels = np.asarray(labels, dtype=object)[keep]
+    changes = np.diff(np.log1p(counts[keep].astype(np.float32)), axis=1)
+    n_series, n_periods = changes.shape
+    lags = range(1, min(max_lag, n_periods - MIN_OVERLAP) + 1)
+    columns = ["leader", "follower", "lag", "correlation", "same_period_correlation"]
+    if n_series < 2 or not lags:
+        return pd.DataFrame(columns=columns)
+
+    # Followers' standardized windows are shared by every block of leaders
+    current = _standardize(changes)
+    followers = {lag: _standardize(changes[:, lag:]) for lag in lags}
+
+    candidates = []
+    for block in range(0, n_series, LEAD_LAG_BLOCK):
+        leaders = slice(block, block + LEAD_LAG_BLOCK)
+        same = current[leaders] @ current.T / n_periods
+        best = np.full(same.shape, -np.inf, dtype=np.float32)
+        best_lag = np.zeros(same.shape, dtype=np.int8)
+        for lag in lags:
+            corr = _standardize(changes[leaders, :n_periods - lag]) @ followers[lag].T / (n_periods - lag)
+            better = corr > best
+            best[better], best_lag[better] = corr[better], lag
+        # Leading must explain more than moving together, and a series does not lead itself
+        best[best <= same] = -np.inf
+        best[np.arange(best.shape[0]), np.arange(block, block + best.shape[0])] = -np.inf
+
+        flat = best.ravel()
+        picked = np.argpartition(flat, -top)[-top:] if flat.size > top else np.arange(flat.size)
+        picked = picked[np.isfinite(flat[picked])]
+        rows, cols = np.unravel_index(picked, best.shape)
+        candidates.append(pd.DataFrame({
+            "leader": labels[rows + block],
+            "follower": labels[cols],
+            "lag": best_lag[rows, cols],
+            "correlation": best[rows, cols],
+            "same_period_correlation": same[rows, cols],
+        }))
+    pairs = pd.concat(candidates, ignore_index=True).sort_values("correlation", ascending=False)
+    return pairs.head(top).reset_index(drop=True)[columns]
+
+
+def lead_lag_pairs(corpus, column, period="Month_Start", max_lag=MAX_LAG, top=100, min_total=0):
+    """Top lead-lag pairs of the labels of ``column``, computed once per corpus."""
+    def compute():
+        labels, _, counts = count_matrix(corpus, column, period)
+        return lead_lag(labels, counts, max_lag, top, min_total)
+
+    return corpus.memoize(("lead_lag", column, period, max_lag, top, min_total), compute)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score every topic or entity for growth and bursts.")
+    parser.add_argument("--column", default="Human_Readable_Topic", choices=["Human_Readable_Topic", "Subdomain", "Entity"])
+    parser.add_argument("--period", default="Month_Start", choices=["Month_Start", "week"])
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--lead-lag", action="store_true", help="list the strongest lead-lag pairs instead")
+    parser.add_argument("--max-lag", type=int, default=MAX_LAG)
+    parser.add_argument("--min-total", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    corpus = load_entities() if args.column == "Entity" else load_domains()
+    if args.lead_lag:
+        pairs = lead_lag_pairs(corpus, args.column, args.period, args.max_lag, args.top, args.min_total)
+        print(pairs.to_string(index=False))
+        return
+    scores = score_column(corpus, args.column, args.period, args.window)
+    print(scores.sort_values(["bursting", "burst_weight", "growth"], ascending=False).head(args.top).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""One module per sidebar section of the app.
+
+Each module exposes a ``render()`` function and imports its own dependencies at
+module level. ``render`` imports a section module the first time it is shown,
+so heavy libraries (sentence-transformers, datamapplot, scikit-learn, ...) are
+only loaded by the sections that use them instead of on every app start.
+"""
+
+import importlib
+
+# Sidebar label -> module name, in the order shown in the sidebar
+SECTIONS = {
+    "Topic Tracking": "topic_tracking",
+    "Topic Overview": "topic_overview",
+    "Emerging Topics": "emerging_topics",
+    "LLM-related Research Overview": "research_overview",
+    "Entity Tracking": "entity_tracking",
+    "Topic Discovery": "topic_discovery",
+    "Paper Tracking": "paper_tracking",
+    "Author Tracking": "author_tracking",
+    "Subscribe": "subscribe",
+}
+
+
+def render(section):
+    importlib.import_module(f"{__name__}.{SECTIONS[section]}").render()
@@ -0,0 +1,108 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from llm_trends import tracing
+from sections.data import get_domains
+from sections.exports import download_buttons
+
+TRAJECTORY_TOPICS = 8
+
+
+def render():
+    st.title("Author Tracking")
+    st.write(
+        """
+        Find a submitter and follow the topics of their papers over time, or see who has been submitting
+        the most papers on a topic, month by month.
+        """
+    )
+
+    corpus = get_domains()
+    if "submitter" not in corpus.columns:
+        st.error("The dataset has no 'submitter' column.")
+        return
+    # Submitter index, built once per corpus and shared by every session
+    authors = corpus.authors()
+
+    # Author lookup
+    st.markdown("### Find a Submitter")
+    query = st.text_input("Search by name (leave empty to list the most active submitters):")
+    matches = authors.search(query)
+    if matches.empty:
+        st.warning(f"No submitter matches '{query}'.")
+    else:
+        papers_of = dict(zip(matches["Submitter"], matches["Papers"]))
+        author = st.selectbox(
+            "Submitter",
+            options=matches["Submitter"].tolist(),
+            format_func=lambda name: f"{name} ({papers_of[name]} papers)",
+        )
+
+        paper_ids = authors.papers(author)
+        papers = corpus.papers.take(paper_ids)[["title", "id", "update_date"]]
+        # Papers per month and topic, the most frequent topics first
+        trajectory = authors.trajectory(author)
+        first, last = papers["update_date"].min(), papers["update_date"].max()
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Papers", len(papers))
+        col2.metric("Topics", len(trajectory.columns))
+        col3.metric("Active", f"{first:%b %Y} – {last:%b %Y}" if pd.notna(first) else "–")
+
+        # Topic trajectory: the author's most frequent topics, from their first to their last active month
+        st.markdown(f"#### Topics of {author} over Time")
+        monthly = trajectory.sum(axis=1)
+        active = trajectory.loc[monthly[monthly > 0].index.min():monthly[monthly > 0].index.max()].iloc[:, :TRAJECTORY_TOPICS]
+        df_chart = active.reset_index().melt(id_vars="Month_Start", var_name="Topic", value_name="Papers")
+        chart = (
+            alt.Chart(df_chart)
+            .mark_bar()
+            .encode(
+                x=alt.X("yearmonth(Month_Start):T", title="Month"),
+                y=alt.Y("Papers:Q", stack=True),
+                color=alt.Color("Topic:N", legend=alt.Legend(orient="bottom", columns=2, labelLimit=400)),
+                tooltip=["yearmonth(Month_Start):T", "Topic:N", "Papers:Q"],
+            )
+            .properties(height=320)
+        )
+        with tracing.span("chart", chart="author_topics"):
+            st.altair_chart(chart, use_container_width=True)
+
+        st.markdown(f"#### Papers Submitted by {author}")
+        st.dataframe(papers, use_container_width=True, hide_index=True, column_config={"id": st.column_config.LinkColumn()})
+        download_buttons(
+            "Download Papers",
+            lambda: papers,
+            key=("author_tracking", corpus.version, author),
+            file_name=f"papers_{author.replace(' ', '_').replace('/', '_')}.csv",
+        )
+
+    # Leaderboards
+    st.markdown("### Most Active Submitters per Topic")
+    topic_index = corpus.index("Human_Readable_Topic")
+    topics = topic_index.labels[(-topic_index.counts()).argsort(kind="stable")].tolist()
+    col1, col2 = st.columns(2)
+    with col1:
+        topic = st.selectbox("Topic", options=topics)
+    with col2:
+        months = authors.months[::-1]
+        month = st.selectbox(
+            "Month",
+            options=[None] + list(months),
+            format_func=lambda value: "All months" if value is None else f"{value:%B %Y}",
+        )
+    board = authors.leaderboard(topic, month, top=10)
+    if board.empty:
+        st.info("No papers on this topic in this month.")
+    else:
+        st.dataframe(board, use_container_width=True, hide_index=True)
+
+    st.markdown("#### Top Submitters of the Topic, Month by Month")
+    leaders = authors.monthly_leaders(topic, top=3)
+    if not leaders.empty:
+        leaders["Month"] = leaders.pop("Month_Start").dt.strftime("%Y-%m")
+        st.dataframe(
+            leaders.pivot(index="Month", columns="Rank", values="Submitter").sort_index(ascending=False),
+            use_container_width=True,
+        )
@@ -0,0 +1,64 @@
+"""Process-wide corpus objects shared by every session.
+
+``st.cache_resource`` returns the same object to every rerun of every session,
+unlike ``st.cache_data`` which hands out a fresh copy each time. Sections must
+treat these corpora as read-only and select rows through index arrays.
+
+The corpora are held by a :class:`llm_trends.reload.DataVersions`: a newly
+published data version is loaded in the background and swapped in without a
+restart, so sessions keep their state. Each rerun is pinned to the version that
+was current when it started (see ``streamlit_app.py``).
+"""
+
+import pandas as pd
+import streamlit as st
+
+from llm_trends.corpus import HIERARCHY
+from llm_trends.encoder import BatchingEncoder
+from llm_trends.reload import DataVersions
+from llm_trends.topic_assignment import load_model
+
+# Frames derived from a shared corpus copy lazily, only when they are modified
+pd.set_option("mode.copy_on_write", True)
+
+
+# Work done on a new corpus before it is swapped in, so the first rerun on it is as fast as any other
+WARM = {
+    "papers": lambda loaded: (loaded.hierarchy(), loaded.time_pyramid("update_date", tuple(HIERARCHY))),
+    "domains": lambda loaded: (loaded.hierarchy(), loaded.count_tree()),
+    "entities": lambda loaded: (loaded.index("Entity"), loaded.time_pyramid("Date", "Entity")),
+    "llm_domain": lambda loaded: loaded.time_pyramid("update_date"),
+}
+
+
+@st.cache_resource
+def get_data():
+    # One set of corpora per process, replaced in the background when a new data version is published
+    return DataVersions(warm=WARM).watch()
+
+
+def pinned_data():
+    """Context in which every ``get_*`` call returns the data version current at its start."""
+    return get_data().pinned()
+
+
+def get_papers():
+    return get_data().get("papers")
+
+
+def get_domains():
+    return get_data().get("domains")
+
+
+def get_entities():
+    return get_data().get("entities")
+
+
+def get_llm_domain():
+    return get_data().get("llm_domain")
+
+
+@st.cache_resource
+def get_encoder():
+    # One model for the process; concurrent sessions' encodes are merged into micro-batches
+    return BatchingEncoder(load_model())
@@ -0,0 +1,56 @@
+"""Hidden performance panel: the spans of the current rerun and the process-wide metrics.
+
+Not a sidebar section. It is shown below the page when tracing is enabled
+(``LLM_TRENDS_TRACE=1``) and the app is opened with ``?debug=1``.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from llm_trends import tracing
+
+
+def enabled():
+    return tracing.ENABLED and st.query_params.get("debug") not in (None, "", "0")
+
+
+def render(spans):
+    with st.expander("⏱️ Performance", expanded=True):
+        st.markdown("**This rerun**")
+        if spans:
+            first = min(finished.started for finished in spans)
+            st.dataframe(pd.DataFrame([
+                {
+                    "Span": "  " * finished.depth + finished.name,
+                    "Start (ms)": round((finished.started - first) * 1000, 1),
+                    "Duration (ms)": round(finished.seconds * 1000, 1),
+                    "Details": ", ".join(f"{key}={value}" for key, value in finished.attrs.items()),
+                }
+                for finished in sorted(spans, key=lambda finished: finished.started)
+            ]), use_container_width=True, hide_index=True)
+
+        span_stats, counters = tracing.stats()
+        st.markdown("**This process**")
+        st.dataframe(pd.DataFrame([
+            {
+                "Span": name,
+                "Count": stat.count,
+                "Total (s)": round(stat.total, 2),
+                "Mean (ms)": round(stat.total / stat.count * 1000, 1),
+                "Max (ms)": round(stat.max * 1000, 1),
+                "Errors": stat.errors,
+            }
+            for name, stat in sorted(span_stats.items(), key=lambda item: -item[1].total)
+        ]), use_container_width=True, hide_index=True)
+
+        # Hits and misses per cache, whatever labels the lookups carried
+        lookups = {}
+        for (name, labels), value in counters.items():
+            if name in ("cache_hits_total", "cache_misses_total"):
+                cache = ", ".join(f"{key}={label}" for key, label in labels)
+                lookups.setdefault(cache, [0, 0])[name == "cache_misses_total"] += value
+        if lookups:
+            st.dataframe(pd.DataFrame([
+                {"Cache": cache, "Hits": hits, "Misses": misses, "Hit rate": f"{hits / (hits + misses):.0%}"}
+                for cache, (hits, misses) in sorted(lookups.items())
+            ]), use_container_width=True, hide_index=True)
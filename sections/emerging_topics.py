@@ -0,0 +1,108 @@
+import altair as alt
+import streamlit as st
+
+from llm_trends import tracing, trends
+from sections.data import get_domains, get_entities
+from sections.exports import download_buttons
+
+# Label column scored for each kind of series
+SERIES = {
+    "Topics": ("Human_Readable_Topic", get_domains),
+    "Subdomains": ("Subdomain", get_domains),
+    "Entities": ("Entity", get_entities),
+}
+PERIODS = {"Monthly": "Month_Start", "Weekly": "week"}
+RANKINGS = {
+    "Burst weight": ["bursting", "burst_weight", "growth"],
+    "Growth": ["growth", "recent"],
+    "Z-score": ["zscore", "recent"],
+}
+
+
+def render():
+    st.title("Emerging Topics")
+    st.write(
+        """
+        Every topic, subdomain and entity is scored for growth and burstiness over its full history, so the fastest-rising ones surface without clicking through subdomains.
+        **Growth** compares the latest periods with the ones before, the **z-score** compares them with the whole earlier history, and the **burst weight** measures how strongly a series is in a burst of unusually high activity (Kleinberg's burst detection).
+        """
+    )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        kind = st.radio("Series", list(SERIES), horizontal=True)
+    with col2:
+        period_name = st.radio("Period", list(PERIODS), horizontal=True)
+    with col3:
+        ranking = st.selectbox("Rank by", list(RANKINGS))
+    window = st.slider("Recent window (periods)", 1, 12, trends.DEFAULT_WINDOW)
+    min_total = st.number_input("Minimum number of papers/mentions", min_value=0, value=20, step=10)
+
+    # Scores of every series are computed once per data version and shared by every session
+    column, get_corpus = SERIES[kind]
+    corpus = get_corpus()
+    period = PERIODS[period_name]
+    scores = trends.score_column(corpus, column, period, window)
+
+    ranked = scores[scores["total"] >= min_total].sort_values(RANKINGS[ranking], ascending=False)
+    if ranked.empty:
+        st.warning("No series have enough data for the selected filters.")
+        return
+
+    st.dataframe(
+        ranked.assign(growth=ranked["growth"] * 100).rename(columns={"label": kind[:-1]}),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "growth": st.column_config.NumberColumn("Growth", format="%.0f%%", help="Recent vs. previous window"),
+            "zscore": st.column_config.NumberColumn("Z-score", format="%.2f"),
+            "burst_weight": st.column_config.NumberColumn("Burst weight", format="%.1f"),
+            "burst_start": st.column_config.DateColumn("Burst start"),
+            "burst_end": st.column_config.DateColumn("Burst end"),
+        },
+    )
+
+    # Plot the top series
+    top_n = st.slider("Series to plot", 1, 15, 5)
+    top_labels = ranked["label"].head(top_n).tolist()
+    df_filtered = corpus.take(corpus.rows_where(**{column: top_labels}), [column, period])
+    df_chart = df_filtered.groupby([period, column], observed=True).size().reset_index(name="Count")
+    chart = (
+        alt.Chart(df_chart)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X(f"{period}:T", title=period_name[:-2]),
+            y=alt.Y("Count:Q", title="Count"),
+            color=alt.Color(f"{column}:N", title=kind[:-1]),
+            tooltip=[column, f"{period}:T", "Count"],
+        )
+        .properties(height=400)
+    )
+    with tracing.span("chart", chart="emerging_series"):
+        st.altair_chart(chart, use_container_width=True)
+    download_buttons(
+        "Download Scores",
+        lambda: ranked,
+        key=("emerging_topics", corpus.version, column, period, window, min_total, ranking),
+        file_name=f"emerging_{column.lower()}_{period_name.lower()}.csv",
+    )
+
+    # Lead-lag pairs: which series tend to change a few periods before others
+    st.markdown(f"### Leading {kind}")
+    st.write(
+        f"Pairs of {kind.lower()} whose period-over-period changes are most correlated when the follower is shifted by a few periods, i.e. the leader tends to rise or fall first."
+    )
+    pairs = trends.lead_lag_pairs(corpus, column, period, top=50, min_total=min_total)
+    if pairs.empty:
+        st.info("Not enough periods to compare series at different lags.")
+    else:
+        st.dataframe(
+            pairs,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "lag": st.column_config.NumberColumn(f"Lag ({period_name[:-2].lower()}s)"),
+                "correlation": st.column_config.NumberColumn("Correlation", format="%.2f"),
+                "same_period_correlation": st.column_config.NumberColumn("Same-period correlation", format="%.2f"),
+            },
+        )
@@ -0,0 +1,81 @@
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from llm_trends import analytics, tracing
+from sections.data import get_entities
+
+
+def render():
+    st.title("Entity Trends in LLM-Related Research Papers")
+    st.write(
+        """
+        The following dashboard highlights trends in paper abstracts the top 500 entities related to LLM-domain over a defined timespan (2022 November–2024 November). 
+        You can explore its trends and interactions with related entities like **fine-tuning**, **embeddings**, and other model-related terminologies.
+
+        """
+    )
+    # Load the shared dataset; dates are parsed and invalid ones dropped at load
+    corpus = get_entities()
+    entity_column = corpus.take(columns=["Entity"])["Entity"]
+
+    # Check if the dataset is empty after cleaning
+    if len(corpus) == 0:
+        st.error("No valid dates found in the dataset. Please check your data.")
+    else:
+        # Extract valid min and max dates and convert them to Python datetime
+        dates = corpus.values("Date")
+        min_date = pd.Timestamp(dates.min()).to_pydatetime()
+        max_date = pd.Timestamp(dates.max()).to_pydatetime()
+
+        # Debugging: Ensure min_date and max_date are valid
+        if min_date is None or max_date is None:
+            st.error("Date range could not be determined due to invalid data.")
+        else:
+            # Show a multiselect widget with the entities
+            entities = st.multiselect(
+                "Entities",
+                entity_column.unique(),
+                entity_column.value_counts().head(5).index.tolist(),
+            )
+
+            # Configure the slider with valid datetime objects
+            try:
+                date_range = st.slider(
+                    "Date Range",
+                    min_date,
+                    max_date,
+                    (min_date, min_date + pd.Timedelta(days=365 * 2).to_pytimedelta()),  # Default 2-year span
+                    format="YYYY-MM-DD",
+                )
+            except Exception as e:
+                st.error(f"Error setting up the slider: {e}")
+                st.stop()
+
+            # Count occurrences of each entity per week within the selected dates
+            df_reshaped = analytics.entity_weekly_counts(corpus, entities, date_range[0], date_range[1])
+
+            # Prepare the filtered data for charting
+            df_chart = pd.melt(
+                df_reshaped.reset_index(), id_vars="Week", var_name="Entity", value_name="Count"
+            )
+            chart = (
+                alt.Chart(df_chart)
+                .mark_line()
+                .encode(
+                    x=alt.X("Week:T", title="Week"),
+                    y=alt.Y("Count:Q", title="Count"),
+                    color="Entity:N",
+                )
+                .properties(height=320)
+            )
+
+            # Display the filtered data as a chart
+            with tracing.span("chart", chart="entity_weekly"):
+                st.altair_chart(chart, use_container_width=True)
+
+            # Display the filtered data as a table below the chart
+            st.dataframe(
+                df_reshaped,
+                use_container_width=True,
+            )
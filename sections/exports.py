@@ -0,0 +1,36 @@
+"""Download buttons whose files are only built when they are clicked.
+
+A download button used to be filled with ``to_csv(...)`` on every rerun, so
+every widget change serialized the whole selection even when nobody
+downloaded it. :func:`download_buttons` passes Streamlit a callable instead,
+which runs on click, and caches the bytes by selection key and data version so
+repeated downloads of the same selection, from any session, are free.
+"""
+
+import streamlit as st
+
+from llm_trends import exports
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _export(key, fmt, _build):
+    # Only ``key`` and ``fmt`` are hashed; ``_build`` materializes the table for that key
+    return exports.to_bytes(_build(), fmt)
+
+
+def download_buttons(label, build, key, file_name):
+    """One download button per export format for the table returned by ``build()``.
+
+    ``key`` must identify the selection, including the corpus version it was
+    taken from; ``file_name`` is the CSV file name. Buttons read "<label> as <format>".
+    """
+    columns = st.columns(len(exports.FORMATS))
+    for column, fmt in zip(columns, exports.FORMATS):
+        with column:
+            st.download_button(
+                label=f"{label} as {fmt}",
+                data=lambda fmt=fmt: _export(key, fmt, build),
+                file_name=exports.file_name(file_name, fmt),
+                mime=exports.FORMATS[fmt][1],
+                key=f"download-{fmt}-{file_name}",
+            )
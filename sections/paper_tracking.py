@@ -0,0 +1,163 @@
+import datetime
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from llm_trends import analytics, tracing
+from sections.data import get_encoder, get_papers
+from sections.exports import download_buttons
+
+
+def tracked_rows(corpus):
+    """Rows with a valid date, without duplicates among Human Readable Topics."""
+    dated_rows = np.flatnonzero(pd.notna(corpus.values("update_date")))
+    return corpus.distinct_rows(["title", "Human_Readable_Topic"], dated_rows)
+
+
+def render():
+    st.title("Paper Tracking")
+    st.write(
+        """
+       In the Paper Tracking Section, you can explore research papers related to the LLM domain by searching for specific titles and viewing detailed information like authors, abstracts, categories, and publication dates. Visualize weekly publication trends with interactive charts, filter papers by date ranges, and discover semantically similar papers based on embeddings. Finally, download a customized CSV summary of your selected topic for further analysis or sharing.
+        """
+    )
+
+    # Load the shared dataset and the rows this section works on (computed once per corpus)
+    corpus = get_papers()
+    rows = corpus.memoize("paper_tracking_rows", lambda: tracked_rows(corpus))
+    titles = corpus.memoize("paper_tracking_titles", lambda: [""] + corpus.values("title", rows).tolist())
+
+    # Check if the dataset is empty after cleaning
+    if len(rows) == 0:
+        st.error("No valid dates found in the dataset. Please check your data.")
+    else:
+        # Extract valid min and max dates and convert them to Python datetime
+        dates = corpus.values("update_date", rows)
+        min_date = pd.Timestamp(dates.min()).to_pydatetime()
+        max_date = pd.Timestamp(dates.max()).to_pydatetime()
+
+        # Debugging: Ensure min_date and max_date are valid
+        if min_date is None or max_date is None:
+            st.error("Date range could not be determined due to invalid data.")
+        else:
+            # Dropdown Selection Box
+            st.write("Select a paper title from the dropdown to view its details, or start typing your query.")
+
+            # Add an empty option to enable typing
+            selected_title = st.selectbox(
+                "Search or Select a Paper Title:", 
+                titles, 
+                index=0, 
+                help="Click and type your own query."
+            )
+
+            # Display the selected paper's information
+            if selected_title:
+                # Check if the title exists in the dataset
+                selected_rows = corpus.rows_where(rows, title=selected_title)
+                if len(selected_rows) > 0:
+                    # Retrieve the row corresponding to the selected title
+                    paper_details = corpus.take(selected_rows[:1]).iloc[0]
+
+                    # Display details
+                    st.subheader("Paper Details")
+                    st.markdown(f"**Title:** {paper_details['title']}")
+                    st.markdown(f"**Authors:** {paper_details['submitter']}")
+                    st.markdown(f"**Abstract:** {paper_details['abstract']}")
+                    st.markdown(f"**Categories:** {paper_details['Categories']}")
+                    st.markdown(f"**Human Readable Topic:** {paper_details['Human_Readable_Topic']}")
+                    st.markdown(f"**Subdomain:** {paper_details['Subdomain']}")
+                    st.markdown(f"**Publication Date:** {paper_details['update_date']}")
+                    st.markdown(f"**URL:** [Access Paper]({paper_details['id']})")
+
+                    # Filter papers with the same Human Readable Topic
+                    topic = paper_details['Human_Readable_Topic']
+                    topic_papers = corpus.take(
+                        corpus.rows_where(rows, Human_Readable_Topic=topic),
+                        ['title', 'id', 'abstract', 'submitter', 'Subdomain', 'Categories', 'update_date', 'week'],
+                    )
+
+                    # Set the adjusted date range to show the last half year
+                    adjusted_min_date = max_date - datetime.timedelta(days=180)
+
+                    # Shared sentence-transformer, batching encodes across sessions
+                    model = get_encoder()
+
+                    # Closeness between the selected paper and all other papers in the topic, encoded in one batch
+                    topic_papers['closeness'] = analytics.abstract_closeness(
+                        model, paper_details['abstract'], topic_papers['abstract']
+                    )
+
+                    # Configure the slider with the full date range but focus on the last half year
+                    st.write("Select a date range to filter the data:")
+                    try:
+                        date_range = st.slider(
+                            "Date Range",
+                            min_date,
+                            max_date,
+                            (adjusted_min_date, max_date),
+                            format="YYYY-MM-DD",
+                        )
+                    except Exception as e:
+                        st.error(f"Error setting up the slider: {e}")
+                        st.stop()
+
+                    # Filter the dataframe based on user inputs
+                    topic_papers = topic_papers[topic_papers["update_date"].between(date_range[0], date_range[1])]
+
+                    # Prepare data for row-based Y-axis
+                    topic_papers['jitter'] = topic_papers.groupby('week').cumcount() * 0.1  # Add jitter to prevent overlap
+                    topic_papers['row'] = topic_papers.groupby('week').cumcount() + 1 + topic_papers['jitter']
+
+                    # Weekly interactive visualization with adjusted Y-axis and bubble size
+                    st.title("Weekly Paper Distribution for Selected Topic")
+                    st.write(f"Below is a weekly distribution of papers for the topic: **{topic}**, with dynamically adjusted rows and bubble sizes representing semantic closeness.")
+
+                    st.markdown("""The size of the bubbles reflects the **semantic closeness** of the paper abstracts. Larger bubbles indicate papers that are more semantically similar to the selected paper, based on cosine similarity of their embeddings.""")
+
+                    # Prepare data for the interactive chart
+                    interactive_data = topic_papers[['week', 'title', 'row', 'closeness', 'submitter', 'Categories', 'abstract']]
+
+                    interactive_chart = alt.Chart(interactive_data).mark_circle().encode(
+                        x=alt.X("week:T", title="Week", axis=alt.Axis(labelAngle=-45, titleFontSize=12, labelFontSize=10)),
+                        y=alt.Y("row:Q", 
+                                title="Papers", 
+                                axis=alt.Axis(titleFontSize=12, 
+                                            labelFontSize=10, 
+                                            tickMinStep=1),  # Ensures the axis ticks increment by 1
+                                scale=alt.Scale(domain=(1, interactive_data['row'].max() + 1))
+                            ),
+                        size=alt.Size("closeness:Q", title="Semantic Closeness", scale=alt.Scale(range=[50, 500])),
+                        color=alt.Color("closeness:Q", title="Semantic Closeness", scale=alt.Scale(scheme='blues')),
+                        tooltip=["title", "week", "closeness", "submitter",  "abstract", "Categories"]
+                    ).properties(
+                        width=900,
+                        height=600,
+                        title=alt.TitleParams(f"Interactive Weekly Paper Distribution: {topic}", anchor='start', fontSize=18, subtitleFontSize=14)
+                    ).configure_view(
+                        strokeWidth=0
+                    ).interactive() 
+
+                    with tracing.span("chart", chart="paper_weekly"):
+                        st.altair_chart(interactive_chart, use_container_width=True)
+
+                    # Add a downloadable summary of papers
+                    st.write("### Papers Summary for Selected Topic")
+                    st.dataframe(topic_papers[['title', 'id', 'submitter', 'Subdomain', 'Categories', 'update_date']],column_config={"id":st.column_config.LinkColumn()})
+
+
+                    # Download buttons for papers summary, serialized on click
+                    summary = topic_papers[['title', 'id', 'submitter', 'abstract', 'Categories', 'update_date']]
+                    download_buttons(
+                        "Papers Summary",
+                        lambda: summary,
+                        key=("paper_tracking", corpus.version, topic, date_range),
+                        file_name=f"papers_summary_{topic}.csv",
+                    )
+
+                else:
+                    st.warning("The entered query does not match any paper title in the dataset. Please select an existing paper title or ensure your query is correct.")
+            else:
+                st.info("Please select a paper from the dropdown above or type your query.")
@@ -0,0 +1,186 @@
+import altair as alt
+import streamlit as st
+
+from llm_trends import analytics, tracing
+from llm_trends.timeseries import RESOLUTIONS
+from sections.data import get_llm_domain
+
+# Axis ticks and tooltip date format of each resolution
+DATE_FORMATS = {
+    "day": ("month", "%b %d, %Y"),
+    "week": ("month", "%b %d, %Y"),
+    "month": ("year", "%b %Y"),
+    "quarter": ("year", "%b %Y"),
+}
+
+
+def render():
+    # Introduction
+    st.write(
+        """
+        Large Language Models (LLMs) have emerged as one of the most dynamic and transformative fields in 
+        artificial intelligence, reshaping industries and academic landscapes alike.
+        """
+    )
+
+    # Context and Significance
+    st.subheader("The Rise of LLM-based Research")
+    st.write(
+        """
+        On November 30, 2022, OpenAI launched ChatGPT, a closed-source LLM as an 
+        interactive web-based application. In just two years, millions of users have adopted this tool for a 
+        wide array of tasks, including generating creative content, summarizing articles or essays, coding, language translations,
+        or conducting data analysis.
+        The immense popularity and impact of ChatGPT have spurred a wave of interest in LLMs across 
+        academic and professional domains, prompting studies on both theoretical underpinnings 
+        and practical applications of this technology.
+        """
+    )
+
+    # ArXiv Overview
+    st.subheader("LLM-based Research on ArXiv Corpus")
+    st.write(
+        """
+        Since ChatGPT's release, **537,482 papers** have been published on ArXiv domain, reflecting the 
+        rapid growth of scholarly contributions across mutitple disciplines. For those unfamiliar, ArXiv 
+        is an open-access archive hosting nearly **2.4 million scholarly articles** spanning fields such as: 
+        Physics, Mathematics, Computer Science, Quantitative Biology, Quantitative Finance, Statistics, Electrical Engineering, Systems Science, Economics.
+
+        """
+    )
+
+    # Per-period research articles
+    heading = st.empty()
+    # Counts per day, week, month and quarter are precomputed once per data version
+    llm_domain = get_llm_domain()
+    pyramid = llm_domain.time_pyramid("update_date")
+    first, last = pyramid.span()
+    if first is None:
+        heading.markdown("### Number of Published LLM-related Articles on ArXiv per Week")
+        st.info("No dated articles in the dataset.")
+        return
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        date_range = st.slider(
+            "Date Range",
+            first.to_pydatetime(),
+            last.to_pydatetime(),
+            (first.to_pydatetime(), last.to_pydatetime()),
+            format="YYYY-MM-DD",
+        )
+    with col2:
+        # The finest resolution that keeps the chart within its point budget, or any coarser one
+        finest = pyramid.resolution_for(*date_range)
+        resolution = st.selectbox("Resolution", list(RESOLUTIONS)[list(RESOLUTIONS).index(finest):], format_func=str.title)
+    heading.markdown(f"### Number of Published LLM-related Articles on ArXiv per {resolution.title()}")
+    _, articles_per_period = analytics.articles_per_period(llm_domain, *date_range, resolution=resolution)
+
+    # Altair plot to display the number of published articles per period
+    tick_count, date_format = DATE_FORMATS[resolution]
+    chart = (
+        alt.Chart(articles_per_period)
+        .mark_line(point=alt.OverlayMarkDef(filled=True, size=50))  # Adds points to the line
+        .encode(
+            x=alt.X(
+                "period:T",
+                title=resolution.title(),
+                axis=alt.Axis(format="%b %Y", tickCount=tick_count),  # Format as 'Month Year'
+            ),
+            y=alt.Y("num_articles:Q", title="Number of Articles"),
+            tooltip=[
+                alt.Tooltip("period:T", title=resolution.title(), format=date_format),
+                alt.Tooltip("num_articles:Q", title="Number of Articles"),
+            ]
+        )
+        .properties(
+            height=400,
+            width=800
+        )
+        .interactive()  # Enables zooming and panning
+    )
+
+
+    # Display the chart in the Streamlit app
+    with tracing.span("chart", chart="weekly_papers"):
+        st.altair_chart(chart, use_container_width=True)
+
+
+    # # Datamapplot
+    # # Step 1: Load Local Data with Caching
+    # @st.cache_data
+    # def load_coordinates_data():
+    #     df = pd.read_csv("data/Datamap/Concatenated_LLM_Subdomains_embeddings.csv")
+    #     if isinstance(df['2d_coords'].iloc[0], str):
+    #         df['2d_coords'] = df['2d_coords'].apply(eval)
+    #     return df
+
+    # df = load_coordinates_data()
+
+    # # Extract coordinates and labels
+    # coords_array = np.array(df['2d_coords'].tolist())
+    # labels_array = df['Human_Readable_Topic'].to_numpy()
+
+    # # Prepare hover data
+    # hover_data = df['title'].tolist() if 'title' in df.columns else [f"Topic {i}" for i in range(len(df))]
+
+    # # Step 2: Generate the Interactive Plot
+    # plot = dmp.create_interactive_plot(
+    #     coords_array,
+    #     labels_array,
+    #     hover_text=hover_data,
+    #     font_family="Playfair Display SC",
+    #     title="Discover Data Landscape",
+    #     sub_title="A data map based on the LLM-related research.",
+    #     logo="https://upload.wikimedia.org/wikipedia/commons/thumb/b/bc/ArXiv_logo_2022.svg/512px-ArXiv_logo_2022.svg.png",
+    #     logo_width=180,
+    #     on_click="window.open(`http://google.com/search?q=\"{hover_text}\"`)",
+    #     enable_search=True,
+    #     darkmode=True,
+    # )
+
+    # # Step 3: Streamlit App
+    # st.title(" Data Landscape")
+    # st.subheader("A data map based on LLM-related research papers.")
+
+    # # Render the plot in Streamlit
+    # try:
+    #     # Check if the plot object has `to_html` method for rendering
+    #     if hasattr(plot, 'to_html'):
+    #         st.components.v1.html(plot.to_html(), height=800, scrolling=True)
+    #     else:
+    #         # Save the plot to an HTML file and render
+    #         plot.save("custom_plot.html")
+    #         with open("custom_plot.html", "r") as f:
+    #             html_content = f.read()
+    #         st.components.v1.html(html_content, height=800, scrolling=True)
+    # except Exception as e:
+    #     st.error(f"Unable to render the plot. Error: {e}")
+    # # Load Data
+    # @st.cache_data
+    # def load_coordinates_data():
+    #     df = pd.read_csv("data/Datamap/Concatenated_LLM_Subdomains_embeddings.csv")
+    #     df['2d_coords'] = df['2d_coords'].apply(eval) if isinstance(df['2d_coords'].iloc[0], str) else df['2d_coords']
+    #     return df
+
+    # df = load_coordinates_data()
+    # coords_array = np.array(df['2d_coords'].tolist())
+    # labels_array = df['Subdomain'].to_numpy()
+
+    # # Create Plot
+    # plot = dmp.create_plot(
+    # coords_array,
+    # labels_array,
+    # label_over_points=True,
+    # dynamic_label_size=True,
+    # color_label_text=False,
+    # darkmode=True,
+    # )
+
+    # # Render in Streamlit
+    # st.title("Data Landscape")
+    # st.subheader("A data map based on LLM-related research papers.")
+    # try:
+    #     st.components.v1.html(plot.to_html() if hasattr(plot, 'to_html') else open("custom_plot.html", "r").read(), height=800, scrolling=True)
+    # except Exception as e:
+    #     st.error(f"Error rendering plot: {e}")
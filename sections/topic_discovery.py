@@ -0,0 +1,256 @@
+import io
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import together
+import toml
+
+from llm_trends import analytics, documents, tracing
+from sections.data import get_domains, get_encoder
+from sections.exports import download_buttons
+
+
+# Initialize Together AI client
+@st.cache_resource
+def get_client():
+    secrets_path = "secrets.toml"
+    secrets = toml.load(secrets_path)
+    api_key = secrets["LLM_API_KEY"]["key"]
+    return together.Client(api_key=api_key)
+
+
+# Topic embeddings, loaded once per process
+@st.cache_resource
+def load_topic_with_embeddings():
+    return analytics.load_topic_embeddings()
+
+
+# PDF text extraction, once per uploaded file
+@st.cache_data(max_entries=8, show_spinner=False)
+def extract_text_from_pdf(data):
+    return documents.extract_text(io.BytesIO(data))
+
+
+# Title and Abstract extraction
+def extract_title_and_abstract(text):
+    title = text.split('.')[0]  # First sentence
+    start_idx = text.lower().find("abstract")
+    end_idx = text.lower().find("introduction")
+    abstract = text[start_idx + len("abstract"):end_idx].strip() if start_idx != -1 and end_idx != -1 else "Abstract not found."
+    return title.strip(), abstract.strip()
+
+
+# Topic extraction using Together AI
+def extract_topics(title, abstract):
+    prompt = f"""
+    Based on the provided Title and Abstract of a research paper, extract a list of all the topics that might be necessary to conduct such research. 
+    The output should be limited to a maximum of 10 topics.
+
+    Title: {title}
+
+    Abstract: {abstract}
+
+    Provide the output in the format:
+    Topics: [List of topics]
+    """
+    response = ""
+    try:
+        with tracing.span("llm.chat", model="meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo"):
+            stream = get_client().chat.completions.create(
+                model="meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo",
+                messages=[{"role": "user", "content": prompt}],
+                stream=True,
+                temperature=0.1,
+            )
+            for chunk in stream:
+                response += chunk.choices[0].delta.content or ""
+    except Exception as e:
+        st.error(f"Error during topic extraction: {e}")
+        return None
+    return response.strip()
+
+
+# Embedding computation
+def compute_embeddings(topics):
+    return get_encoder().encode(topics, convert_to_numpy=True)
+
+
+# Find most similar topics
+def find_most_similar_topics(llm_topics, dataset, top_n=5):
+    topics, topic_embeddings = dataset
+    return analytics.similar_topics(compute_embeddings(llm_topics), topics, topic_embeddings, top_n)
+
+
+# Filter and display table logic
+def filter_and_display_domains(filtered_domains, selected_topic=None):
+    # Remove duplicates based on the 'id' column
+    filtered_domains = filtered_domains.drop_duplicates(subset='id')
+    if selected_topic:
+        filtered_domains = filtered_domains[filtered_domains['Human_Readable_Topic'] == selected_topic]
+    return filtered_domains
+
+
+# Rows of the matched topics' papers, one per paper. Row ids are positions in one data version, so
+# they are kept with that version and recomputed from the matched topics after a new one is swapped in
+def matched_rows(corpus):
+    if st.session_state.get("filtered_rows_version") != corpus.version:
+        if "document_scores" in st.session_state:
+            rows, _ = documents.related_rows(corpus, st.session_state.document_scores)
+            # Sorted, like every other row selection; the table is ordered by score when displayed
+            rows = np.sort(rows)
+        else:
+            rows = corpus.distinct_rows('id', corpus.rows_where(Human_Readable_Topic=st.session_state.top_5_topics))
+        st.session_state.filtered_rows = rows
+        st.session_state.filtered_rows_version = corpus.version
+    return st.session_state.filtered_rows
+
+
+def render():
+    # Streamlit UI with Emojis for Better User Experience
+    st.title("🔍 Provide Input, Extract Topics, and Discover Related Research Papers")
+    st.write("Easily extract the topic of your research, find similar topics, and explore research papers related to those topics!")
+
+    # Input selection with Emojis
+    option = st.radio(
+        "📄 **Choose Input Method**:",
+        ("Upload PDF", "Fill out Form")
+    )
+    mode = st.radio(
+        "🧭 **Choose Matching Method**:",
+        ("LLM topic extraction", "Whole document (offline)"),
+        help="The offline method compares every passage of the document with the topics, without calling the LLM.",
+    )
+    if mode == "Whole document (offline)":
+        aggregation = st.radio(
+            "📐 **Score topics by**:",
+            documents.AGGREGATIONS,
+            format_func=lambda value: {"max": "Best passage", "mean": "Average over passages"}[value],
+            horizontal=True,
+        )
+
+    text = ""
+    user_title = user_abstract = ""
+    if option == "Upload PDF":
+        uploaded_file = st.file_uploader("📄 Upload your PDF file:", type="pdf")
+        if uploaded_file is not None:
+            with st.spinner("🔄 Extracting text from PDF..."):
+                text = extract_text_from_pdf(uploaded_file.getvalue())
+            st.success("✅ Text extracted successfully!")
+            title, abstract = extract_title_and_abstract(text)
+            user_title = st.text_area("📝 **Title** (Edit if needed):", value=title, height=100)
+            user_abstract = st.text_area("📋 **Abstract** (Edit if needed):", value=abstract, height=300)
+
+    elif option == "Fill out Form":
+        user_title = st.text_input("📝 **Enter Title**:")
+        user_abstract = st.text_area("📋 **Enter Abstract**:")
+
+    # Whole-document matching: every chunk of the text scored against every topic
+    if mode == "Whole document (offline)":
+        if st.button("📊 **Match Whole Document**"):
+            document = text or f"{user_title}\n{user_abstract}"
+            if document.strip():
+                topics, topic_embeddings = load_topic_with_embeddings()
+                with st.spinner("🔍 Comparing the document with every topic..."):
+                    scores, chunks = documents.match_document(get_encoder(), document, topics, topic_embeddings, aggregation)
+                st.session_state.pop("llm_topics", None)
+                st.session_state.document_scores = scores.assign(Passage=[chunks[i] for i in scores["Best_Chunk"]])
+                st.session_state.document_aggregation = aggregation
+                st.session_state.top_5_topics = scores["Human_Readable_Topic"].tolist()
+                st.session_state.pop("filtered_rows_version", None)
+                matched_rows(get_domains())
+
+    # Topic extraction button
+    elif st.button("📊 **Extract Potential Topics**"):
+        if user_title and user_abstract:
+            st.session_state.pop("document_scores", None)
+            with st.spinner("🔄 Analyzing content..."):
+                analysis = extract_topics(user_title, user_abstract)
+                llm_topics = [topic.strip() for topic in analysis.split('- Topics: ')[-1].split(',')]
+                st.session_state.llm_topics = llm_topics
+
+            st.success("✅ Topics extracted successfully!")
+
+    
+            # Load datasets
+            topic_embeddings_dataset = load_topic_with_embeddings()
+            llm_related_domains = get_domains()
+
+            # Find top 5 topics
+            with st.spinner("🔍 Finding similar topics..."):
+                top_5_topics = find_most_similar_topics(llm_topics, topic_embeddings_dataset)
+                st.session_state.top_5_topics = top_5_topics
+
+    
+
+            # Filter dataset based on the top 5 topics; the session only keeps row ids, deduplicated by 'id'
+            st.session_state.pop("filtered_rows_version", None)
+            matched_rows(llm_related_domains)
+    # # Ensure E
+    # Ensure Extracted Topics and Top 5 Closest Topics persist during the session
+    if "llm_topics" in st.session_state:
+        st.write("### 🗂️ **Extracted Topics**")
+        st.text("\n".join(st.session_state.llm_topics))  # Display original output as plain text
+
+        # st.table(pd.DataFrame({"Extracted Topics": st.session_state.llm_topics}))
+        # Ensure Extracted Topics and Top 5 Closest Topics persist during the session
+
+
+    if "document_scores" in st.session_state:
+        st.write("### 📌 **Top 5 Closest Human-Readable Topics**")
+        st.dataframe(
+            st.session_state.document_scores[["Human_Readable_Topic", "Score", "Chunks", "Passage"]],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Score": st.column_config.ProgressColumn(format="%.3f", min_value=0.0, max_value=1.0),
+                "Chunks": st.column_config.NumberColumn(help="Passages for which this is the closest topic"),
+                "Passage": st.column_config.TextColumn("Closest passage", width="large"),
+            },
+        )
+    elif "top_5_topics" in st.session_state:
+        st.write("### 📌 **Top 5 Closest Human-Readable Topics**")
+        st.table(pd.DataFrame({"Human_Readable_Topic": st.session_state.top_5_topics}))
+
+    # Table filtering and visualization
+    if "filtered_rows" in st.session_state:
+        st.write("### 🔍 **Discover All Research Papers for the Topic**")
+        llm_related_domains = get_domains()
+        filtered_rows = matched_rows(llm_related_domains)
+        unique_topics = llm_related_domains.unique('Human_Readable_Topic', filtered_rows)
+        selected_topic = st.selectbox("📂 **Choose the Topic!**:", options=["All"] + list(unique_topics))
+
+        # Only the matched row ids persist in the session; the table is rebuilt from them on every rerun
+        if selected_topic == "All":
+            displayed_rows = filtered_rows
+            csv_file_name = "filtered_llm_related_domains.csv"
+        else:
+            displayed_rows = llm_related_domains.rows_where(filtered_rows, Human_Readable_Topic=selected_topic)
+            csv_file_name = f"filtered_domains_{selected_topic.replace(' ', '_').replace('/', '_')}.csv"
+
+        displayed = llm_related_domains.take(displayed_rows, llm_related_domains.source_columns)
+        if "document_scores" in st.session_state:
+            # Papers of the best-matching topics first
+            scores = st.session_state.document_scores.set_index("Human_Readable_Topic")["Score"]
+            displayed.insert(0, "Score", displayed["Human_Readable_Topic"].map(scores).astype(float).round(3))
+            displayed = displayed.sort_values("Score", ascending=False, kind="stable")
+
+        # Exports are cached across sessions, so the key names everything the table depends on
+        if "document_scores" in st.session_state:
+            scored = st.session_state.document_scores[["Human_Readable_Topic", "Score"]]
+            matching = ("document", st.session_state.document_aggregation,
+                        tuple(pd.util.hash_pandas_object(scored, index=False).tolist()))
+        else:
+            matching = ("llm",)
+
+        # Display the table
+        st.dataframe(displayed, use_container_width=True, column_config={"id":st.column_config.LinkColumn()})
+
+
+        # Download buttons, serialized on click
+        download_buttons(
+            "📥 **Download Filtered Table**",
+            lambda: displayed,
+            key=("topic_discovery", llm_related_domains.version, matching, tuple(st.session_state.top_5_topics), selected_topic),
+            file_name=csv_file_name,
+        )
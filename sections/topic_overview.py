@@ -0,0 +1,144 @@
+import plotly.express as px
+import streamlit as st
+
+from llm_trends import tracing
+from sections.data import get_domains
+from sections.exports import download_buttons
+
+HIERARCHY = ["Categories", "Subdomain", "Human_Readable_Topic"]
+
+
+def render():
+    corpus = get_domains()
+
+    # Ensure necessary columns exist
+    if set(HIERARCHY).issubset(corpus.columns):
+        st.write("### Hierarchical Topic Knowledge of LLM-Related Research Domain")
+
+        # Available categories
+        available_categories = corpus.unique("Categories")
+
+        # Create category selector
+        selected_category = st.radio(
+            "Select Domain", options=available_categories, horizontal=True
+        )
+
+        # Paper counts per topic path, shared by every session
+        tree = corpus.count_tree(HIERARCHY)
+
+        # Filter data by selected category
+        rows = corpus.rows_where(Categories=selected_category)
+
+        if len(rows) == 0:
+            st.warning(f"No data available for the selected category: {selected_category}.")
+        else:
+            # Calculate the value column for Sunburst
+            value_df = tree.leaves(Categories=selected_category).rename(columns={"Count": "Value"})
+
+            # Create Sunburst chart
+            fig = px.sunburst(
+                value_df,
+                path=["Categories", "Subdomain", "Human_Readable_Topic"],
+                values="Value",
+                width=800,
+                height=800,
+            )
+            with tracing.span("chart", chart="sunburst"):
+                st.plotly_chart(fig, use_container_width=True)
+
+            # Add dropdowns for manual filtering
+            st.write("### Select Subdomain and Topic for more Details")
+            subdomains = corpus.hierarchy().children("Subdomain", Categories=selected_category)
+            selected_subdomain = st.selectbox("Select Subdomain", options=["All"] + subdomains)
+
+            path = {"Categories": selected_category}
+            if selected_subdomain != "All":
+                path["Subdomain"] = selected_subdomain
+                rows = corpus.rows_where(rows, Subdomain=selected_subdomain)
+
+                topics = corpus.hierarchy().children(
+                    "Human_Readable_Topic", Categories=selected_category, Subdomain=selected_subdomain
+                )
+                selected_topic = st.selectbox("Select Topic", options=["All"] + topics)
+
+                if selected_topic != "All":
+                    path["Human_Readable_Topic"] = selected_topic
+                    rows = corpus.rows_where(rows, Human_Readable_Topic=selected_topic)
+
+            # Monthly trends section
+            st.markdown("### Monthly Trends for Selected Topic Details")
+            if selected_subdomain != "All":
+                st.write(f"Showing trends for Subdomain: {selected_subdomain}")
+            if "selected_topic" in locals() and selected_topic != "All":
+                st.write(f"Showing trends for Topic: {selected_topic}")
+            else:
+                st.write("Showing overall trends for Category.")
+
+            # Counts and monthly sparklines of the selected paths, read from the tree
+            df_grouped = tree.leaves(**path)
+            df_grouped["Monthly Trend"] = tree.trends(**path)
+
+            st.dataframe(
+                df_grouped,
+                use_container_width=True,
+                column_config={"Monthly Trend": st.column_config.LineChartColumn("Monthly Trend")},
+            )
+
+                    # Prepare export data
+            st.markdown("### Export the Paper Details in CSV")
+            export_data = corpus.take(
+                rows,
+                [
+                    "title",
+                    "id",
+                    "abstract",
+                    "Human_Readable_Topic",
+                    "Categories",
+                    "Subdomain",
+                    "submitter",
+                    "update_date",
+                ],
+            )
+            st.dataframe(export_data, use_container_width=True, column_config={"id":st.column_config.LinkColumn()})
+
+            # Dynamically construct the file name
+            domain_part = selected_category.replace(" ", "_")  # Replace spaces with underscores
+            subdomain_part = selected_subdomain.replace(" ", "_") if selected_subdomain != "All" else "All_Subdomains"
+            dynamic_file_name = f"research_paper_details_{domain_part}_{subdomain_part}.csv"
+
+            # Allow download of the paper details, serialized on click
+            download_buttons(
+                "Download Paper Details",
+                lambda: export_data,
+                key=("topic_overview", corpus.version, tuple(path.items())),
+                file_name=dynamic_file_name,
+            )
+    else:
+        st.error("The required columns ('Categories', 'Subdomain', 'Human_Readable_Topic') are missing in the dataset.")
+        # Descriptions Section
+    st.write(
+        """
+        The "LLM-related research domain" encompasses a diverse range of concepts, frameworks, methodologies, and technologies centered on developing and applying LLMs. Below are the key categories that define this domain:
+
+        #### 1. Core Models and Architectures
+        Focus on designing the foundational structures of LLMs, including Transformer-based architectures, attention mechanisms, and scaling laws. Emphasize the theoretical and practical underpinnings that define a model’s capability.
+
+        #### 2. Learning Paradigms
+        Define methodologies that enable LLMs to adapt and generalize across tasks, such as few-shot, zero-shot, fine-tuning, and RLHF. Highlight approaches for improving task-specific performance without major architectural changes.
+
+        #### 3. Optimization Techniques
+        Explore strategies to enhance computational efficiency, scalability, and resource-friendliness, including quantization, pruning, and lightweight architectures (e.g., DistilBERT). Focus on making existing models more practical for deployment.
+
+        #### 4. Applications and Use Cases
+        Showcase real-world deployments of LLMs in tasks like conversational AI, Retrieval-Augmented Generation, and domain-specific automation. Emphasize the impact of LLMs across industries like healthcare, finance, and education.
+
+        #### 5. Societal Impacts and Ethics
+        Examine the societal implications of LLM deployment, including addressing issues of bias, fairness, transparency, and equitable access. Advocate for responsible and inclusive AI development practices.
+
+        #### 6. Infrastructure and Tools
+        Delve into the technical backbone that supports LLMs, such as APIs, libraries, deployment frameworks, and interoperability solutions. Ensure this category focuses on enabling efficient development and seamless integration of LLM systems.
+
+        #### 7. Evaluation and Benchmarks
+        Center on the frameworks, datasets, and metrics (e.g., GLUE, BLEU, BERTScore) that quantitatively assess model performance, robustness, fairness, and usability. Highlight the role of evaluation in driving iterative improvements.
+        """
+    )
@@ -0,0 +1,250 @@
+import altair as alt
+import streamlit as st
+
+from llm_trends import analytics, tracing
+from llm_trends.datamap import datamap_html
+from llm_trends.exports import paper_export
+from llm_trends.projection import load_drift_report
+from sections.data import get_papers
+from sections.exports import download_buttons
+
+
+def render():
+    # Load the shared, read-only corpus
+    corpus = get_papers()
+
+    # Ensure the necessary columns exist in the dataset
+    if {"Categories", "Subdomain", "Human_Readable_Topic"}.issubset(corpus.columns):
+        # List of available categories (domains)
+        available_categories = corpus.unique("Categories")
+
+        # Create columns layout for domain (Categories) and subdomain (Subdomain) selection
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### Select LLM-related Domain/s")
+            selected_categories = []
+            for category in available_categories:
+                if st.checkbox(category, value=False, key=category):  # Default is not selected
+                    selected_categories.append(category)
+
+        with col2:
+            st.markdown("### Select Subdomain/s")
+            available_subdomains = corpus.hierarchy().children("Subdomain", Categories=selected_categories)
+            selected_subdomains = []
+            for subdomain in available_subdomains:
+                if st.checkbox(subdomain, value=False, key=subdomain):  # Default is not selected
+                    selected_subdomains.append(subdomain)
+
+        # Filter data based on the selected categories and subdomains, materializing only the plotted columns
+        category_rows = corpus.rows_where(Categories=selected_categories)
+        subdomain_rows = corpus.rows_where(category_rows, Subdomain=selected_subdomains)
+        plot_columns = [column for column in ["title", "2d_coords", "Human_Readable_Topic", "Month_Start"] if column in corpus.columns]
+        df_subdomain_filtered = corpus.take(subdomain_rows, plot_columns)
+
+        # Check if the filtered dataset is empty
+        if df_subdomain_filtered.empty:
+            st.warning(f"No data available for the selected domain(s): {', '.join(selected_categories)} and subdomain(s): {', '.join(selected_subdomains)}.")
+        else:
+            if "2d_coords" in df_subdomain_filtered.columns and "title" in df_subdomain_filtered.columns:
+                try:
+                    html_content = datamap_html(corpus, selected_categories, selected_subdomains)
+                    st.components.v1.html(html_content, height=800, scrolling=True)
+                except Exception as e:
+                    st.error(f"Unable to render the plot. Error: {e}")
+
+                # New papers are interpolated onto the existing layout; flag when it has drifted too far
+                drift_report = load_drift_report()
+                if drift_report and drift_report["relayout_recommended"]:
+                    st.info(
+                        f"{drift_report['new_points']} paper(s) were placed on this map incrementally "
+                        f"({drift_report['out_of_distribution_share']:.0%} of them far from any existing paper). "
+                        "A full re-layout of the datamap is recommended."
+                    )
+
+            # Step 3: Topic Trends Section
+            st.markdown(f"### Topic Trends for Subdomain(s): {', '.join(selected_subdomains)}")
+
+            # Count articles per topic per month, with the cumulative sum for each topic (from the time pyramid)
+            df_grouped = analytics.topic_monthly_counts(corpus, selected_categories, selected_subdomains)
+
+            # Get the total count for each topic to determine the top 10 topics
+            topic_totals = df_grouped.groupby("Human_Readable_Topic", observed=True)["Cumulative_Count"].max().reset_index()
+            top_topics = topic_totals.sort_values(by="Cumulative_Count", ascending=False)["Human_Readable_Topic"].head(1).tolist()
+
+            # Allow the user to toggle topics
+            topics = df_grouped["Human_Readable_Topic"].unique()
+            selected_topics = st.multiselect(
+                "Choose Topic/s",
+                options=topics,
+                default=top_topics,  # Default to the top topic
+            )
+
+            # Filter the grouped data based on selected topics
+            df_grouped_filtered = df_grouped[df_grouped["Human_Readable_Topic"].isin(selected_topics)]
+
+              # Add a select box for choosing the plot type
+            plot_type = st.selectbox(
+                "Select Plot Type",
+                options=["Monthly Trend", "Cumulative Trend", "Normalized Cumulative Trend", "Heatmap Trend"],
+                index=0,  # Default to the first option
+            )
+
+            
+
+            # Generate the appropriate chart based on user selection
+            if plot_type == "Monthly Trend":
+                base_chart = (
+                    alt.Chart(df_grouped_filtered)
+                    .mark_line()
+                    .encode(
+                        x=alt.X("Month_Start:T", title="Month Start"),
+                        y=alt.Y("Monthly_Count:Q", title="Monthly Count"),
+                        color=alt.Color(
+                            "Human_Readable_Topic:N",
+                            title="Topics",
+                            legend=alt.Legend(
+                                orient="right",  # Position the legend to the right of the chart
+                                titleFontSize=12,  # Increase title font size
+                                labelFontSize=10,  # Adjust label font size
+                                labelLimit=500,  # Prevent truncation of long labels
+                                direction="vertical",  # Ensure the legend is vertical
+                            ),
+                        ),
+                    )
+                )
+                with tracing.span("chart", chart="monthly_trend"):
+                    st.altair_chart(base_chart, use_container_width=True)
+
+            elif plot_type == "Cumulative Trend":
+                base_chart = (
+                    alt.Chart(df_grouped_filtered)
+                    .mark_line()
+                    .encode(
+                        x=alt.X("Month_Start:T", title="Month Start"),
+                        y=alt.Y("Cumulative_Count:Q", title="Cumulative Paper Count"),
+                        color=alt.Color(
+                            "Human_Readable_Topic:N",
+                            title="Topics",
+                            legend=alt.Legend(
+                                orient="right",  # Position the legend to the right of the chart
+                                titleFontSize=12,  # Increase title font size
+                                labelFontSize=10,  # Adjust label font size
+                                labelLimit=500,  # Prevent truncation of long labels
+                                direction="vertical",  # Ensure the legend is vertical
+                            ),
+                        ),
+                    )
+                )
+                with tracing.span("chart", chart="cumulative_trend"):
+                    st.altair_chart(base_chart, use_container_width=True)
+
+            elif plot_type == "Normalized Cumulative Trend":
+                if df_grouped_filtered.empty:
+                    st.warning("No data available for the selected topics. Please select at least one topic.")
+                else:
+                    # Calculate the total cumulative count for each topic
+                    topic_totals = df_grouped.groupby("Human_Readable_Topic", observed=True)["Cumulative_Count"].transform("max")
+
+                    # Normalize the cumulative count by dividing by the total count for each topic
+                    df_grouped_filtered["Normalized_Cumulative_Count"] = (
+                        df_grouped_filtered["Cumulative_Count"] / topic_totals
+                    )
+
+                    # Plot the normalized cumulative trend
+                    normalized_chart = (
+                        alt.Chart(df_grouped_filtered)
+                        .mark_line()
+                        .encode(
+                            x=alt.X("Month_Start:T", title="Month Start"),
+                            y=alt.Y("Normalized_Cumulative_Count:Q", title="Normalized Cumulative Paper Count"),
+                            color=alt.Color(
+                                "Human_Readable_Topic:N",
+                                title="Topics",
+                                legend=alt.Legend(
+                                    orient="right",
+                                    titleFontSize=12,
+                                    labelFontSize=10,
+                                    labelLimit=500,
+                                    direction="vertical",
+                                ),
+                            ),
+                        )
+                    )
+                    with tracing.span("chart", chart="normalized_trend"):
+                        st.altair_chart(normalized_chart, use_container_width=True)
+
+
+            elif plot_type == "Heatmap Trend":
+                if not df_grouped_filtered.empty:
+
+                    # Topics x months matrix of counts, with the months without papers filled in
+                    heatmap_data = analytics.topic_heatmap(df_grouped_filtered)
+
+                    # Create the Plotly heatmap
+                    import plotly.express as px
+
+                    fig = px.imshow(
+                        heatmap_data,
+                        labels=dict(x="Month Start", y="Topics", color="Monthly Count"),
+                        x=heatmap_data.columns.strftime('%b %Y'),  # Format months for display
+                        y=heatmap_data.index,
+                        color_continuous_scale="Blues"                    )
+
+                    # Update layout for better readability
+                    fig.update_layout(
+                        xaxis=dict(tickangle=-45),  # Rotate x-axis labels
+                        height=600,
+                        width=1000,
+                    )
+
+                    # Display the Plotly heatmap
+                    with tracing.span("chart", chart="heatmap"):
+                        st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.warning("No data available for the selected topics.")
+            # Display detailed insights
+            st.markdown("### Monthly Trends")
+            st.write(f"Showing monthly trends for topics under subdomain/s: {', '.join(selected_subdomains)}.")
+
+            
+
+            # Add a data table for granular details
+            st.dataframe(df_grouped_filtered, use_container_width=True)
+
+            # Filter the selected domains to include rows with selected topics
+            topic_rows = corpus.rows_where(category_rows, Human_Readable_Topic=selected_topics)
+            
+            # Dynamically update the markdown with selected topics
+            if selected_topics:
+                selected_topics_text = ", ".join(selected_topics)
+                st.markdown(f"### Export the Paper Details in the CSV file!")
+                st.write(f"Selected Topics: {selected_topics_text}")
+            else:
+                st.markdown("### Export the Paper Details in the CSV file!")
+                st.write("No topics have been selected.")
+            st.write(f"Export detailed information about research paper, including links, dates, titles, abstracts, topic label, categories, submitter, and monthly trends for topics under the subdomain/s: **{', '.join(selected_subdomains)}**.")
+
+            # Materialize the export columns for the selected rows, renamed to be more user-friendly
+            df_additional_info = paper_export(corpus, topic_rows)
+
+            # Display the filtered and renamed dataset
+            st.dataframe(df_additional_info, use_container_width=True, column_config={"URL": st.column_config.LinkColumn()})
+                        
+             # Generate a filename based on selected topics
+            if selected_topics:
+                # Create a shortened version of the topics for the filename
+                topics_for_filename = "_".join(selected_topics[:3])  # Use only the first 3 topics for brevity
+                if len(selected_topics) > 3:
+                    topics_for_filename += "_and_more"
+                file_name = f"research_papers_topics_{topics_for_filename}.csv"
+            else:
+                file_name = "topics_no_selection.csv"
+
+            # Provide download options; files are only written when a button is clicked
+            download_buttons(
+                "Download",
+                lambda: df_additional_info,
+                key=("topic_tracking", corpus.version, tuple(selected_categories), tuple(selected_subdomains), tuple(selected_topics)),
+                file_name=file_name,
+            )